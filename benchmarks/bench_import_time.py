@@ -0,0 +1,104 @@
+"""
+Benchmark: startup import cost of the tool adapters and of the core library.
+
+Runs ``python -X importtime`` in fresh interpreters (inside an empty temporary
+directory, so no database is touched) for three start-up profiles:
+
+* ``adapters``: what watsonx Orchestrate loads to register the ``@tool`` functions
+* ``adapters + core``: what every tool module loaded before the core split
+* ``core``: what batch jobs, the CLI and the tests load (no SDK needed)
+
+and reports the median total import time, the number of modules imported and
+whether the watsonx Orchestrate SDK was loaded.
+
+Usage:
+    python benchmarks/bench_import_time.py --runs 5
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TOOL_MODULES = [
+    "db_manager",
+    "db_manager_enhanced",
+    "db_retrieval",
+    "document_ingest",
+    "evaluation_tools",
+    "experience",
+    "facet_index",
+    "skill_matching",
+]
+
+PROFILES = {
+    "adapters": [f"tools.{name}" for name in TOOL_MODULES],
+    "adapters + core": [f"tools.{name}" for name in TOOL_MODULES]
+    + [f"tools.core.{name}" for name in TOOL_MODULES],
+    "core": [f"tools.core.{name}" for name in TOOL_MODULES],
+}
+
+SDK_PACKAGE = "ibm_watsonx_orchestrate"
+
+# "import time:       self [us] |  cumulative | imported package"
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(modules: List[str], workdir: str) -> Optional[Tuple[float, int, bool, Dict[str, int]]]:
+    """Import ``modules`` in a fresh interpreter; return ms, module count, SDK flag, top-level."""
+    env = dict(
+        os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(f"import {m}" for m in modules)],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return None
+    total_us, count, sdk = 0, 0, False
+    packages: Dict[str, int] = {}
+    for match in _LINE.finditer(proc.stderr):
+        self_us, cumulative_us, indent, name = match.groups()
+        total_us += int(self_us)
+        count += 1
+        sdk = sdk or name.startswith(SDK_PACKAGE)
+        if len(indent) == 1:  # imported directly by the command
+            packages[name] = int(cumulative_us)
+    return total_us / 1000, count, sdk, packages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per profile")
+    parser.add_argument("--top", type=int, default=5, help="heaviest top-level imports shown")
+    args = parser.parse_args()
+
+    print(f"{'profile':<18}{'median ms':>11}{'modules':>9}{'SDK':>6}  heaviest imports")
+    with tempfile.TemporaryDirectory() as workdir:
+        for profile, modules in PROFILES.items():
+            runs = [measure(modules, workdir) for _ in range(args.runs)]
+            if any(run is None for run in runs):
+                print(f"{profile:<18}{'skipped (import failed, is the SDK installed?)':>11}")
+                continue
+            median_ms = statistics.median(run[0] for run in runs)
+            _, count, sdk, packages = runs[-1]
+            heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+            top = ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in heaviest[: args.top])
+            print(f"{profile:<18}{median_ms:>11.1f}{count:>9}{'yes' if sdk else 'no':>6}  {top}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: read latency of the on-disk database vs. the in-memory snapshot.
+
+Populates a temporary recruitment database and times the queries issued by the
+retrieval tools (single-record lookups and full listings) through
+``read_connection`` with the snapshot disabled and enabled.
+
+Usage:
+    python benchmarks/bench_read_snapshot.py --candidates 2000 --iterations 500
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.db_connection import SNAPSHOT_ENV_VAR, read_connection  # noqa: E402
+
+
+def populate(db_path: str, candidates: int, bandos: int) -> None:
+    """Create the recruitment tables and fill them with synthetic rows."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE candidates (id TEXT PRIMARY KEY, candidate_name TEXT, email TEXT, "
+            "position_applied TEXT, technical_skills TEXT, experience_years TEXT, "
+            "consulting_experience TEXT, created_at TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE bando_di_gara (id TEXT PRIMARY KEY, client_name TEXT, "
+            "project_title TEXT, project_description TEXT, required_skills TEXT, created_at TEXT)"
+        )
+        skills = ["Python", "Java", "Kubernetes", "SQL", "AWS", "React", "SAP", "Terraform"]
+        conn.executemany(
+            "INSERT INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    str(i),
+                    f"Candidate {i}",
+                    f"candidate{i}@example.com",
+                    "Software Engineer",
+                    json.dumps(random.sample(skills, 4)),
+                    f"{random.randint(1, 20)} anni",
+                    "Consulting experience " * 20,
+                    f"2024-01-01T00:00:{i % 60:02d}",
+                )
+                for i in range(1, candidates + 1)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO bando_di_gara VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    str(i),
+                    f"Client {i}",
+                    f"Project {i}",
+                    "Project description " * 30,
+                    json.dumps(random.sample(skills, 3)),
+                    "2024-01-01T00:00:00",
+                )
+                for i in range(1, bandos + 1)
+            ),
+        )
+
+
+def time_calls(fn: Callable[[], object], iterations: int) -> List[float]:
+    """Run ``fn`` repeatedly and return per-call latencies in milliseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--bandos", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "recruitment.db")
+        populate(db_path, args.candidates, args.bandos)
+
+        def lookup() -> object:
+            candidate_id = str(random.randint(1, args.candidates))
+            bando_id = str(random.randint(1, args.bandos))
+            with read_connection(db_path) as conn:
+                conn.execute("SELECT * FROM candidates WHERE id = ?", (candidate_id,)).fetchone()
+                return conn.execute(
+                    "SELECT * FROM bando_di_gara WHERE id = ?", (bando_id,)
+                ).fetchone()
+
+        def listing() -> object:
+            with read_connection(db_path) as conn:
+                return conn.execute("SELECT * FROM candidates ORDER BY created_at DESC").fetchall()
+
+        print(f"{'workload':<28}{'mode':<10}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for name, fn, iterations in (
+            ("get_comparison_data", lookup, args.iterations),
+            ("get_info_candidate (all)", listing, max(args.iterations // 10, 1)),
+        ):
+            for mode, flag in (("disk", "0"), ("snapshot", "1")):
+                os.environ[SNAPSHOT_ENV_VAR] = flag
+                fn()  # warm-up (loads the snapshot on first use)
+                samples = sorted(time_calls(fn, iterations))
+                p95 = samples[int(len(samples) * 0.95) - 1]
+                print(
+                    f"{name:<28}{mode:<10}{statistics.mean(samples):>10.3f}"
+                    f"{statistics.median(samples):>10.3f}{p95:>10.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
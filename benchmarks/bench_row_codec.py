@@ -0,0 +1,138 @@
+"""
+Benchmark: eager dict decoding vs. lazy ``Record`` decoding on full-table reads.
+
+Populates an in-memory candidates table and decodes every row the way the
+retrieval tools used to (a dict per row with all JSON columns parsed) and with
+``CANDIDATE_RECORDS``, both for listings that read a few scalar columns and for
+full conversions. Reports CPU time and peak traced allocations per pass.
+
+Usage:
+    python benchmarks/bench_row_codec.py --candidates 5000 --iterations 20
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.core.records import CANDIDATE_JSON_FIELDS, CANDIDATE_RECORDS  # noqa: E402
+
+COLUMNS = (
+    "id", "candidate_name", "email", "phone", "location", "position_applied",
+    "technical_skills", "experience_years", "education", "certifications",
+    "previous_companies", "consulting_experience", "key_achievements", "languages",
+    "industry_experience", "source_filename", "created_at",
+)  # fmt: skip
+
+
+def populate(conn: sqlite3.Connection, candidates: int) -> None:
+    """Create the candidates table and fill it with synthetic rows."""
+    conn.execute(f"CREATE TABLE candidates ({', '.join(COLUMNS)})")
+    skills = ["Python", "Java", "Kubernetes", "SQL", "AWS", "React", "SAP", "Terraform"]
+    conn.executemany(
+        f"INSERT INTO candidates VALUES ({', '.join('?' * len(COLUMNS))})",
+        (
+            (
+                str(i),
+                f"Candidate {i}",
+                f"candidate{i}@example.com",
+                "+39 000 0000",
+                "Milano",
+                "Software Engineer",
+                json.dumps(random.sample(skills, 5)),
+                f"{random.randint(1, 20)} anni",
+                "Laurea in Informatica",
+                json.dumps(["AWS Certified Solutions Architect", "PMP"]),
+                json.dumps([f"Company {n}" for n in range(4)]),
+                "Consulting experience " * 20,
+                json.dumps([f"Delivered project {n} on time and budget" for n in range(5)]),
+                json.dumps(["Italian", "English"]),
+                json.dumps(["Banking", "Insurance", "Public Sector"]),
+                f"cv_{i}.pdf",
+                f"2024-01-01T00:00:{i % 60:02d}",
+            )
+            for i in range(1, candidates + 1)
+        ),
+    )
+
+
+def eager_dicts(rows: List[Tuple], description: Any) -> List[Dict[str, Any]]:
+    """Decode rows the way the retrieval tools did before ``RecordCodec``."""
+    cols = [col[0] for col in description]
+    results = []
+    for row in rows:
+        rec = dict(zip(cols, row))
+        for key in CANDIDATE_JSON_FIELDS:
+            if key in rec and isinstance(rec[key], str):
+                try:
+                    rec[key] = json.loads(rec[key])
+                except json.JSONDecodeError:
+                    pass
+        results.append(rec)
+    return results
+
+
+def measure(fn: Callable[[], object], iterations: int) -> Tuple[float, float]:
+    """Return the median CPU milliseconds and peak traced KiB of ``fn``."""
+    samples = []
+    for _ in range(iterations):
+        start = time.process_time()
+        fn()
+        samples.append((time.process_time() - start) * 1000)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return statistics.median(samples), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(":memory:")
+    populate(conn, args.candidates)
+    cursor = conn.execute("SELECT * FROM candidates ORDER BY created_at DESC")
+    rows, description = cursor.fetchall(), cursor.description
+
+    def records() -> List[Any]:
+        record_type = CANDIDATE_RECORDS.record_type(description)
+        return [record_type(row) for row in rows]
+
+    workloads = (
+        (
+            "listing (name, email)",
+            lambda: [(r["candidate_name"], r["email"]) for r in eager_dicts(rows, description)],
+            lambda: [(r.candidate_name, r.email) for r in records()],
+        ),
+        (
+            "full decode",
+            lambda: eager_dicts(rows, description),
+            lambda: [r.to_dict() for r in records()],
+        ),
+    )
+
+    print(f"{'workload':<24}{'decoder':<10}{'cpu ms':>10}{'peak KiB':>12}")
+    for name, eager, lazy in workloads:
+        for decoder, fn in (("eager", eager), ("record", lazy)):
+            cpu_ms, peak_kib = measure(fn, args.iterations)
+            print(f"{name:<24}{decoder:<10}{cpu_ms:>10.2f}{peak_kib:>12.0f}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+"""
+Load generator: agent tool-call workflows replayed without the LLM.
+
+Drives the tools the way the agents call them, from N worker processes against
+a local database, and reports throughput, tail latency and error rate per
+workflow and per tool for capacity planning. Each worker runs one session at a
+time back-to-back (closed loop), so ``--concurrency`` is the number of agent
+sessions in flight. Two traffic sources:
+
+* synthetic: weighted scenarios modelled on the agent YAMLs
+    - ``comparison`` (recruitment_comparison_agent): get_all_candidates ->
+      get_all_bandos -> get_comparison_data
+    - ``evaluation`` (simple_evaluator_agent): get_comparison_data ->
+      save_evaluation_result
+    - ``ingest`` (recruitment_orchestrator): classify_and_save_document of an
+      already extracted document (the extraction itself is LLM time)
+* trace replay: a JSON-lines file with one tool call per line,
+  ``{"session": "s1", "workflow": "evaluation", "tool": "get_comparison_data",
+  "args": {"candidate_id": "3", "bando_id": "1"}}``; calls of a session are
+  replayed in order, sessions are spread over the workers. ``--record`` writes
+  synthetic traffic in this format.
+
+The database is seeded through the save tools in a temporary directory, or
+copied from ``--db`` (the original is never modified).
+
+Usage:
+    python benchmarks/load_agent_workflows.py --concurrency 8 --duration 30
+    python benchmarks/load_agent_workflows.py --mix comparison=1,evaluation=1 --think-ms 50
+    python benchmarks/load_agent_workflows.py --duration 5 --record trace.jsonl
+    python benchmarks/load_agent_workflows.py --trace trace.jsonl --concurrency 16
+
+Exits with status 1 if the error rate exceeds ``--max-error-rate``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SKILLS = ["Python", "Java", "Kubernetes", "SQL", "AWS", "React", "SAP", "Terraform", "Docker"]
+CITIES = ["Milano", "Roma", "Torino", "Napoli", "Bologna"]
+
+# Workflow -> (agent it models, default weight)
+WORKFLOWS: Dict[str, Tuple[str, int]] = {
+    "comparison": ("recruitment_comparison_agent", 5),
+    "evaluation": ("simple_evaluator_agent", 3),
+    "ingest": ("recruitment_orchestrator", 2),
+}
+
+
+class Call(NamedTuple):
+    """One timed tool call."""
+
+    tool: str
+    seconds: float
+    ok: bool
+    error: str  # First line of the failure, empty when ok
+    args: Optional[Dict[str, Any]]  # Only kept when recording a trace
+
+
+class Session(NamedTuple):
+    """One workflow run by one simulated agent session."""
+
+    workflow: str
+    seconds: float
+    calls: List[Call]
+
+
+def load_tools() -> Dict[str, Callable[..., str]]:
+    """Import the core tool functions and create the schema in the working directory."""
+    from tools.core import (
+        db_manager,
+        db_manager_enhanced,
+        db_retrieval,
+        document_ingest,
+        evaluation_tools,
+        skill_matching,
+    )
+    from tools.core.schema import init_schema
+
+    init_schema()
+
+    return {
+        "save_candidate_data": db_manager.save_candidate_data,
+        "save_bando_data": db_manager.save_bando_data,
+        "format_and_save_processed_data": db_manager_enhanced.format_and_save_processed_data,
+        "get_all_candidates": db_manager_enhanced.get_all_candidates,
+        "get_all_bandos": db_manager_enhanced.get_all_bandos,
+        "get_candidate_by_id": db_manager_enhanced.get_candidate_by_id,
+        "get_comparison_data": db_retrieval.get_comparison_data,
+        "get_comparison_data_for_bandos": db_retrieval.get_comparison_data_for_bandos,
+        "get_comparison_data_for_candidates": db_retrieval.get_comparison_data_for_candidates,
+        "get_info_candidate": db_retrieval.get_info_candidate,
+        "get_info_bando": db_retrieval.get_info_bando,
+        "classify_and_save_document": document_ingest.classify_and_save_document,
+        "save_evaluation_result": evaluation_tools.save_evaluation_result,
+        "get_evaluation_results": evaluation_tools.get_evaluation_results,
+        "find_matching_candidates": skill_matching.find_matching_candidates,
+    }
+
+
+def failure(result: Any) -> str:
+    """Return why a tool result counts as an error, or an empty string."""
+    if not isinstance(result, str):
+        return ""
+    text = result.lstrip()
+    if text.startswith(("❌", "Error")):
+        return text.splitlines()[0]
+    if text.startswith("{") and '"error"' in text:
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError:
+            return ""
+        if isinstance(payload, dict) and payload.get("error"):
+            return str(payload["error"])
+    return ""
+
+
+def synthetic_cv(rng: random.Random, n: int) -> Dict[str, Any]:
+    return {
+        "document_type": "CV",
+        "candidate_name": f"Load Candidate {n}",
+        "contact_info": {"email": f"load{n}@example.com", "location": rng.choice(CITIES)},
+        "position_applied": "Software Engineer",
+        "technical_skills": rng.sample(SKILLS, 4),
+        "experience_years": f"{rng.randint(1, 20)} anni",
+        "languages": ["Italian", "English"],
+        "consulting_experience": "Delivery of cloud migration projects. " * 5,
+    }
+
+
+def synthetic_bando(rng: random.Random, n: int) -> Dict[str, Any]:
+    return {
+        "document_type": "Bando di Gara",
+        "client_name": f"Load Client {n}",
+        "project_title": f"Load Project {n}",
+        "project_description": "Modernization of the digital platform. " * 10,
+        "required_skills": rng.sample(SKILLS, 3),
+        "experience_required": f"almeno {rng.randint(2, 8)} anni",
+        "location": rng.choice(CITIES),
+    }
+
+
+def comparison_workflow(call: Callable[..., str], rng: random.Random, ids: Dict) -> None:
+    call("get_all_candidates")
+    call("get_all_bandos")
+    call(
+        "get_comparison_data",
+        candidate_id=rng.choice(ids["candidates"]),
+        bando_id=rng.choice(ids["bandos"]),
+    )
+
+
+def evaluation_workflow(call: Callable[..., str], rng: random.Random, ids: Dict) -> None:
+    candidate_id, bando_id = rng.choice(ids["candidates"]), rng.choice(ids["bandos"])
+    call("get_comparison_data", candidate_id=candidate_id, bando_id=bando_id)
+    call(
+        "save_evaluation_result",
+        candidate_id=candidate_id,
+        bando_id=bando_id,
+        match_score=rng.randint(0, 100),
+        evaluation_summary="Load test evaluation.",
+    )
+
+
+def ingest_workflow(call: Callable[..., str], rng: random.Random, ids: Dict) -> None:
+    n = rng.randrange(10**9)
+    document = synthetic_cv(rng, n) if rng.random() < 0.7 else synthetic_bando(rng, n)
+    call(
+        "classify_and_save_document",
+        extracted_data=json.dumps(document),
+        source_filename=f"load_{n}.pdf",
+    )
+
+
+SCENARIOS = {
+    "comparison": comparison_workflow,
+    "evaluation": evaluation_workflow,
+    "ingest": ingest_workflow,
+}
+
+
+def seed_database(candidates: int, bandos: int, seed: int) -> None:
+    """Fill the working directory database through the save tools."""
+    from tools.core.db_manager_enhanced import format_and_save_processed_data
+
+    rng = random.Random(seed)
+    for n in range(1, candidates + 1):
+        format_and_save_processed_data(json.dumps(synthetic_cv(rng, n)))
+    for n in range(1, bandos + 1):
+        format_and_save_processed_data(json.dumps(synthetic_bando(rng, n)))
+
+
+def existing_ids(db_path: str) -> Dict[str, List[str]]:
+    with sqlite3.connect(db_path) as conn:
+        return {
+            "candidates": [row[0] for row in conn.execute("SELECT id FROM candidates")],
+            "bandos": [row[0] for row in conn.execute("SELECT id FROM bando_di_gara")],
+        }
+
+
+def load_trace(path: str) -> List[Tuple[str, List[Tuple[str, Dict[str, Any]]]]]:
+    """Group a JSON-lines trace into (workflow, [(tool, args), ...]) sessions in file order."""
+    sessions: "OrderedDict[str, Tuple[str, List]]" = OrderedDict()
+    with open(path, encoding="utf-8") as handle:
+        for number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            key = str(entry.get("session", f"line-{number}"))
+            workflow, calls = sessions.setdefault(key, (entry.get("workflow", "trace"), []))
+            calls.append((entry["tool"], entry.get("args") or {}))
+    return list(sessions.values())
+
+
+def worker(args: Tuple) -> List[Session]:
+    """Run sessions until the deadline (synthetic) or through the assigned trace sessions."""
+    index, workdir, start_at, duration, mix, trace, think, record, seed = args
+    os.chdir(workdir)
+    tools = load_tools()
+    ids = existing_ids("recruitment.db")
+    rng = random.Random(seed * 1000 + index)
+
+    calls: List[Call] = []
+
+    def call(tool: str, **kwargs: Any) -> str:
+        start = time.perf_counter()
+        try:
+            result = tools[tool](**kwargs)
+            error = failure(result)
+        except Exception as e:  # A crashing tool is an error, not the end of the run
+            result, error = None, f"{type(e).__name__}: {e}"
+        calls.append(
+            Call(tool, time.perf_counter() - start, not error, error, kwargs if record else None)
+        )
+        if think:
+            time.sleep(think)
+        return result
+
+    def run(workflow: str, body: Callable[[], None]) -> Session:
+        del calls[:]
+        start = time.perf_counter()
+        body()
+        return Session(workflow, time.perf_counter() - start, list(calls))
+
+    time.sleep(max(start_at - time.time(), 0))
+    sessions = []
+    if trace is not None:
+        for workflow, steps in trace:
+            sessions.append(run(workflow, lambda: [call(tool, **kwargs) for tool, kwargs in steps]))
+    else:
+        names, weights = zip(*mix.items())
+        deadline = start_at + duration
+        while time.time() < deadline:
+            workflow = rng.choices(names, weights)[0]
+            sessions.append(run(workflow, lambda: SCENARIOS[workflow](call, rng, ids)))
+    return sessions
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    return samples[max(math.ceil(pct / 100 * len(samples)) - 1, 0)] if samples else 0.0
+
+
+def summarize(name: str, seconds: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ms = sorted(s * 1000 for s in seconds)
+    return {
+        "name": name,
+        "count": len(ms),
+        "per_second": round(len(ms) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ms, 50), 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+        "max_ms": round(ms[-1], 2) if ms else 0.0,
+        "errors": errors,
+        "error_rate": round(errors / len(ms), 4) if ms else 0.0,
+    }
+
+
+def build_report(sessions: List[Session], elapsed: float) -> Dict[str, Any]:
+    """Aggregate sessions per workflow and calls per tool."""
+    by_workflow: Dict[str, List[Session]] = defaultdict(list)
+    by_tool: Dict[str, List[Call]] = defaultdict(list)
+    error_samples: Dict[str, str] = {}
+    for session in sessions:
+        by_workflow[session.workflow].append(session)
+        for c in session.calls:
+            by_tool[c.tool].append(c)
+            if not c.ok:
+                error_samples.setdefault(c.tool, c.error)
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "workflows": [
+            summarize(
+                name,
+                [s.seconds for s in runs],
+                sum(1 for s in runs if not all(c.ok for c in s.calls)),
+                elapsed,
+            )
+            for name, runs in sorted(by_workflow.items())
+        ],
+        "tools": [
+            summarize(name, [c.seconds for c in runs], sum(not c.ok for c in runs), elapsed)
+            for name, runs in sorted(by_tool.items())
+        ],
+        "total": summarize(
+            "all sessions",
+            [s.seconds for s in sessions],
+            sum(1 for s in sessions if not all(c.ok for c in s.calls)),
+            elapsed,
+        ),
+        "error_samples": error_samples,
+    }
+
+
+def print_report(report: Dict[str, Any], concurrency: int) -> None:
+    header = (
+        f"{'':<36}{'count':>8}{'per s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'max ms':>9}{'errors':>8}"
+    )
+
+    def row(stats: Dict[str, Any]) -> str:
+        return (
+            f"{stats['name']:<36}{stats['count']:>8}{stats['per_second']:>9.1f}"
+            f"{stats['p50_ms']:>9.2f}{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}"
+            f"{stats['max_ms']:>9.2f}{stats['error_rate']:>8.1%}"
+        )
+
+    print(f"concurrency={concurrency} elapsed={report['elapsed_seconds']}s")
+    print(f"\n{'workflow (session latency)':<36}{header[36:]}")
+    for stats in report["workflows"] + [report["total"]]:
+        print(row(stats))
+    print(f"\n{'tool (call latency)':<36}{header[36:]}")
+    for stats in report["tools"]:
+        print(row(stats))
+    for tool, error in report["error_samples"].items():
+        print(f"  {tool}: {error}")
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown workflow {name!r} ({', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    if not mix or not any(mix.values()):
+        raise argparse.ArgumentTypeError("the mix needs at least one positive weight")
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent agent sessions")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds (synthetic mode)")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default={name: weight for name, (_, weight) in WORKFLOWS.items()},
+        help="workflow weights, e.g. comparison=5,evaluation=3,ingest=2",
+    )
+    parser.add_argument("--trace", help="replay a JSON-lines tool-call trace instead")
+    parser.add_argument("--record", help="write the synthetic calls as a JSON-lines trace")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause after each call")
+    parser.add_argument("--db", help="copy this database instead of seeding a new one")
+    parser.add_argument("--candidates", type=int, default=200, help="candidates to seed")
+    parser.add_argument("--bandos", type=int, default=20, help="bandos to seed")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument(
+        "--max-error-rate", type=float, help="exit with status 1 above this session error rate"
+    )
+    args = parser.parse_args()
+
+    trace_sessions = load_trace(args.trace) if args.trace else None
+    cwd = os.getcwd()
+    db_copy = os.path.abspath(args.db) if args.db else None
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        if db_copy:
+            shutil.copyfile(db_copy, os.path.join(workdir, "recruitment.db"))
+        load_tools()  # Create or migrate the schema once, before the workers start
+        if not db_copy:
+            seed_database(args.candidates, args.bandos, args.seed)
+        ids = existing_ids("recruitment.db")
+        if trace_sessions is None and not (ids["candidates"] and ids["bandos"]):
+            parser.error("the database needs at least one candidate and one bando")
+
+        plans = [
+            trace_sessions[i :: args.concurrency] if trace_sessions is not None else None
+            for i in range(args.concurrency)
+        ]
+        start_at = time.time() + 1.0  # Let every worker finish importing first
+        with multiprocessing.Pool(args.concurrency) as pool:
+            outcomes = pool.map(
+                worker,
+                [
+                    (
+                        i,
+                        workdir,
+                        start_at,
+                        args.duration,
+                        args.mix,
+                        plans[i],
+                        args.think_ms / 1000,
+                        bool(args.record),
+                        args.seed,
+                    )
+                    for i in range(args.concurrency)
+                ],
+            )
+        elapsed = time.time() - start_at
+        os.chdir(cwd)
+
+    sessions = [session for worker_sessions in outcomes for session in worker_sessions]
+    report = build_report(sessions, elapsed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.concurrency)
+
+    if args.record:
+        with open(args.record, "w", encoding="utf-8") as handle:
+            for number, session in enumerate(sessions, 1):
+                for c in session.calls:
+                    entry = {
+                        "session": f"s{number}",
+                        "workflow": session.workflow,
+                        "tool": c.tool,
+                        "args": c.args,
+                    }
+                    handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    if args.max_error_rate is not None and report["total"]["error_rate"] > args.max_error_rate:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
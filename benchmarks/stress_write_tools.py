@@ -0,0 +1,203 @@
+"""
+Stress test: concurrent writers hammering the save tools.
+
+Starts N worker processes that call ``save_candidate_data``, ``save_bando_data``,
+``format_and_save_processed_data`` and ``save_evaluation_result`` in a loop
+against one recruitment database, then reports sustained inserts per second,
+lock contention counters and a zero-loss check: every call must succeed and
+every ID a tool reported must be present in the database exactly once.
+
+Usage:
+    python benchmarks/stress_write_tools.py --workers 8 --ops 200
+    python benchmarks/stress_write_tools.py --workers 8 --max-attempts 1  # no retries
+    python benchmarks/stress_write_tools.py --busy-timeout 0.001  # exercise the backoff
+
+Exits with status 1 if any write was lost.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_ID_PATTERN = re.compile(r"ID: (\S+)")
+
+CV = {
+    "document_type": "CV",
+    "candidate_name": "Stress Candidate",
+    "contact_info": {"email": "stress@example.com", "location": "Milano"},
+    "technical_skills": ["Python", "SQL", "Kubernetes"],
+    "languages": ["Italian", "English"],
+    "experience_years": "6 anni",
+}
+
+BANDO = {
+    "document_type": "Bando di Gara",
+    "client_name": "Stress Client",
+    "project_title": "Load Test Platform",
+    "required_skills": ["Python", "AWS"],
+    "experience_required": "almeno 5 anni",
+}
+
+
+def worker(
+    args: Tuple[int, int, str, int, float]
+) -> Tuple[List[Tuple[str, str, str, float]], Dict]:
+    """Run ``ops`` tool calls and return (tool, table, result, seconds) per call and metrics."""
+    index, ops, workdir, max_attempts, busy_timeout = args
+    os.chdir(workdir)
+    from tools.core import db_connection
+    from tools.core.db_manager import save_bando_data, save_candidate_data
+    from tools.core.db_manager_enhanced import format_and_save_processed_data
+    from tools.core.evaluation_tools import save_evaluation_result
+
+    db_connection.WRITE_MAX_ATTEMPTS = max_attempts
+    db_connection.WRITE_BUSY_TIMEOUT = busy_timeout
+    db_connection.WRITE_METRICS.reset()
+
+    calls = [
+        ("save_candidate_data", "candidates", lambda: save_candidate_data(json.dumps(CV))),
+        ("save_bando_data", "bando_di_gara", lambda: save_bando_data(json.dumps(BANDO))),
+        (
+            "format_and_save_processed_data",
+            "candidates",
+            lambda: format_and_save_processed_data(json.dumps(CV)),
+        ),
+        (
+            "format_and_save_processed_data",
+            "bando_di_gara",
+            lambda: format_and_save_processed_data(json.dumps(BANDO)),
+        ),
+        (
+            "save_evaluation_result",
+            "evaluations",
+            lambda: save_evaluation_result(f"W{index}", "B1", 75, "Stress evaluation"),
+        ),
+    ]
+    results = []
+    for op in range(ops):
+        name, table, call = calls[(index + op) % len(calls)]
+        start = time.perf_counter()
+        message = call()
+        results.append((name, table, message, time.perf_counter() - start))
+    return results, db_connection.WRITE_METRICS.snapshot()
+
+
+def check_losses(db_path: str, results: List[Tuple[str, str, str, float]]) -> List[str]:
+    """Compare the IDs reported by the tools with the rows in the database."""
+    problems = []
+    reported: Dict[str, Counter] = defaultdict(Counter)
+    for name, table, message, _ in results:
+        match = _ID_PATTERN.search(message)
+        if not message.startswith("✅") or not match:
+            problems.append(f"{name} failed: {message.splitlines()[0]}")
+            continue
+        reported[table][match.group(1)] += 1
+
+    with sqlite3.connect(db_path) as conn:
+        for table, ids in reported.items():
+            key = "evaluation_id" if table == "evaluations" else "id"
+            stored = Counter(str(row[0]) for row in conn.execute(f"SELECT {key} FROM {table}"))
+            duplicates = [i for i, count in ids.items() if count > 1]
+            missing = [i for i in ids if i not in stored]
+            if duplicates:
+                problems.append(f"{table}: {len(duplicates)} ID(s) reported twice")
+            if missing:
+                problems.append(f"{table}: {len(missing)} reported ID(s) not stored")
+            if sum(stored.values()) != sum(ids.values()):
+                problems.append(
+                    f"{table}: {sum(ids.values())} reported, {sum(stored.values())} stored"
+                )
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200, help="tool calls per worker")
+    parser.add_argument(
+        "--max-attempts", type=int, default=8, help="write lock attempts (1 disables retries)"
+    )
+    parser.add_argument(
+        "--busy-timeout", type=float, default=1.0, help="seconds SQLite waits per lock attempt"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Create the schema once so the workers do not race on initialization
+        os.chdir(workdir)
+        from tools.core.schema import init_schema
+
+        init_schema()
+
+        start = time.perf_counter()
+        with multiprocessing.Pool(args.workers) as pool:
+            outcomes = pool.map(
+                worker,
+                [
+                    (i, args.ops, workdir, args.max_attempts, args.busy_timeout)
+                    for i in range(args.workers)
+                ],
+            )
+        elapsed = time.perf_counter() - start
+
+        results = [call for calls, _ in outcomes for call in calls]
+        metrics: Dict[str, Any] = Counter()
+        for _, worker_metrics in outcomes:
+            for name, value in worker_metrics.items():
+                if name == "max_attempts":
+                    metrics[name] = max(metrics[name], value)
+                else:
+                    metrics[name] += value
+        problems = check_losses(os.path.join(workdir, "recruitment.db"), results)
+        os.chdir(ROOT)
+
+    succeeded = sum(1 for _, _, message, _ in results if message.startswith("✅"))
+    print(
+        f"workers={args.workers} ops/worker={args.ops} max_attempts={args.max_attempts} "
+        f"busy_timeout={args.busy_timeout}s"
+    )
+    print(f"{'tool':<34}{'calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    by_tool: Dict[str, List[float]] = defaultdict(list)
+    for name, _, _, seconds in results:
+        by_tool[name].append(seconds * 1000)
+    for name, samples in sorted(by_tool.items()):
+        samples.sort()
+        p95 = samples[max(int(len(samples) * 0.95) - 1, 0)]
+        print(
+            f"{name:<34}{len(samples):>8}{statistics.median(samples):>10.2f}"
+            f"{p95:>10.2f}{samples[-1]:>10.2f}"
+        )
+    print(
+        f"\nsustained: {succeeded / elapsed:.1f} inserts/s ({succeeded}/{len(results)} "
+        f"succeeded in {elapsed:.2f}s)"
+    )
+    print(
+        f"contention: {metrics['retries']} retries, {metrics['lock_failures']} lock failures, "
+        f"{metrics['lock_wait_seconds']:.2f}s waiting, max {metrics['max_attempts']} attempts"
+    )
+    if problems:
+        print(f"zero-loss check: FAILED ({len(problems)} problem(s))")
+        for problem in problems[:10]:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("zero-loss check: PASSED")
+
+
+if __name__ == "__main__":
+    main()
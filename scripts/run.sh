@@ -102,8 +102,17 @@ import_tools() {
             tool_type="python"
             [[ "$tool_file" == *.yaml || "$tool_file" == *.yml ]] && tool_type="openapi"
 
-            echo "Importing ${tool_name}..."
-            orchestrate tools import -k "$tool_type" -f "$tool_file"
+            if [[ "$tool_type" == "python" ]]; then
+                # Helper modules (no @tool functions) are shipped via the package root
+                if ! grep -q "^@tool" "$tool_file"; then
+                    continue
+                fi
+                echo "Importing ${tool_name}..."
+                orchestrate tools import -k "$tool_type" -f "$tool_file" -p "${PROJECT_ROOT}"
+            else
+                echo "Importing ${tool_name}..."
+                orchestrate tools import -k "$tool_type" -f "$tool_file"
+            fi
             check_command "${tool_name} import"
         fi
     done
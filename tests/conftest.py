@@ -13,3 +13,13 @@ import pytest
 def test_config():
     """Provide test configuration."""
     return {"database": "recruitment.db", "test_mode": True}
+
+
+@pytest.fixture
+def recruitment_db(tmp_path):
+    """Provide an initialized recruitment database in a temporary directory."""
+    from tools.core.schema import init_schema
+
+    db_path = str(tmp_path / "recruitment.db")
+    init_schema(db_path)
+    return db_path
@@ -0,0 +1,62 @@
+"""
+Unit tests for change feed module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import sqlite3
+
+import pytest
+
+from tools.core.change_log import fetch_changes, high_water_mark, install_change_log
+from tools.core.records import CANDIDATE_RECORDS, EVALUATION_RECORDS
+
+
+@pytest.mark.unit
+def test_delta_reports_changes_after_high_water_mark(recruitment_db):
+    """Test that only rows changed after ``since`` are returned, deletes included."""
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.executemany(
+            "INSERT INTO candidates (id, candidate_name) VALUES (?, ?)",
+            [("1", "Maria Rossi"), ("2", "Luca Bianchi"), ("3", "Anna Verdi")],
+        )
+        mark = high_water_mark(conn)
+        conn.execute("UPDATE candidates SET candidate_name = 'Maria R.' WHERE id = '1'")
+        conn.execute("DELETE FROM candidates WHERE id = '2'")
+        conn.execute("INSERT INTO candidates (id, candidate_name) VALUES ('4', 'Paolo Neri')")
+
+        full = fetch_changes(conn, "candidates", 0, CANDIDATE_RECORDS)
+        delta = fetch_changes(conn, "candidates", mark, CANDIDATE_RECORDS)
+        empty = fetch_changes(conn, "candidates", delta.high_water_mark, CANDIDATE_RECORDS)
+
+    assert [r.id for r in full.records] == ["3", "1", "4"]
+    assert [(r.id, r.candidate_name) for r in delta.records] == [
+        ("1", "Maria R."),
+        ("4", "Paolo Neri"),
+    ]
+    assert delta.deleted == ["2"]
+    assert delta.high_water_mark == mark + 3
+    assert empty.records == [] and empty.deleted == []
+    assert empty.high_water_mark == delta.high_water_mark
+
+
+@pytest.mark.unit
+def test_existing_rows_are_seeded_once(tmp_path):
+    """Test that rows present before the triggers are installed appear in the feed."""
+    db_path = str(tmp_path / "legacy.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE evaluations (evaluation_id INTEGER PRIMARY KEY, "
+            "candidate_id TEXT, created_at TEXT)"
+        )
+        conn.execute("INSERT INTO evaluations VALUES (1, 'A', '2024-01-01')")
+        install_change_log(conn.cursor())
+        install_change_log(conn.cursor())
+        conn.execute("INSERT INTO evaluations VALUES (2, 'B', '2024-01-02')")
+
+        changes = fetch_changes(conn, "evaluations", 0, EVALUATION_RECORDS)
+
+    assert [r.evaluation_id for r in changes.records] == [1, 2]
+    assert changes.high_water_mark == 2
@@ -0,0 +1,158 @@
+"""
+Unit tests for database connection helpers.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from tools.core import db_connection
+from tools.core.db_connection import (
+    SNAPSHOT_ENV_VAR,
+    WRITE_METRICS,
+    ReadSnapshot,
+    read_connection,
+    write_transaction,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a small database file with a single candidate."""
+    path = str(tmp_path / "recruitment.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE candidates (id TEXT PRIMARY KEY, candidate_name TEXT)")
+        conn.execute("INSERT INTO candidates VALUES ('1', 'Maria Rossi')")
+    return path
+
+
+@pytest.mark.unit
+def test_snapshot_reloads_after_commit(db_path):
+    """Test that the snapshot picks up rows committed by another connection."""
+    snapshot = ReadSnapshot(db_path)
+    try:
+        conn = snapshot.connect()
+        assert conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0] == 1
+        conn.close()
+
+        with sqlite3.connect(db_path) as writer:
+            writer.execute("INSERT INTO candidates VALUES ('2', 'Luca Bianchi')")
+
+        conn = snapshot.connect()
+        assert conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0] == 2
+        conn.close()
+        assert snapshot.refresh_count == 2
+        assert snapshot.refresh() is False
+    finally:
+        snapshot.close()
+
+
+@pytest.mark.unit
+def test_read_connection_uses_snapshot_when_enabled(db_path, monkeypatch):
+    """Test that read_connection serves the same data from disk and snapshot."""
+    monkeypatch.delenv(SNAPSHOT_ENV_VAR, raising=False)
+    with read_connection(db_path) as conn:
+        on_disk = conn.execute("SELECT * FROM candidates").fetchall()
+
+    monkeypatch.setenv(SNAPSHOT_ENV_VAR, "1")
+    with read_connection(db_path) as conn:
+        in_memory = conn.execute("SELECT * FROM candidates").fetchall()
+        assert conn.execute("PRAGMA database_list").fetchone()[2] == ""
+
+    assert in_memory == on_disk
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch):
+    """Shorten lock waits so contention tests run quickly."""
+    monkeypatch.setattr(db_connection, "WRITE_BUSY_TIMEOUT", 0.01)
+    monkeypatch.setattr(db_connection, "WRITE_BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(db_connection, "WRITE_BACKOFF_CAP", 0.05)
+    WRITE_METRICS.reset()
+
+
+@pytest.mark.unit
+def test_write_transaction_waits_for_lock(db_path, fast_backoff):
+    """Test that a writer retries until a competing write lock is released."""
+    holder = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    holder.execute("BEGIN IMMEDIATE")
+    release = threading.Timer(0.2, holder.execute, args=("COMMIT",))
+    release.start()
+    try:
+        with write_transaction(db_path, max_attempts=50) as conn:
+            conn.execute("INSERT INTO candidates VALUES ('2', 'Luca Bianchi')")
+    finally:
+        release.join()
+        holder.close()
+
+    metrics = WRITE_METRICS.snapshot()
+    assert metrics["transactions"] == 1 and metrics["retries"] > 0
+    assert metrics["lock_failures"] == 0
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0] == 2
+
+
+@pytest.mark.unit
+def test_write_transaction_gives_up_and_rolls_back(db_path, fast_backoff):
+    """Test bounded retries and rollback when the block fails."""
+    holder = sqlite3.connect(db_path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        with write_transaction(db_path, max_attempts=3):
+            pass
+    holder.execute("COMMIT")
+    holder.close()
+    assert WRITE_METRICS.snapshot()["lock_failures"] == 1
+
+    with pytest.raises(ValueError):
+        with write_transaction(db_path) as conn:
+            conn.execute("INSERT INTO candidates VALUES ('3', 'Anna Verdi')")
+            raise ValueError("extraction failed")
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0] == 1
+
+
+@pytest.mark.unit
+def test_snapshot_reader_attaches_while_writer_commits(db_path, monkeypatch):
+    """Test that a refresh racing with connect() cannot release the reader's copy."""
+    snapshot = ReadSnapshot(db_path)
+    snapshot.refresh()
+    real_connect = sqlite3.connect
+    racers = []
+
+    def commit_and_refresh():
+        with real_connect(db_path) as writer:
+            writer.execute("INSERT INTO candidates VALUES ('2', 'Luca Bianchi')")
+        snapshot.refresh()
+
+    class RacingSqlite:
+        """Run a writer commit and a refresh right before a reader attaches."""
+
+        def __getattr__(self, name):
+            return getattr(sqlite3, name)
+
+        def connect(self, database, *args, **kwargs):
+            if kwargs.get("uri") and "check_same_thread" not in kwargs:
+                racer = threading.Thread(target=commit_and_refresh)
+                racers.append(racer)
+                racer.start()
+                racer.join(timeout=0.5)
+            return real_connect(database, *args, **kwargs)
+
+    monkeypatch.setattr(db_connection, "sqlite3", RacingSqlite())
+    try:
+        conn = snapshot.connect()
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0] == 1
+        finally:
+            conn.close()
+        racers[0].join()
+        assert snapshot.refresh_count == 2
+    finally:
+        monkeypatch.undo()
+        snapshot.close()
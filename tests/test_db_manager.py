@@ -12,7 +12,7 @@ from datetime import datetime
 
 import pytest
 
-from tools.db_manager_enhanced import (
+from tools.core.db_manager_enhanced import (
     clean_json_string,
     get_next_id,
     init_db,
@@ -63,9 +63,7 @@ def test_init_db():
     assert cursor.fetchone() is not None
 
     # Check if bando_di_gara table exists
-    cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='bando_di_gara'"
-    )
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='bando_di_gara'")
     assert cursor.fetchone() is not None
 
     conn.close()
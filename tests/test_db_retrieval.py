@@ -0,0 +1,60 @@
+"""
+Unit tests for database retrieval module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from tools.core.db_retrieval import (
+    get_comparison_data_for_bandos,
+    get_comparison_data_for_candidates,
+)
+
+
+@pytest.fixture
+def comparison_db(recruitment_db, tmp_path, monkeypatch):
+    """Provide two candidates and three bandos in the working directory database."""
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.executemany(
+            "INSERT INTO candidates (id, candidate_name, technical_skills) VALUES (?, ?, ?)",
+            [("1", "Maria Rossi", '["Python"]'), ("2", "Luca Bianchi", '["Java"]')],
+        )
+        conn.executemany(
+            "INSERT INTO bando_di_gara (id, project_title, required_skills) VALUES (?, ?, ?)",
+            [(str(i), f"Project {i}", '["Python"]') for i in range(1, 4)],
+        )
+    monkeypatch.chdir(tmp_path)
+    return recruitment_db
+
+
+@pytest.mark.unit
+def test_one_candidate_against_many_bandos(comparison_db):
+    """Test that the candidate is sent once and every bando is keyed by ID."""
+    payload = json.loads(get_comparison_data_for_bandos("1", "3, 1,3,99"))
+
+    assert payload["candidate"]["candidate_name"] == "Maria Rossi"
+    assert payload["candidate"]["technical_skills"] == ["Python"]
+    assert list(payload["bandi"]) == ["3", "1"]
+    assert payload["pairs"] == [
+        {"candidate_id": "1", "bando_id": "3"},
+        {"candidate_id": "1", "bando_id": "1"},
+    ]
+    assert payload["not_found"] == ["99"]
+
+
+@pytest.mark.unit
+def test_one_bando_against_many_candidates(comparison_db):
+    """Test the reverse direction, JSON array input and missing anchors."""
+    payload = json.loads(get_comparison_data_for_candidates("2", '["1", "2"]'))
+    assert payload["bando_di_gara"]["project_title"] == "Project 2"
+    assert list(payload["candidates"]) == ["1", "2"]
+    assert "omitted" not in payload
+
+    assert "error" in json.loads(get_comparison_data_for_candidates("42", "1"))
+    assert "error" in json.loads(get_comparison_data_for_bandos("1", ""))
@@ -0,0 +1,98 @@
+"""
+Unit tests for document ingest fast path module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from tools.core.document_ingest import (
+    BANDO,
+    BANDO_SCHEMA,
+    CV,
+    CV_SCHEMA,
+    UNKNOWN,
+    classify_and_save_document,
+    classify_document,
+)
+
+
+@pytest.mark.unit
+def test_classify_document():
+    """Test classification from declared type, distinctive fields and keywords."""
+    cv = classify_document({"candidate_name": "Maria Rossi", "technical_skills": ["Python"]})
+    assert cv.document_type == CV and cv.confidence == 1.0
+
+    bando = classify_document(
+        {"document_type": "CV", "project_title": "Cloud", "required_skills": ["AWS"],
+         "deadline": "2025-03-01", "budget_range": "100k", "key_deliverables": ["Plan"]},
+        source_filename="bando_gara_lotto_2.pdf",
+    )  # fmt: skip
+    assert bando.document_type == BANDO
+
+    assert classify_document("Bando di gara per appalto servizi cloud").document_type == BANDO
+    assert classify_document({"notes": "Not specified"}).document_type == UNKNOWN
+
+
+@pytest.mark.unit
+def test_schema_normalizes_and_reports_errors():
+    """Test that validation coerces extractor output and lists structural errors."""
+    clean, errors = CV_SCHEMA.validate(
+        {
+            "candidate_name": " Maria Rossi ",
+            "contact_info": {"email": "maria@example.com", "phone": "Not specified"},
+            "technical_skills": "Python, SQL;Docker",
+            "certifications": ["AWS SAA", "Not found in document"],
+            "experience_years": 7,
+            "unexpected": "dropped",
+        }
+    )
+    assert errors == []
+    assert clean["candidate_name"] == "Maria Rossi"
+    assert clean["contact_info"] == {"email": "maria@example.com", "phone": "", "location": ""}
+    assert clean["technical_skills"] == ["Python", "SQL", "Docker"]
+    assert clean["certifications"] == ["AWS SAA"]
+    assert clean["experience_years"] == "7"
+    assert "unexpected" not in clean
+
+    _, errors = BANDO_SCHEMA.validate({"required_skills": [{"name": "AWS"}], "team_size": {}})
+    assert errors == [
+        "$.required_skills[0]: expected text, got dict",
+        "$.team_size: expected text, got dict",
+        "$.project_title or $.client_name: required",
+    ]
+
+
+@pytest.mark.unit
+def test_classify_and_save_document(recruitment_db, tmp_path, monkeypatch):
+    """Test that a document is classified, validated and saved in one call."""
+    monkeypatch.chdir(tmp_path)
+    extracted = json.dumps(
+        {
+            "document_type": "CV",
+            "candidate_name": "Maria Rossi",
+            "contact_info": {"location": "Roma"},
+            "technical_skills": "Python, SQL",
+        }
+    )
+    result = classify_and_save_document(extracted, "cv_maria_rossi.pdf")
+    assert result.startswith("✅ Classified as CV")
+    candidate_id = result.rsplit(" ", 1)[1]
+
+    with sqlite3.connect(recruitment_db) as conn:
+        row = conn.execute(
+            "SELECT candidate_name, location, technical_skills FROM candidates WHERE id = ?",
+            (candidate_id,),
+        ).fetchone()
+    assert row[:2] == ("Maria Rossi", "Roma")
+    assert json.loads(row[2]) == ["Python", "SQL"]
+
+    assert classify_and_save_document('{"document_type": "CV"}').startswith(
+        "❌ Validation failed for CV"
+    )
+    assert classify_and_save_document("{}").startswith("❌ Could not determine")
@@ -0,0 +1,69 @@
+"""
+Unit tests for evaluation retention and archival module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from tools.core.evaluation_archive import (
+    RetentionPolicy,
+    load_archived_evaluations,
+    run_maintenance,
+)
+
+NOW = datetime(2025, 6, 1)
+
+
+@pytest.fixture
+def evaluations_db(recruitment_db):
+    """Provide five old evaluations of one pair, one recent and one of another pair."""
+    rows = [("1", "A", 50 + day, "x" * 2000, (NOW - timedelta(days=200 - day))) for day in range(5)]
+    rows.append(("1", "A", 90, "recent", NOW - timedelta(days=1)))
+    rows.append(("2", "A", 70, "only one", NOW - timedelta(days=400)))
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.executemany(
+            "INSERT INTO evaluations (candidate_id, bando_id, match_score, evaluation_summary, "
+            "created_at) VALUES (?, ?, ?, ?, ?)",
+            [(*row[:4], row[4].isoformat()) for row in rows],
+        )
+    return recruitment_db
+
+
+@pytest.mark.unit
+def test_retention_keeps_latest_per_pair_and_recent(evaluations_db):
+    """Test that only evaluations outside both retention rules are archived."""
+    policy = RetentionPolicy(keep_latest=2, keep_days=90)
+
+    dry = run_maintenance(evaluations_db, policy, dry_run=True, now=NOW)
+    assert (dry.archived, dry.remaining) == (4, 3)
+
+    report = run_maintenance(evaluations_db, policy, now=NOW)
+    assert (report.archived, report.remaining) == (4, 3)
+    assert report.reclaimed_bytes >= 0
+    with sqlite3.connect(evaluations_db) as conn:
+        kept = conn.execute("SELECT match_score FROM evaluations ORDER BY evaluation_id").fetchall()
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert [row[0] for row in kept] == [54, 90, 70]
+
+    archived = load_archived_evaluations(evaluations_db, candidate_id="1")
+    assert [row["match_score"] for row in archived] == [53, 52, 51, 50]
+    assert archived[0]["evaluation_summary"] == "x" * 2000
+
+    assert run_maintenance(evaluations_db, policy, now=NOW).archived == 0
+
+
+@pytest.mark.unit
+def test_archive_to_separate_database(evaluations_db, tmp_path):
+    """Test that evaluations can be archived into a separate database file."""
+    archive_path = str(tmp_path / "archive.db")
+    report = run_maintenance(evaluations_db, RetentionPolicy(1, 30), archive_path, now=NOW)
+
+    assert report.archived == 5
+    assert len(load_archived_evaluations(evaluations_db, archive_path=archive_path)) == 5
+    assert load_archived_evaluations(evaluations_db) == []
@@ -0,0 +1,146 @@
+"""
+Unit tests for evaluation work queue module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from tools.core.db_manager_enhanced import format_and_save_processed_data
+from tools.core.evaluation_queue import (
+    MAX_ATTEMPTS,
+    claim_evaluation_jobs,
+    complete_evaluation_job,
+    enqueue_bando_evaluations,
+)
+from tools.core.evaluation_tools import save_evaluation_result
+
+
+def save_document(data):
+    """Save a document through the formatter tool and return its ID."""
+    result = format_and_save_processed_data(json.dumps(data))
+    return result.split("Assigned ID: ")[1].split("\n")[0]
+
+
+@pytest.fixture
+def queue_db(recruitment_db, tmp_path, monkeypatch):
+    """Provide a late bando, an urgent bando and three candidates."""
+    monkeypatch.chdir(tmp_path)
+    for title, deadline in (("Late", "31/12/2999"), ("Urgent", "15 marzo 2998")):
+        save_document(
+            {
+                "document_type": "Bando di Gara",
+                "project_title": title,
+                "required_skills": ["Python", "Kubernetes"],
+                "deadline": deadline,
+            }
+        )
+    for name, skills in (
+        ("Weak", ["Java"]),
+        ("Strong", ["Python", "Kubernetes"]),
+        ("Partial", ["Python"]),
+    ):
+        save_document({"document_type": "CV", "candidate_name": name, "technical_skills": skills})
+    return recruitment_db
+
+
+def claim(worker_id, limit=1, **kwargs):
+    """Claim jobs and return the decoded job list."""
+    return json.loads(claim_evaluation_jobs(worker_id, limit, **kwargs))["jobs"]
+
+
+@pytest.mark.unit
+def test_claims_follow_deadline_then_prerank(queue_db):
+    """Test that the soonest deadline is drained first, best coverage first."""
+    assert "Queued 3 evaluation job(s) for Bando 1 (deadline 2999-12-31)" in (
+        enqueue_bando_evaluations("1")
+    )
+    assert "Queued 2 evaluation job(s)" in enqueue_bando_evaluations("2", min_coverage=0.5)
+    assert "skipped 2 already queued" in enqueue_bando_evaluations("2")
+
+    jobs = claim("evaluator-1", 10)
+    assert [(job["bando_id"], job["candidate_id"]) for job in jobs] == [
+        ("2", "2"),
+        ("2", "3"),
+        ("2", "1"),
+        ("1", "2"),
+        ("1", "3"),
+        ("1", "1"),
+    ]
+    assert jobs[0]["deadline"] == "2998-03-15"
+    assert claim("evaluator-2") == []
+
+
+@pytest.mark.unit
+def test_complete_saves_evaluation_once(queue_db):
+    """Test completion, stale tokens and skipping of evaluated pairs."""
+    save_evaluation_result("1", "1", 40, "Evaluated by hand.")
+    assert "1 already evaluated" in enqueue_bando_evaluations("1")
+
+    job = claim("evaluator-1")[0]
+    assert complete_evaluation_job(job["job_id"], "stale", 90, "Good.").startswith("❌")
+    # Same validation as save_evaluation_result; the job stays leased
+    assert "match_score" in complete_evaluation_job(job["job_id"], job["lease_token"], 101, "?")
+    assert "match_score" in complete_evaluation_job(job["job_id"], job["lease_token"], 85.5, "?")
+    result = complete_evaluation_job(job["job_id"], job["lease_token"], 90, "Good.")
+    assert result.startswith(f"✅ Evaluation job {job['job_id']} completed")
+    assert complete_evaluation_job(job["job_id"], job["lease_token"], 90, "Good.").startswith("❌")
+
+    with sqlite3.connect(queue_db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0] == 2
+    assert "1 already queued, 2 already evaluated" in enqueue_bando_evaluations("1")
+    assert "Queued 2 evaluation job(s)" in enqueue_bando_evaluations("1", reevaluate=True)
+    assert enqueue_bando_evaluations("404").startswith("❌")
+
+
+@pytest.mark.unit
+def test_expired_leases_are_reclaimed_then_failed(queue_db):
+    """Test visibility timeouts and the attempt limit."""
+    enqueue_bando_evaluations("2", min_coverage=1.0)
+    first = claim("evaluator-1", lease_seconds=60, now=1000.0)[0]
+    assert claim("evaluator-2", now=1030.0) == []
+
+    second = claim("evaluator-2", lease_seconds=60, now=1061.0)[0]
+    assert second["job_id"] == first["job_id"]
+    assert second["attempt"] == 2
+    assert complete_evaluation_job(first["job_id"], first["lease_token"], 50, "Late.").startswith(
+        "❌"
+    )
+
+    now = 1061.0
+    for _ in range(MAX_ATTEMPTS - 2):
+        now += 61
+        claim("evaluator-3", lease_seconds=60, now=now)
+    assert claim("evaluator-4", now=now + 61) == []
+    with sqlite3.connect(queue_db) as conn:
+        assert conn.execute("SELECT status FROM evaluation_jobs").fetchone()[0] == "failed"
+    assert "Queued 1 evaluation job(s)" in enqueue_bando_evaluations("2", min_coverage=1.0)
+
+
+@pytest.mark.unit
+def test_parallel_workers_never_share_a_job(queue_db):
+    """Test that concurrent claims hand out each job exactly once."""
+    enqueue_bando_evaluations("1")
+    enqueue_bando_evaluations("2")
+    claimed = []
+
+    def worker(name):
+        while True:
+            jobs = claim(name)
+            if not jobs:
+                return
+            claimed.extend(job["job_id"] for job in jobs)
+
+    threads = [threading.Thread(target=worker, args=(f"evaluator-{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == list(range(1, 7))
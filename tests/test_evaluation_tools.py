@@ -6,9 +6,11 @@ Website: ruslanmv.com
 License: Apache 2.0
 """
 
+import sqlite3
+
 import pytest
 
-from tools.evaluation_tools import initialize_evaluation_database
+from tools.core.evaluation_tools import initialize_evaluation_database, save_evaluation_result
 
 
 @pytest.mark.unit
@@ -16,3 +18,14 @@ def test_initialize_evaluation_database():
     """Test evaluation database initialization."""
     # Should not raise any exceptions
     initialize_evaluation_database()
+
+
+@pytest.mark.unit
+def test_save_evaluation_result_validates_score_only(recruitment_db, tmp_path, monkeypatch):
+    """Test that whole-number floats are stored as integers and IDs are not looked up."""
+    monkeypatch.chdir(tmp_path)
+    assert save_evaluation_result("CAND_1", "BANDO_1", 85.0, "From LLM JSON.").startswith("✅")
+    assert "match_score" in save_evaluation_result("CAND_1", "BANDO_1", 85.5, "Fractional.")
+    assert "match_score" in save_evaluation_result("CAND_1", "BANDO_1", 101, "Out of range.")
+    with sqlite3.connect(recruitment_db) as conn:
+        assert conn.execute("SELECT match_score FROM evaluations").fetchall() == [(85,)]
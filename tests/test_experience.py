@@ -0,0 +1,59 @@
+"""
+Unit tests for experience normalization module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from tools.core.experience import (
+    backfill_experience_ranges,
+    candidates_with_experience,
+    parse_experience_years,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("5+ anni", (5.0, None)),
+        ("circa 10 years", (10.0, 10.0)),
+        ("3-5 anni", (3.0, 5.0)),
+        ("tra 2 e 4 anni", (2.0, 4.0)),
+        ("almeno 7 anni di esperienza", (7.0, None)),
+        ("fino a 2 anni", (0.0, 2.0)),
+        ("18 mesi", (1.5, 1.5)),
+        ("6-12 mesi", (0.5, 1.0)),
+        ("2015-2020", (5.0, 5.0)),
+        ("dal 2015", (float(datetime.now().year - 2015), None)),
+        ("dieci anni", (10.0, 10.0)),
+        ("Junior", (None, None)),
+        ("", (None, None)),
+    ],
+)
+def test_parse_experience_years(text, expected):
+    """Test parsing of Italian and English experience statements."""
+    assert parse_experience_years(text) == expected
+
+
+@pytest.mark.unit
+def test_backfill_and_range_filter(recruitment_db):
+    """Test that existing rows are backfilled and filtered through the index."""
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.executemany(
+            "INSERT INTO candidates (id, experience_years) VALUES (?, ?)",
+            [("1", "3 anni"), ("2", "oltre 8 anni"), ("3", "n/d")],
+        )
+        assert backfill_experience_ranges(conn.cursor()) == 2
+        assert candidates_with_experience(conn, min_years=7) == ["2"]
+
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM candidates WHERE experience_years_min >= 7"
+        ).fetchall()
+        assert "idx_candidates_experience_years_min" in str(plan)
@@ -0,0 +1,102 @@
+"""
+Unit tests for streaming NDJSON export module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import gzip
+import io
+import json
+import sqlite3
+import tracemalloc
+
+import pytest
+
+from tools.core.export import export_ndjson
+
+
+def _add_candidates(db_path, start, count):
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO candidates (id, candidate_name, technical_skills, consulting_experience) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (str(i), f"Candidate {i}", '["Python", "SQL"]', "Consulting " * 50)
+                for i in range(start, start + count)
+            ],
+        )
+
+
+class _NullStream(io.RawIOBase):
+    """Writable binary stream that discards its input."""
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return len(data)
+
+
+@pytest.mark.unit
+def test_export_writes_one_decoded_record_per_line(recruitment_db, tmp_path):
+    """Test NDJSON output to a stream and to a gzip file."""
+    _add_candidates(recruitment_db, 1, 3)
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.execute("INSERT INTO bando_di_gara (id, project_title) VALUES ('1', 'Cloud')")
+
+    stream = io.BytesIO()
+    counts = export_ndjson(stream, db_path=recruitment_db, batch_size=2)
+    lines = [json.loads(line) for line in stream.getvalue().decode("utf-8").splitlines()]
+    assert counts == {"candidates": 3, "bando_di_gara": 1, "evaluations": 0}
+    assert [(r["_table"], r["id"]) for r in lines] == [
+        ("candidates", "1"),
+        ("candidates", "2"),
+        ("candidates", "3"),
+        ("bando_di_gara", "1"),
+    ]
+    assert lines[0]["technical_skills"] == ["Python", "SQL"]
+
+    path = tmp_path / "export.ndjson.gz"
+    assert export_ndjson(str(path), ["bando_di_gara"], recruitment_db) == {"bando_di_gara": 1}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert json.loads(f.read())["project_title"] == "Cloud"
+
+    with pytest.raises(ValueError, match="Unknown table"):
+        export_ndjson(io.BytesIO(), ["users"], recruitment_db)
+
+
+@pytest.mark.unit
+def test_export_memory_does_not_grow_with_table_size(recruitment_db):
+    """Test that peak memory is bounded by the batch size, not the row count."""
+
+    def peak(db_path):
+        tracemalloc.start()
+        export_ndjson(_NullStream(), ["candidates"], db_path, batch_size=50)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak_bytes
+
+    _add_candidates(recruitment_db, 1, 200)
+    small = peak(recruitment_db)
+    _add_candidates(recruitment_db, 201, 3000)
+    large = peak(recruitment_db)
+    assert large < small * 2
+
+
+@pytest.mark.unit
+def test_export_reads_every_table_from_one_snapshot(recruitment_db):
+    """Test that rows committed while a table is being written are not exported."""
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+    _add_candidates(recruitment_db, 1, 2)
+
+    class _WritingStream(_NullStream):
+        def write(self, data):
+            with sqlite3.connect(recruitment_db, timeout=0) as writer:
+                writer.execute("INSERT INTO bando_di_gara (id) VALUES (?)", (str(len(data)),))
+            return len(data)
+
+    counts = export_ndjson(_WritingStream(), ["candidates", "bando_di_gara"], recruitment_db)
+    assert counts == {"candidates": 2, "bando_di_gara": 0}
@@ -0,0 +1,138 @@
+"""
+Unit tests for faceted candidate filtering module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from tools.core.facet_index import (
+    FacetIndex,
+    facet_values,
+    index_candidate_facets,
+)
+
+
+@pytest.mark.unit
+def test_facet_values_normalization():
+    """Test that raw fields map to canonical facet values."""
+    assert facet_values("location", "Milan, Italy / Remote") == {"milano", "italy", "remote"}
+    assert facet_values("languages", json.dumps(["Inglese (C1)", "Italiano - madrelingua"])) == {
+        "english",
+        "italian",
+    }
+    assert facet_values("location", None) == set()
+
+
+@pytest.fixture
+def facet_db(recruitment_db):
+    """Provide a database with three indexed candidates."""
+    rows = [
+        ("1", "Milano", ["Inglese C1"], ["AWS Certified Solutions Architect"]),
+        ("2", "Roma", ["English", "French"], ["PMP"]),
+        ("3", "Remote", ["Italian"], ["AWS Certified Developer"]),
+    ]
+    with sqlite3.connect(recruitment_db) as conn:
+        cursor = conn.cursor()
+        for candidate_id, location, languages, certifications in rows:
+            record = {
+                "id": candidate_id,
+                "location": location,
+                "languages": json.dumps(languages),
+                "certifications": json.dumps(certifications),
+            }
+            cursor.execute(
+                "INSERT INTO candidates (id, location, languages, certifications) "
+                "VALUES (:id, :location, :languages, :certifications)",
+                record,
+            )
+            index_candidate_facets(cursor, cursor.lastrowid, record)
+    return recruitment_db
+
+
+def _ids(db_path, rowids):
+    with sqlite3.connect(db_path) as conn:
+        return sorted(
+            conn.execute(f"SELECT id FROM candidates WHERE rowid = {rowid}").fetchone()[0]
+            for rowid in rowids
+        )
+
+
+@pytest.mark.unit
+def test_query_combines_or_within_and_across_facets(facet_db):
+    """Test OR within a facet, AND across facets, and counts over the result."""
+    index = FacetIndex(facet_db)
+    try:
+        result = index.query({"location": ["Milan", "Remote"], "certifications": ["AWS"]})
+        assert _ids(facet_db, result["rowids"]) == ["1", "3"]
+
+        result = index.query({"location": ["Milan", "Rome"], "languages": ["English"]})
+        assert _ids(facet_db, result["rowids"]) == ["1", "2"]
+        assert result["counts"]["languages"] == {"english": 2, "french": 1}
+
+        assert index.query({"languages": ["German"]})["rowids"] == []
+    finally:
+        index.close()
+
+
+def _stored_facets(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT * FROM candidate_facets ORDER BY facet, value").fetchall()
+
+
+@pytest.mark.unit
+def test_changes_that_bypass_the_index_are_served_read_only(facet_db):
+    """Test that updates and same-count delete+insert are seen without writing the index."""
+    index = FacetIndex(facet_db)
+    try:
+        assert len(index.query({})["rowids"]) == 3
+        stored = _stored_facets(facet_db)
+        with sqlite3.connect(facet_db) as conn:
+            conn.execute("UPDATE candidates SET location = 'Torino' WHERE id = '1'")
+            conn.execute("DELETE FROM candidates WHERE id = '2'")
+            conn.execute(
+                "INSERT INTO candidates (id, location, languages) VALUES (?, ?, ?)",
+                ("4", "Napoli", json.dumps(["Spanish"])),
+            )
+        assert _ids(facet_db, index.query({"location": ["Turin"]})["rowids"]) == ["1"]
+        assert index.query({"location": ["Milan", "Rome"]})["rowids"] == []
+        assert _ids(facet_db, index.query({"languages": ["Spanish"]})["rowids"]) == ["4"]
+        assert _stored_facets(facet_db) == stored
+
+        with sqlite3.connect(facet_db) as conn:
+            cursor = conn.cursor()
+            record = {"id": "5", "location": "Roma"}
+            cursor.execute("INSERT INTO candidates (id, location) VALUES (:id, :location)", record)
+            index_candidate_facets(cursor, cursor.lastrowid, record)
+        assert _stored_facets(facet_db) != stored
+        assert _ids(facet_db, index.query({"location": ["Turin", "Rome"]})["rowids"]) == ["1", "5"]
+    finally:
+        index.close()
+
+
+@pytest.mark.unit
+def test_filter_candidates_lists_newest_first_with_offset(facet_db, tmp_path, monkeypatch):
+    """Test that the tool pages through every match, newest candidates first."""
+    from tools.core.facet_index import filter_candidates
+
+    monkeypatch.chdir(tmp_path)
+    with sqlite3.connect(facet_db) as conn:
+        cursor = conn.cursor()
+        for candidate_id in ("4", "5"):
+            record = {"id": candidate_id, "location": "Milano"}
+            cursor.execute("INSERT INTO candidates (id, location) VALUES (:id, :location)", record)
+            index_candidate_facets(cursor, cursor.lastrowid, record)
+
+    first = json.loads(filter_candidates(limit=2))
+    assert [c["id"] for c in first["candidates"]] == ["5", "4"]
+    assert (first["total"], first["next_offset"]) == (5, 2)
+    second = json.loads(filter_candidates(limit=2, offset=2))
+    assert [c["id"] for c in second["candidates"]] == ["3", "2"]
+    last = json.loads(filter_candidates(limit=2, offset=4))
+    assert [c["id"] for c in last["candidates"]] == ["1"]
+    assert last["next_offset"] is None
@@ -0,0 +1,101 @@
+"""
+Unit tests for tool profiling module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import glob
+import json
+import os
+
+import pytest
+
+from tools.cli import main
+from tools.core.profiling import load_captures, profiled, sample_rate, summarize
+
+
+@profiled
+def build_payload(text: str, repeat: int = 1000) -> str:
+    """Allocate a payload proportional to the arguments."""
+    return json.dumps([text] * repeat)
+
+
+@profiled
+def broken_tool(text: str) -> str:
+    """Fail after receiving an argument."""
+    raise ValueError(text)
+
+
+@pytest.fixture
+def capture_dir(tmp_path, monkeypatch):
+    """Point the capture directory to a temporary path."""
+    directory = str(tmp_path / "profiles")
+    monkeypatch.setenv("RECRUITMENT_PROFILE_DIR", directory)
+    return directory
+
+
+@pytest.mark.unit
+def test_sample_rate(monkeypatch):
+    """Test parsing of the opt-in variable."""
+    monkeypatch.delenv("RECRUITMENT_PROFILE", raising=False)
+    assert sample_rate() == 0.0
+    for value, expected in (("true", 1.0), ("0.25", 0.25), ("7", 1.0), ("off", 0.0), ("x", 0.0)):
+        monkeypatch.setenv("RECRUITMENT_PROFILE", value)
+        assert sample_rate() == expected
+
+
+@pytest.mark.unit
+def test_disabled_profiling_writes_nothing(capture_dir, monkeypatch):
+    """Test that the decorator is a pass-through by default."""
+    monkeypatch.delenv("RECRUITMENT_PROFILE", raising=False)
+    assert build_payload("abc", 2) == '["abc", "abc"]'
+    assert build_payload.__name__ == "build_payload"
+    assert not os.path.exists(capture_dir)
+
+
+@pytest.mark.unit
+def test_capture_records_sizes_not_values(capture_dir, monkeypatch):
+    """Test the capture summary, error propagation and the .prof file."""
+    monkeypatch.setenv("RECRUITMENT_PROFILE", "1")
+    result = build_payload("secret-cv-text", repeat=5000)
+    with pytest.raises(ValueError):
+        broken_tool("boom")
+
+    captures = {c["tool"]: c for c in load_captures(capture_dir)}
+    capture = captures["build_payload"]
+    assert capture["arg_sizes"] == {"text": 14, "repeat": 4}
+    assert capture["result_size"] == len(result)
+    assert capture["peak_kb"] >= len(result) / 1024
+    assert capture["top_functions"]
+    assert os.path.exists(os.path.join(capture_dir, capture["id"] + ".prof"))
+    assert captures["broken_tool"]["error"] == "ValueError"
+    for path in glob.glob(os.path.join(capture_dir, "*.json")):
+        with open(path, encoding="utf-8") as f:
+            assert "secret-cv-text" not in f.read()
+
+
+@pytest.mark.unit
+def test_rotation_and_aggregation(capture_dir, monkeypatch, capsys):
+    """Test that only the newest captures are kept and the CLI summary."""
+    monkeypatch.setenv("RECRUITMENT_PROFILE", "1")
+    monkeypatch.setenv("RECRUITMENT_PROFILE_KEEP", "3")
+    monkeypatch.setenv("RECRUITMENT_PROFILE_MEMORY", "0")
+    for _ in range(5):
+        build_payload("x")
+
+    captures = load_captures(capture_dir)
+    assert len(captures) == 3
+    assert len(glob.glob(os.path.join(capture_dir, "*.prof"))) == 3
+    profile = summarize(captures)["build_payload"]
+    assert profile.captures == 3
+    assert profile.median_peak_kb is None
+    assert profile.median_arg_bytes == 1
+
+    assert main(["profiles", "--tool", "build_payload", "--baseline", capture_dir]) == 0
+    output = capsys.readouterr().out
+    assert "build_payload" in output
+    assert "+0%" in output
+    assert "Top functions by cumulative time (3 capture(s))" in output
+    assert main(["profiles", "--dir", os.path.join(capture_dir, "missing")]) == 2
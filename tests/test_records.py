@@ -0,0 +1,74 @@
+"""
+Unit tests for row codec module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from tools.core.records import CANDIDATE_RECORDS, RecordCodec
+
+
+@pytest.fixture
+def cursor():
+    """Provide a cursor over an in-memory candidates table."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE candidates (id TEXT, candidate_name TEXT, technical_skills TEXT)")
+    conn.executemany(
+        "INSERT INTO candidates VALUES (?, ?, ?)",
+        [("1", "Maria Rossi", json.dumps(["Python", "SQL"])), ("2", "Luca Bianchi", "n/a")],
+    )
+    yield conn.cursor()
+    conn.close()
+
+
+@pytest.mark.unit
+def test_record_access_by_name(cursor):
+    """Test attribute and item access, with JSON columns decoded."""
+    cursor.execute("SELECT * FROM candidates ORDER BY id")
+    first, second = CANDIDATE_RECORDS.fetchall(cursor)
+    assert first.candidate_name == first["candidate_name"] == "Maria Rossi"
+    assert first.technical_skills == ["Python", "SQL"]
+    assert first.raw("technical_skills") == '["Python", "SQL"]'
+    assert second.technical_skills == "n/a"  # invalid JSON is kept as stored
+    assert first.get("source_filename", "-") == "-"
+    assert first.to_dict() == {
+        "id": "1",
+        "candidate_name": "Maria Rossi",
+        "technical_skills": ["Python", "SQL"],
+    }
+    with pytest.raises(AttributeError):
+        first.missing_column
+
+
+@pytest.mark.unit
+def test_json_decoded_lazily_and_once(cursor):
+    """Test that JSON is parsed on first access only."""
+    cursor.execute("SELECT * FROM candidates WHERE id = '1'")
+    record = CANDIDATE_RECORDS.fetchone(cursor)
+    assert record._decoded is None
+    assert record.candidate_name == "Maria Rossi"
+    assert record._decoded is None
+    assert record.technical_skills is record.technical_skills
+    assert not hasattr(record, "__dict__")
+
+
+@pytest.mark.unit
+def test_record_type_follows_query_columns(cursor):
+    """Test that record classes are cached per column layout."""
+    codec = RecordCodec("candidates", ("technical_skills",))
+    cursor.execute("SELECT * FROM candidates")
+    full = codec.record_type(cursor.description)
+    assert codec.record_type(cursor.description) is full
+    cursor.execute("SELECT candidate_name, id FROM candidates")
+    record = codec.fetchone(cursor)
+    assert type(record) is not full
+    assert record.keys() == ("candidate_name", "id")
+    cursor.execute("SELECT * FROM candidates WHERE id = 'missing'")
+    assert codec.fetchone(cursor) is None
+    assert codec.fetchall(cursor) == []
@@ -0,0 +1,84 @@
+"""
+Unit tests for token-budget response shaping module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import pytest
+
+from tools.core.response_budget import (
+    BANDO_POLICY,
+    listing_payload,
+    paginate_blocks,
+    shape_record,
+    shape_records,
+)
+
+
+def _bando(i, description_words=20):
+    return {
+        "id": str(i),
+        "project_title": f"Project {i}",
+        "project_description": "word " * description_words,
+        "key_deliverables": [f"Deliverable {n}" for n in range(5)],
+    }
+
+
+@pytest.mark.unit
+def test_small_results_are_unchanged():
+    """Test that results within budget keep their plain list shape."""
+    records = [_bando(i) for i in range(3)]
+    assert listing_payload(records, BANDO_POLICY, max_tokens=4000) == records
+
+
+@pytest.mark.unit
+def test_degrades_fields_before_paginating():
+    """Test truncation, then dropped fields, then pagination."""
+    records = [_bando(i, description_words=200) for i in range(10)]
+
+    truncated = shape_records(records, BANDO_POLICY, max_tokens=2500)
+    assert truncated.truncated == ["project_description"]
+    assert truncated.dropped == [] and truncated.next_offset is None
+
+    dropped = shape_records(records, BANDO_POLICY, max_tokens=1400)
+    assert "key_deliverables" in dropped.dropped
+    assert dropped.next_offset is None
+    assert all("key_deliverables" not in item for item in dropped.items)
+
+    paged = shape_records(records, BANDO_POLICY, max_tokens=150)
+    assert 1 <= len(paged.items) < 10
+    assert paged.next_offset == len(paged.items)
+    report = paged.omissions("get_info_bando(bando_id=...)")
+    assert report["remaining_records"] == 10 - len(paged.items)
+    assert f"offset={paged.next_offset}" in report["how_to_fetch"]
+
+    rest = shape_records(records, BANDO_POLICY, max_tokens=150, offset=paged.next_offset)
+    assert rest.items[0]["id"] == str(paged.next_offset)
+
+
+@pytest.mark.unit
+def test_zero_budget_disables_shaping():
+    """Test that max_tokens=0 returns everything."""
+    records = [_bando(i, description_words=500) for i in range(5)]
+    page = shape_records(records, BANDO_POLICY, max_tokens=0)
+    assert page.items == records and not page.shaped
+
+
+@pytest.mark.unit
+def test_shape_record_reports_omissions():
+    """Test that a single oversized record is reduced and the reduction explained."""
+    record, omitted = shape_record(_bando(1, description_words=2000), BANDO_POLICY, 100)
+    assert record["project_title"] == "Project 1"
+    assert omitted["dropped_fields"]
+    assert "max_tokens=0" in omitted["how_to_fetch"]
+
+
+@pytest.mark.unit
+def test_paginate_blocks():
+    """Test that Markdown blocks are paginated and at least one is returned."""
+    blocks = ["x" * 400] * 5  # 100 tokens each
+    assert paginate_blocks(blocks, max_tokens=250) == (blocks[:2], 2)
+    assert paginate_blocks(blocks, max_tokens=250, offset=4) == (blocks[4:], None)
+    assert paginate_blocks(blocks, max_tokens=10) == (blocks[:1], 1)
@@ -0,0 +1,118 @@
+"""
+Unit tests for query result cache module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from tools.core import result_cache
+from tools.core.evaluation_tools import get_evaluation_results, save_evaluation_result
+from tools.core.result_cache import RESULT_CACHE, ResultCache
+
+
+@pytest.fixture
+def evaluation_db(recruitment_db, tmp_path, monkeypatch):
+    """Provide two saved evaluations in the working directory database and a cold cache."""
+    monkeypatch.chdir(tmp_path)
+    save_evaluation_result("CAND_1", "BANDO_1", 80, "Strong Python match")
+    save_evaluation_result("CAND_2", "BANDO_1", 55, "Partial match")
+    RESULT_CACHE.clear()
+    RESULT_CACHE.reset_stats()
+    yield recruitment_db
+    RESULT_CACHE.clear()
+
+
+@pytest.mark.unit
+def test_repeated_query_is_served_from_cache(evaluation_db):
+    """Test hits for the same normalized filters and the hit-rate statistics."""
+    first = get_evaluation_results(candidate_id="CAND_1")
+    assert get_evaluation_results(candidate_id="CAND_1") == first
+    assert get_evaluation_results(evaluation_id=1) == get_evaluation_results(evaluation_id="1")
+
+    stats = RESULT_CACHE.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 2, 2)
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.unit
+def test_writes_to_the_table_invalidate_entries(evaluation_db):
+    """Test that saves and deletes from another connection are never served stale."""
+    assert len(json.loads(get_evaluation_results(bando_id="BANDO_1"))) == 2
+
+    save_evaluation_result("CAND_3", "BANDO_1", 70, "Good match")
+    assert len(json.loads(get_evaluation_results(bando_id="BANDO_1"))) == 3
+
+    with sqlite3.connect(evaluation_db) as conn:
+        conn.execute("DELETE FROM evaluations WHERE candidate_id = 'CAND_2'")
+    assert len(json.loads(get_evaluation_results(bando_id="BANDO_1"))) == 2
+    assert RESULT_CACHE.stats()["stale"] == 2
+
+
+@pytest.mark.unit
+def test_writes_to_other_tables_keep_entries(evaluation_db):
+    """Test that a commit to the candidates table does not invalidate evaluations."""
+    get_evaluation_results(candidate_id="CAND_1")
+    with sqlite3.connect(evaluation_db) as conn:
+        conn.execute("INSERT INTO candidates (id, candidate_name) VALUES ('9', 'New Candidate')")
+
+    get_evaluation_results(candidate_id="CAND_1")
+    assert RESULT_CACHE.stats()["hits"] == 1
+    assert RESULT_CACHE.stats()["stale"] == 0
+
+
+@pytest.mark.unit
+def test_size_limit_and_ttl(evaluation_db, monkeypatch):
+    """Test LRU eviction, TTL expiry and that a size of 0 disables caching."""
+    cache = ResultCache(max_entries=2, ttl=60)
+    calls = []
+
+    def compute(key):
+        return lambda: calls.append(key) or key
+
+    clock = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: clock[0])
+    for key in ("a", "b", "a", "c", "a", "b"):
+        cache.get_or_compute(evaluation_db, "evaluations", key, compute(key))
+    assert calls == ["a", "b", "c", "b"]  # "b" was least recently used when "c" arrived
+    assert cache.stats()["evictions"] == 2
+
+    clock[0] += 61
+    cache.get_or_compute(evaluation_db, "evaluations", "a", compute("a"))
+    assert cache.stats()["expired"] == 1
+
+    cache.configure(max_entries=0)
+    cache.get_or_compute(evaluation_db, "evaluations", "a", compute("a"))
+    cache.get_or_compute(evaluation_db, "evaluations", "a", compute("a"))
+    assert calls[-2:] == ["a", "a"]
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.unit
+def test_change_feed_reads_through_the_snapshot(evaluation_db, monkeypatch):
+    """Test that ``since`` and cached listings both read through read_connection."""
+    from tools.core import db_connection
+
+    opened = []
+    real_read_connection = db_connection.read_connection
+
+    def tracking_read_connection(db_path=db_connection.DB_PATH):
+        opened.append(db_path)
+        return real_read_connection(db_path)
+
+    monkeypatch.setattr(db_connection, "_snapshots", {})
+    monkeypatch.setenv(db_connection.SNAPSHOT_ENV_VAR, "1")
+    monkeypatch.setattr("tools.core.evaluation_tools.read_connection", tracking_read_connection)
+    try:
+        delta = json.loads(get_evaluation_results(bando_id="BANDO_1", since=0))
+        assert len(delta["changed"]) == 2
+        assert len(json.loads(get_evaluation_results(bando_id="BANDO_1"))) == 2
+        assert len(opened) == 2
+    finally:
+        for snapshot in db_connection._snapshots.values():
+            snapshot.close()
@@ -0,0 +1,52 @@
+"""
+Unit tests for database schema setup module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from tools.core.schema import init_schema
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.unit
+def test_import_does_not_touch_database_and_init_schema_creates_it(tmp_path):
+    """Test that core imports leave the working directory alone until init_schema runs."""
+    modules = ["db_manager", "db_manager_enhanced", "evaluation_queue", "evaluation_tools"]
+    modules += ["facet_index", "skill_dictionary", "skill_gaps", "skill_matching"]
+    result = subprocess.run(
+        [sys.executable, "-c", "; ".join(f"import tools.core.{name}" for name in modules)],
+        cwd=tmp_path,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "" and os.listdir(tmp_path) == []
+
+    db_path = str(tmp_path / "recruitment.db")
+    init_schema(db_path)
+    init_schema(db_path, force=True)
+    with sqlite3.connect(db_path) as conn:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert {
+        "candidates",
+        "bando_di_gara",
+        "evaluations",
+        "change_log",
+        "skills",
+        "entity_skills",
+        "candidate_facets",
+        "skill_embeddings",
+        "skill_gaps",
+        "evaluation_jobs",
+    } <= tables
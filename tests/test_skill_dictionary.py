@@ -0,0 +1,75 @@
+"""
+Unit tests for canonical skill dictionary module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import pytest
+
+from tools.core.skill_dictionary import (
+    AhoCorasick,
+    build_skill_profile,
+    canonicalize_labels,
+    extract_skill_ids,
+    lookup_skill,
+    normalize_label,
+)
+
+
+@pytest.mark.unit
+def test_aho_corasick_leftmost_longest_on_word_boundaries():
+    """Test that matches respect word boundaries and prefer the longest pattern."""
+    matcher = AhoCorasick({"machine": 1, "machine learning": 2, "java": 3, "learning": 4})
+    text = normalize_label("Machine Learning and JavaScript")
+    assert [value for _, _, value in matcher.find(text)] == [2]
+
+
+@pytest.mark.unit
+def test_canonicalize_labels_resolves_aliases():
+    """Test that aliases in Italian and English map to one canonical skill."""
+    names, ids = canonicalize_labels(
+        ["k8s", "Kubernetes", "Apprendimento automatico", "ML", "Cobol programming", "Unknown X"]
+    )
+    assert names == ["Kubernetes", "Machine Learning", "Cobol programming", "Unknown X"]
+    assert ids == [lookup_skill("kubernetes"), lookup_skill("ml"), lookup_skill("cobol")]
+
+
+@pytest.mark.unit
+def test_canonicalize_labels_keeps_labels_that_are_not_aliases():
+    """Test that embedded skills only add IDs and ambiguous aliases are not matched inside labels."""
+    labels = [
+        "Go-to-market strategy",
+        "R&D management",
+        "Microsoft Office (Excel, Word, PowerPoint)",
+        "Spark AR",
+    ]
+    names, ids = canonicalize_labels(labels)
+    assert names == labels
+    assert lookup_skill("go") not in ids and lookup_skill("r") not in ids
+    assert lookup_skill("excel") in ids
+
+
+@pytest.mark.unit
+def test_extract_skill_ids_skips_ambiguous_words():
+    """Test that short ambiguous aliases are not extracted from prose."""
+    text = (
+        "Ai sensi del bando, il team userà Python e Terraform su larga scala per andare in Go-live"
+    )
+    assert extract_skill_ids(text) == [lookup_skill("python"), lookup_skill("terraform")]
+
+
+@pytest.mark.unit
+def test_build_skill_profile_enriches_from_text():
+    """Test that skills found only in free text are added to the profile."""
+    profile = build_skill_profile(
+        ["Python", "k8s"],
+        ["PMP"],
+        ("Ha guidato la migrazione su AWS con Docker", ["Introdotto Python in produzione"]),
+    )
+    assert profile.skills == ["Python", "Kubernetes", "AWS", "Docker"]
+    assert profile.certifications == ["PMP"]
+    assert profile.skill_ids[lookup_skill("aws")] == "extracted"
+    assert profile.skill_ids[lookup_skill("python")] == "listed"
+    assert profile.skill_ids[lookup_skill("pmp")] == "certification"
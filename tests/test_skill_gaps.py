@@ -0,0 +1,169 @@
+"""
+Unit tests for skill-gap matrix module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+from datetime import date
+
+import pytest
+
+from tools.core.db_manager_enhanced import format_and_save_processed_data
+from tools.core import skill_gaps
+from tools.core.skill_gaps import (
+    Requirements,
+    compute_gap,
+    get_skill_gaps,
+    is_open,
+    pack_ids,
+    parse_deadline,
+    rebuild_skill_gaps,
+    unpack_ids,
+)
+
+
+@pytest.fixture
+def gap_db(recruitment_db, tmp_path, monkeypatch):
+    """Provide an open bando and a closed bando in the working directory database."""
+    monkeypatch.chdir(tmp_path)
+    for title, deadline in (("Cloud Platform", "31/12/2999"), ("Legacy Migration", "2001-01-31")):
+        format_and_save_processed_data(
+            json.dumps(
+                {
+                    "document_type": "Bando di Gara",
+                    "project_title": title,
+                    "required_skills": ["Python", "K8s", "Quantum Basketweaving"],
+                    "certifications_required": ["CKA"],
+                    "deadline": deadline,
+                }
+            )
+        )
+    return recruitment_db
+
+
+def save_candidate(name, skills, certifications=()):
+    """Save a CV through the formatter tool and return its ID."""
+    result = format_and_save_processed_data(
+        json.dumps(
+            {
+                "document_type": "CV",
+                "candidate_name": name,
+                "technical_skills": skills,
+                "certifications": list(certifications),
+            }
+        )
+    )
+    return result.split("Assigned ID: ")[1].split("\n")[0]
+
+
+@pytest.mark.unit
+def test_parse_deadline_and_is_open():
+    """Test ISO, day-first and written Italian/English deadlines."""
+    assert parse_deadline("2025-03-15") == date(2025, 3, 15)
+    assert parse_deadline("entro il 15/03/2025 ore 12") == date(2025, 3, 15)
+    assert parse_deadline("Scadenza: 15 marzo 2025") == date(2025, 3, 15)
+    assert parse_deadline("15 Mar. 2025") == date(2025, 3, 15)
+    assert parse_deadline("31/02/2025") is None
+    assert parse_deadline("Not specified") is None
+
+    today = date(2025, 3, 15)
+    assert is_open("15/03/2025", today)
+    assert not is_open("14/03/2025", today)
+    assert is_open("Not specified", today)
+
+
+@pytest.mark.unit
+def test_compute_gap_and_packing():
+    """Test the set arithmetic and the compact ID encoding."""
+    gap = compute_gap(Requirements(frozenset({101, 205}), frozenset({906})), {101, 999})
+    assert gap.matched_skills == [101]
+    assert gap.missing_skills == [205]
+    assert gap.missing_certifications == [906]
+    assert gap.coverage == pytest.approx(1 / 3, abs=1e-4)
+    assert compute_gap(Requirements(frozenset(), frozenset()), {101}).coverage is None
+
+    assert unpack_ids(pack_ids([906, 101])) == [101, 906]
+    assert len(pack_ids([101, 205, 906])) == 6
+
+
+@pytest.mark.unit
+def test_candidate_insert_refreshes_open_bandos_only(gap_db):
+    """Test that rows are written on insert for open bandos and read back by the tool."""
+    strong = save_candidate("Maria Rossi", ["Python", "Kubernetes"], ["CKA"])
+    weak = save_candidate("Luca Bianchi", ["python3", "Java"])
+
+    with sqlite3.connect(gap_db) as conn:
+        rows = conn.execute("SELECT bando_id, candidate_id FROM skill_gaps").fetchall()
+    assert sorted(rows) == [("1", strong), ("1", weak)]
+
+    payload = json.loads(get_skill_gaps("1"))
+    assert payload["open"] is True
+    assert payload["required_skills"] == ["Python", "Kubernetes"]
+    assert payload["required_certifications"] == ["Certified Kubernetes Administrator"]
+    assert payload["unrecognized_requirements"] == ["Quantum Basketweaving"]
+    assert [c["candidate_id"] for c in payload["candidates"]] == [strong, weak]
+    assert payload["candidates"][0]["coverage"] == 1.0
+    assert payload["candidates"][1] == {
+        "candidate_id": weak,
+        "candidate_name": "Luca Bianchi",
+        "coverage": pytest.approx(1 / 3, abs=1e-4),
+        "matched_skills": ["Python"],
+        "missing_skills": ["Kubernetes"],
+        "missing_certifications": ["Certified Kubernetes Administrator"],
+    }
+
+    only_weak = json.loads(get_skill_gaps("1", f"{weak}, 404"))
+    assert [c["candidate_id"] for c in only_weak["candidates"]] == [weak]
+    assert only_weak["not_found"] == ["404"]
+    assert get_skill_gaps("99").startswith("❌")
+
+
+@pytest.mark.unit
+def test_closed_bando_is_computed_on_read_and_pruned_on_rebuild(gap_db):
+    """Test that reads compute missing rows without storing them and rebuilds prune."""
+    candidate_id = save_candidate("Maria Rossi", ["Python"])
+    other_id = save_candidate("Luca Bianchi", ["Python", "Kubernetes"])
+
+    payload = json.loads(get_skill_gaps("2"))
+    assert payload["open"] is False
+    assert [c["candidate_id"] for c in payload["candidates"]] == [other_id, candidate_id]
+    assert payload["total_candidates"] == 2
+    assert json.loads(get_skill_gaps("2", candidate_id))["candidates"][0]["matched_skills"] == [
+        "Python"
+    ]
+    with sqlite3.connect(gap_db) as conn:
+        assert conn.execute("SELECT DISTINCT bando_id FROM skill_gaps").fetchall() == [("1",)]
+
+    report = rebuild_skill_gaps(gap_db, today=date(3000, 1, 1))
+    assert (report.bandos, report.rows, report.pruned) == (0, 0, 2)
+    with sqlite3.connect(gap_db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM skill_gaps").fetchone()[0] == 0
+
+
+@pytest.mark.unit
+def test_candidate_inserts_reuse_the_bando_catalog(gap_db, monkeypatch):
+    """Test that deadlines are parsed once per bando generation, not once per insert."""
+    parsed = []
+    real_parse = skill_gaps.parse_deadline
+    monkeypatch.setattr(
+        skill_gaps, "parse_deadline", lambda text: parsed.append(text) or real_parse(text)
+    )
+
+    save_candidate("Maria Rossi", ["Python"])
+    save_candidate("Luca Bianchi", ["Java"])
+    assert len(parsed) == 2  # Both bandos, on the first insert only
+
+    with sqlite3.connect(gap_db) as conn:
+        conn.execute("UPDATE bando_di_gara SET deadline = '2001-01-01' WHERE id = '1'")
+    parsed.clear()
+    third = save_candidate("Anna Verdi", ["Python"])
+    assert len(parsed) == 2
+    with sqlite3.connect(gap_db) as conn:
+        rows = conn.execute(
+            "SELECT bando_id FROM skill_gaps WHERE candidate_id = ?", (third,)
+        ).fetchall()
+    assert rows == []
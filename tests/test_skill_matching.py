@@ -0,0 +1,126 @@
+"""
+Unit tests for semantic skill matching module.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from tools.core.skill_matching import (
+    IVFIndex,
+    embed_terms,
+    nearest_candidates,
+    pack_vector,
+    refresh_embeddings,
+    unpack_vector,
+)
+
+
+def _similarity(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+@pytest.mark.unit
+def test_embedding_matches_abbreviations():
+    """Test that known abbreviations embed identically to their full names."""
+    k8s = embed_terms([("K8s", 1.0), ("ML", 1.0)])
+    full = embed_terms([("Kubernetes", 1.0), ("Machine Learning", 1.0)])
+    unrelated = embed_terms([("Accounting", 1.0)])
+    assert _similarity(k8s, full) == pytest.approx(1.0, abs=1e-5)
+    assert _similarity(k8s, unrelated) < 0.5
+
+
+@pytest.mark.unit
+def test_pack_vector_roundtrip():
+    """Test float32 blob packing."""
+    vec = embed_terms([("Python", 1.0)])
+    blob = pack_vector(vec)
+    assert len(blob) == 4 * len(vec)
+    assert unpack_vector(blob) == vec
+
+
+@pytest.mark.unit
+def test_ivf_index_finds_exact_match():
+    """Test that the IVF index returns the stored vector closest to the query."""
+    skills = ["Python", "Java", "Kubernetes", "SAP", "React", "Terraform", "Excel", "COBOL"]
+    items = {str(i): embed_terms([(skill, 1.0)]) for i, skill in enumerate(skills)}
+    index = IVFIndex(nprobe=1).build(items)
+    assert len(index) == len(skills)
+    best_id, score = index.search(embed_terms([("k8s", 1.0)]), top_k=1)[0]
+    assert best_id == "2"
+    assert score == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.unit
+def test_nearest_candidates_ranks_by_skills(recruitment_db):
+    """Test end-to-end matching of a tender against stored candidates."""
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.execute(
+            "INSERT INTO candidates (id, candidate_name, technical_skills) VALUES (?, ?, ?)",
+            ("1", "Maria Rossi", json.dumps(["K8s", "Python", "ML"])),
+        )
+        conn.execute(
+            "INSERT INTO candidates (id, candidate_name, technical_skills) VALUES (?, ?, ?)",
+            ("2", "Luca Bianchi", json.dumps(["SAP", "Excel"])),
+        )
+        conn.execute(
+            "INSERT INTO bando_di_gara (id, project_title, required_skills) VALUES (?, ?, ?)",
+            ("1", "Cloud AI", json.dumps(["Kubernetes", "Machine Learning"])),
+        )
+
+    assert refresh_embeddings(recruitment_db) == 3
+    matches = nearest_candidates("1", top_k=2, db_path=recruitment_db)
+    assert [candidate_id for candidate_id, _ in matches] == ["1", "2"]
+    assert nearest_candidates("missing", db_path=recruitment_db) is None
+
+
+@pytest.mark.unit
+def test_nearest_candidates_pushes_down_experience_filter(recruitment_db):
+    """Test that the experience predicate excludes candidates before ranking."""
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.executemany(
+            "INSERT INTO candidates (id, technical_skills, experience_years_min) VALUES (?, ?, ?)",
+            [("1", json.dumps(["Python"]), 2), ("2", json.dumps(["Java"]), 9)],
+        )
+        conn.execute(
+            "INSERT INTO bando_di_gara (id, required_skills) VALUES (?, ?)",
+            ("1", json.dumps(["Python"])),
+        )
+
+    refresh_embeddings(recruitment_db)
+    matches = nearest_candidates("1", top_k=5, db_path=recruitment_db, min_years=7)
+    assert [candidate_id for candidate_id, _ in matches] == ["2"]
+
+
+@pytest.mark.unit
+def test_save_tools_embed_and_search_is_read_only(recruitment_db, tmp_path, monkeypatch):
+    """Test that inserts write embeddings and that searching never writes."""
+    from tools.core.db_manager_enhanced import format_and_save_processed_data
+
+    monkeypatch.chdir(tmp_path)
+    format_and_save_processed_data(
+        json.dumps({"document_type": "CV", "candidate_name": "Maria", "technical_skills": ["K8s"]})
+    )
+    format_and_save_processed_data(
+        json.dumps({"document_type": "Bando di Gara", "required_skills": ["Kubernetes"]})
+    )
+    with sqlite3.connect(recruitment_db) as conn:
+        conn.execute(
+            "INSERT INTO bando_di_gara (id, required_skills) VALUES ('2', ?)",
+            (json.dumps(["Kubernetes"]),),
+        )
+        before = conn.execute("SELECT * FROM skill_embeddings ORDER BY entity_type").fetchall()
+    assert [(row[0], row[1]) for row in before] == [("bando", "1"), ("candidate", "1")]
+
+    assert [c for c, _ in nearest_candidates("1", db_path=recruitment_db)] == ["1"]
+    assert [c for c, _ in nearest_candidates("2", db_path=recruitment_db)] == ["1"]
+    with sqlite3.connect(recruitment_db) as conn:
+        assert conn.execute("SELECT * FROM skill_embeddings ORDER BY entity_type").fetchall() == (
+            before
+        )
+    assert refresh_embeddings(recruitment_db) == 1
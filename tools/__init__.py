@@ -17,8 +17,16 @@ __email__ = "ruslanmv@pm.me"
 __license__ = "Apache-2.0"
 
 __all__: List[str] = [
+    "cli",
+    "core",
     "db_manager",
     "db_manager_enhanced",
     "db_retrieval",
+    "document_ingest",
+    "evaluation_queue",
     "evaluation_tools",
+    "experience",
+    "facet_index",
+    "skill_gaps",
+    "skill_matching",
 ]
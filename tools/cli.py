@@ -0,0 +1,196 @@
+"""
+Command Line Interface for AI Recruitment Suite.
+
+Database utilities that run outside the agents, for scripts and schedulers.
+
+Usage:
+    ai-recruitment export -o export.ndjson.gz
+    ai-recruitment export --tables candidates -o - | jq .candidate_name
+    ai-recruitment maintain --keep-latest 3 --keep-days 90
+    ai-recruitment gaps
+    ai-recruitment embeddings
+    ai-recruitment profiles --tool get_info_candidate --baseline profiles-before
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, List, Optional
+
+from tools.core.db_connection import DB_PATH
+
+
+def _export(args: argparse.Namespace) -> int:
+    from tools.core.export import export_ndjson
+
+    to_stdout = args.output == "-"
+    output = sys.stdout.buffer if to_stdout else args.output
+    counts = export_ndjson(
+        output, args.tables, args.db, compress=args.gzip or None, batch_size=args.batch_size
+    )
+    summary = ", ".join(f"{table}={count}" for table, count in counts.items())
+    print(f"✅ Exported {sum(counts.values())} records ({summary})", file=sys.stderr)
+    return 0
+
+
+def _maintain(args: argparse.Namespace) -> int:
+    from tools.core.evaluation_archive import RetentionPolicy, run_maintenance
+    from tools.core.schema import init_schema
+
+    init_schema(args.db)
+    report = run_maintenance(
+        args.db,
+        RetentionPolicy(args.keep_latest, args.keep_days),
+        archive_path=args.archive_db,
+        dry_run=args.dry_run,
+    )
+    print(report.summary())
+    return 0
+
+
+def _gaps(args: argparse.Namespace) -> int:
+    from tools.core.schema import init_schema
+    from tools.core.skill_gaps import rebuild_skill_gaps
+
+    init_schema(args.db)
+    report = rebuild_skill_gaps(args.db)
+    print(
+        f"✅ Skill gaps rebuilt for {report.bandos} open bando(s): "
+        f"{report.rows} row(s) written, {report.pruned} pruned"
+    )
+    return 0
+
+
+def _embeddings(args: argparse.Namespace) -> int:
+    from tools.core.schema import init_schema
+    from tools.core.skill_matching import refresh_embeddings
+
+    init_schema(args.db)
+    changes = refresh_embeddings(args.db)
+    print(f"✅ Skill embeddings reconciled: {changes} written or removed")
+    return 0
+
+
+def _fmt(value: Optional[float], digits: int = 1) -> str:
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def _profiles(args: argparse.Namespace) -> int:
+    from tools.core.profiling import load_captures, merged_top_functions, profile_dir, summarize
+
+    directory = args.dir or profile_dir()
+    captures = load_captures(directory, args.tool)
+    if not captures:
+        raise ValueError(f"no profile captures in {directory}")
+    profiles = summarize(captures)
+    baseline = summarize(load_captures(args.baseline, args.tool)) if args.baseline else {}
+
+    header = f"{'Tool':<36} {'Calls':>5} {'Median ms':>10} {'Max ms':>10} {'Peak KB':>9}"
+    header += f" {'Arg bytes':>10}"
+    if args.baseline:
+        header += f" {'Base ms':>10} {'Change':>8}"
+    print(header)
+    for tool, profile in profiles.items():
+        line = (
+            f"{tool:<36} {profile.captures:>5} {profile.median_ms:>10.1f} {profile.max_ms:>10.1f}"
+            f" {_fmt(profile.median_peak_kb):>9} {profile.median_arg_bytes:>10.0f}"
+        )
+        if args.baseline:
+            before = baseline.get(tool)
+            change = (
+                f"{(profile.median_ms / before.median_ms - 1) * 100:+.0f}%"
+                if before and before.median_ms
+                else "-"
+            )
+            line += f" {_fmt(before.median_ms if before else None):>10} {change:>8}"
+        print(line)
+
+    if args.tool:
+        print(f"\nTop functions by cumulative time ({len(captures)} capture(s)):")
+        for row in merged_top_functions(directory, captures, args.top):
+            print(f"  {row['cumtime_ms']:>10.1f} ms {row['calls']:>8} calls  {row['function']}")
+        allocations: Dict[str, float] = {}
+        for capture in captures:
+            for row in capture["top_allocations"]:
+                allocations[row["location"]] = allocations.get(row["location"], 0) + row["size_kb"]
+        if allocations:
+            print("\nTop allocation sites (KB retained, summed over captures):")
+            for location, size in sorted(allocations.items(), key=lambda i: -i[1])[: args.top]:
+                print(f"  {size:>10.1f} KB  {location}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser with one sub-command per utility.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser
+    """
+    parser = argparse.ArgumentParser(prog="ai-recruitment", description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DB_PATH, help="recruitment database (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="stream records as NDJSON")
+    export.add_argument("-o", "--output", default="-", help="file path or - for stdout")
+    export.add_argument(
+        "--tables", nargs="+", help="tables to export (default: all)", metavar="TABLE"
+    )
+    export.add_argument("--gzip", action="store_true", help="gzip the output")
+    export.add_argument("--batch-size", type=int, default=500, help="rows read at a time")
+    export.set_defaults(handler=_export)
+
+    maintain = commands.add_parser("maintain", help="archive old evaluations and compact")
+    maintain.add_argument("--keep-latest", type=int, default=3, help="evaluations kept per pair")
+    maintain.add_argument("--keep-days", type=int, default=90, help="always keep newer than this")
+    maintain.add_argument("--archive-db", help="separate archive database file")
+    maintain.add_argument("--dry-run", action="store_true", help="only report what would move")
+    maintain.set_defaults(handler=_maintain)
+
+    gaps = commands.add_parser("gaps", help="rebuild the skill-gap matrix of open bandos")
+    gaps.set_defaults(handler=_gaps)
+
+    embeddings = commands.add_parser(
+        "embeddings", help="re-embed candidates and bandos changed outside the save tools"
+    )
+    embeddings.set_defaults(handler=_embeddings)
+
+    profiles = commands.add_parser("profiles", help="aggregate tool profiling captures")
+    profiles.add_argument(
+        "--dir", help="capture directory (default: $RECRUITMENT_PROFILE_DIR or profiles)"
+    )
+    profiles.add_argument("--baseline", help="capture directory to compare against")
+    profiles.add_argument("--tool", help="show merged hot functions and allocations of a tool")
+    profiles.add_argument("--top", type=int, default=15, help="rows of hot functions/allocations")
+    profiles.set_defaults(handler=_profiles)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    Args:
+        argv: Arguments without the program name (default: ``sys.argv[1:]``)
+
+    Returns:
+        int: Process exit status
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reader stopped early (e.g. ``| head``); silence the flush at interpreter exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""
+AI Recruitment Suite - Core Library.
+
+Data access, matching and maintenance logic used by the watsonx Orchestrate tools,
+batch jobs, the CLI and the tests. Nothing in this package imports the watsonx
+Orchestrate SDK: the ``@tool`` adapters in ``tools/`` import these modules on their
+first call, so loading the tool definitions stays cheap and the core runs without
+the SDK installed.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+from typing import List
+
+__all__: List[str] = [
+    "change_log",
+    "db_connection",
+    "db_manager",
+    "db_manager_enhanced",
+    "db_retrieval",
+    "document_ingest",
+    "evaluation_archive",
+    "evaluation_queue",
+    "evaluation_tools",
+    "experience",
+    "export",
+    "facet_index",
+    "profiling",
+    "records",
+    "response_budget",
+    "result_cache",
+    "schema",
+    "skill_dictionary",
+    "skill_gaps",
+    "skill_matching",
+]
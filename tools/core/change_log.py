@@ -0,0 +1,191 @@
+"""
+Change Feed for AI Recruitment Suite.
+
+This module records every insert, update and delete on the candidates,
+bando_di_gara and evaluations tables in a ``change_log`` table, filled by
+SQLite triggers with a monotonically increasing sequence number. List tools use
+it to return only the rows changed after a client's last known sequence (its
+high-water mark), so polling cost follows the number of changes rather than
+the size of the tables.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import sqlite3
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from tools.core.records import Record, RecordCodec
+
+# Tracked table -> primary key column
+TRACKED_TABLES: Dict[str, str] = {
+    "candidates": "id",
+    "bando_di_gara": "id",
+    "evaluations": "evaluation_id",
+}
+
+_MAX_PARAMS = 500
+
+
+class ChangeSet(NamedTuple):
+    """Rows of one table changed after a sequence number."""
+
+    records: List[Record]  # Current state of inserted or updated rows, oldest change first
+    deleted: List[str]  # Keys of rows that no longer exist
+    high_water_mark: int  # Sequence to pass as ``since`` on the next call
+
+    def as_payload(self, since: int, changed: Any = None) -> Dict[str, Any]:
+        """
+        Return the JSON-serializable delta returned by list tools called with ``since``.
+
+        Args:
+            since: Sequence number the caller passed
+            changed: Already shaped ``changed`` value (default: every record as a dict)
+        """
+        return {
+            "since": since,
+            "high_water_mark": self.high_water_mark,
+            "changed": (
+                [record.to_dict() for record in self.records] if changed is None else changed
+            ),
+            "deleted": self.deleted,
+        }
+
+
+def install_change_log(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the change_log table and the triggers of every existing tracked table.
+
+    Rows already present when a table's triggers are first created are logged as
+    inserts, so ``since=0`` always returns the whole table.
+
+    Args:
+        cursor: Cursor of the connection running the migration
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS change_log (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            operation TEXT NOT NULL,
+            changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_change_log_entity ON change_log (table_name, entity_id)"
+    )
+    # Latest change per table, read by the result cache after every commit
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_change_log_table_seq ON change_log (table_name, seq)"
+    )
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+    existing = {row[0] for row in cursor.fetchall()}
+    for table, key in TRACKED_TABLES.items():
+        if table not in existing or f"trg_{table}_log_insert" in existing:
+            continue
+        cursor.execute(
+            "INSERT INTO change_log (table_name, entity_id, operation) "
+            f"SELECT '{table}', {key}, 'insert' FROM {table} ORDER BY created_at"
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_log_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO change_log (table_name, entity_id, operation)
+                VALUES ('{table}', NEW.{key}, 'insert');
+            END
+        """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_log_update AFTER UPDATE ON {table} BEGIN
+                INSERT INTO change_log (table_name, entity_id, operation)
+                SELECT '{table}', OLD.{key}, 'delete' WHERE OLD.{key} IS NOT NEW.{key};
+                INSERT INTO change_log (table_name, entity_id, operation)
+                VALUES ('{table}', NEW.{key}, 'update');
+            END
+        """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_log_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO change_log (table_name, entity_id, operation)
+                VALUES ('{table}', OLD.{key}, 'delete');
+            END
+        """
+        )
+
+
+def high_water_mark(conn: sqlite3.Connection) -> int:
+    """
+    Return the sequence number of the latest recorded change (0 if none).
+
+    Args:
+        conn: Open connection to the recruitment database
+
+    Returns:
+        int: Latest change sequence number
+    """
+    return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+
+
+def changed_keys(conn: sqlite3.Connection, table: str, since: int) -> Tuple[List[str], int]:
+    """
+    Return the keys of a table's rows changed after ``since``.
+
+    Args:
+        conn: Open connection to the recruitment database
+        table: Tracked table name
+        since: Sequence number already seen by the caller
+
+    Returns:
+        Tuple[List[str], int]: Changed keys ordered by their latest change, and
+        the high-water mark the result is consistent with
+    """
+    mark = high_water_mark(conn)
+    rows = conn.execute(
+        "SELECT entity_id FROM change_log WHERE seq > ? AND seq <= ? AND table_name = ? "
+        "GROUP BY entity_id ORDER BY MAX(seq)",
+        (since, mark, table),
+    ).fetchall()
+    return [row[0] for row in rows], mark
+
+
+def fetch_changes(
+    conn: sqlite3.Connection, table: str, since: int, codec: RecordCodec
+) -> ChangeSet:
+    """
+    Fetch the current state of a table's rows changed after ``since``.
+
+    Args:
+        conn: Open connection to the recruitment database
+        table: Tracked table name
+        since: Sequence number already seen by the caller
+        codec: Record codec of the table
+
+    Returns:
+        ChangeSet: Changed rows, deleted keys and the new high-water mark
+
+    Example:
+        >>> fetch_changes(conn, "candidates", 42, CANDIDATE_RECORDS).deleted
+        ['7']
+    """
+    keys, mark = changed_keys(conn, table, since)
+    key_column = TRACKED_TABLES[table]
+    found: Dict[str, Record] = {}
+    cursor = conn.cursor()
+    for start in range(0, len(keys), _MAX_PARAMS):
+        chunk = keys[start : start + _MAX_PARAMS]
+        cursor.execute(
+            f"SELECT * FROM {table} WHERE {key_column} IN ({', '.join('?' * len(chunk))})",
+            chunk,
+        )
+        found.update((str(record[key_column]), record) for record in codec.fetchall(cursor))
+    return ChangeSet(
+        records=[found[key] for key in keys if key in found],
+        deleted=[key for key in keys if key not in found],
+        high_water_mark=mark,
+    )
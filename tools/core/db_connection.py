@@ -0,0 +1,317 @@
+"""
+Database Connection Helpers for AI Recruitment Suite.
+
+This module centralizes how the tools open the recruitment database and provides
+an optional shared in-memory read snapshot for read-heavy agent sessions.
+
+Set ``RECRUITMENT_DB_SNAPSHOT=1`` to serve the retrieval tools from the snapshot.
+The snapshot is loaded with the SQLite backup API and reloaded whenever
+``PRAGMA data_version`` reports that a writer has committed to the database file.
+
+Write tools open their transactions with ``write_transaction``, which takes the
+write lock up front (``BEGIN IMMEDIATE``) and retries with jittered backoff when
+another session holds it, so parallel agent sessions wait for each other instead
+of failing with ``database is locked``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import itertools
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+DB_PATH = "recruitment.db"
+SNAPSHOT_ENV_VAR = "RECRUITMENT_DB_SNAPSHOT"
+
+_TRUTHY = ("1", "true", "yes", "on")
+
+# Lock handling of write_transaction: each attempt waits up to WRITE_BUSY_TIMEOUT seconds
+# in SQLite's busy handler, then sleeps a random delay of up to
+# min(WRITE_BACKOFF_CAP, WRITE_BACKOFF_BASE * 2 ** attempt) before the next one
+WRITE_MAX_ATTEMPTS = 8
+WRITE_BUSY_TIMEOUT = 1.0
+WRITE_BACKOFF_BASE = 0.05
+WRITE_BACKOFF_CAP = 2.0
+
+
+class ReadSnapshot:
+    """
+    Shared in-memory copy of the recruitment database for read-only tools.
+
+    Every refresh copies the database file into a new shared-cache in-memory
+    database and swaps it in, so readers that are still running against the
+    previous copy are never blocked by a reload.
+
+    Args:
+        db_path: Path to the on-disk recruitment database
+
+    Example:
+        >>> snapshot = ReadSnapshot("recruitment.db")
+        >>> conn = snapshot.connect()
+        >>> conn.execute("SELECT COUNT(*) FROM candidates").fetchone()
+        (3,)
+    """
+
+    _generation = itertools.count(1)
+
+    def __init__(self, db_path: str = DB_PATH) -> None:
+        self.db_path = db_path
+        self.refresh_count = 0
+        self._lock = threading.Lock()
+        self._source: Optional[sqlite3.Connection] = None
+        self._anchor: Optional[sqlite3.Connection] = None
+        self._uri: Optional[str] = None
+        self._data_version: Optional[int] = None
+
+    def _read_data_version(self) -> int:
+        if self._source is None:
+            self._source = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._source.execute("PRAGMA data_version").fetchone()[0]
+
+    def _reload(self, force: bool) -> bool:
+        # Caller holds self._lock. Read the version before copying: a commit racing
+        # with the backup is then picked up by the next call instead of being missed.
+        version = self._read_data_version()
+        if not force and self._anchor is not None and version == self._data_version:
+            return False
+
+        uri = (
+            f"file:recruitment_snapshot_{id(self)}_{next(self._generation)}"
+            "?mode=memory&cache=shared"
+        )
+        # The anchor connection keeps the shared in-memory database alive
+        anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._source.backup(anchor)
+
+        # Readers already attached to the previous copy keep it alive after this close
+        if self._anchor is not None:
+            self._anchor.close()
+        self._anchor, self._uri, self._data_version = anchor, uri, version
+        self.refresh_count += 1
+        return True
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload the snapshot if the database file changed since the last load.
+
+        Args:
+            force: Reload even if no commit was detected
+
+        Returns:
+            bool: True if the snapshot was reloaded
+        """
+        with self._lock:
+            return self._reload(force)
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to an up-to-date copy of the database.
+
+        The connection is opened under the snapshot lock, so a concurrent refresh
+        cannot release the copy between the freshness check and the attach.
+
+        Returns:
+            sqlite3.Connection: Connection to the in-memory snapshot
+        """
+        with self._lock:
+            self._reload(force=False)
+            return sqlite3.connect(self._uri, uri=True)
+
+    def close(self) -> None:
+        """Release the snapshot and the connection used to watch the source file."""
+        with self._lock:
+            for conn in (self._anchor, self._source):
+                if conn is not None:
+                    conn.close()
+            self._anchor = self._source = None
+            self._uri = self._data_version = None
+
+
+_snapshots: Dict[str, ReadSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def snapshot_enabled() -> bool:
+    """
+    Check whether the retrieval tools should read from the in-memory snapshot.
+
+    Returns:
+        bool: True if ``RECRUITMENT_DB_SNAPSHOT`` is set to a truthy value
+    """
+    return os.environ.get(SNAPSHOT_ENV_VAR, "").strip().lower() in _TRUTHY
+
+
+def get_snapshot(db_path: str = DB_PATH) -> ReadSnapshot:
+    """
+    Return the process-wide snapshot for a database file, creating it on first use.
+
+    Args:
+        db_path: Path to the on-disk recruitment database
+
+    Returns:
+        ReadSnapshot: The shared snapshot for ``db_path``
+    """
+    with _snapshots_lock:
+        snapshot = _snapshots.get(db_path)
+        if snapshot is None:
+            snapshot = _snapshots[db_path] = ReadSnapshot(db_path)
+        return snapshot
+
+
+@contextmanager
+def read_connection(db_path: str = DB_PATH) -> Iterator[sqlite3.Connection]:
+    """
+    Open a read-only connection, served from the snapshot when it is enabled.
+
+    The connection is closed when the block exits.
+
+    Args:
+        db_path: Path to the on-disk recruitment database
+
+    Yields:
+        sqlite3.Connection: Connection to the snapshot or to the database file
+
+    Example:
+        >>> with read_connection() as conn:
+        ...     conn.execute("SELECT id FROM candidates").fetchall()
+        [('1',), ('2',)]
+    """
+    if snapshot_enabled():
+        conn = get_snapshot(db_path).connect()
+    else:
+        conn = sqlite3.connect(db_path)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+class WriteMetrics:
+    """
+    Process-wide lock contention counters of ``write_transaction``.
+
+    Example:
+        >>> WRITE_METRICS.snapshot()
+        {'transactions': 42, 'retries': 3, 'lock_failures': 0, 'lock_wait_seconds': 0.41, ...}
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        with self._lock:
+            self.transactions = 0  # Committed write transactions
+            self.retries = 0  # Lock acquisitions that had to be retried
+            self.lock_failures = 0  # Transactions abandoned after the last attempt
+            self.lock_wait_seconds = 0.0  # Time spent waiting for the write lock
+            self.max_attempts = 0  # Most attempts needed by a single transaction
+
+    def record(self, attempts: int, waited: float, acquired: bool) -> None:
+        """Add the outcome of one lock acquisition."""
+        with self._lock:
+            self.retries += attempts - 1
+            self.lock_wait_seconds += waited
+            self.max_attempts = max(self.max_attempts, attempts)
+            if not acquired:
+                self.lock_failures += 1
+
+    def committed(self) -> None:
+        """Count a committed transaction."""
+        with self._lock:
+            self.transactions += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Return the current counters.
+
+        Returns:
+            Dict[str, float]: Counter name mapped to its value
+        """
+        with self._lock:
+            return {
+                "transactions": self.transactions,
+                "retries": self.retries,
+                "lock_failures": self.lock_failures,
+                "lock_wait_seconds": round(self.lock_wait_seconds, 3),
+                "max_attempts": self.max_attempts,
+            }
+
+
+WRITE_METRICS = WriteMetrics()
+
+
+def _is_locked(error: sqlite3.OperationalError) -> bool:
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def _with_retry(conn: sqlite3.Connection, sql: str, max_attempts: int) -> None:
+    """Execute a locking statement, retrying with jittered backoff while the database is busy."""
+    start = time.perf_counter()
+    for attempt in range(1, max_attempts + 1):
+        try:
+            conn.execute(sql)
+        except sqlite3.OperationalError as e:
+            if not _is_locked(e) or attempt == max_attempts:
+                WRITE_METRICS.record(attempt, time.perf_counter() - start, acquired=False)
+                raise
+            time.sleep(random.uniform(0, min(WRITE_BACKOFF_CAP, WRITE_BACKOFF_BASE * 2**attempt)))
+        else:
+            WRITE_METRICS.record(attempt, time.perf_counter() - start, acquired=True)
+            return
+
+
+@contextmanager
+def write_transaction(
+    db_path: str = DB_PATH,
+    max_attempts: Optional[int] = None,
+    attach: Optional[Dict[str, str]] = None,
+) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block of writes as one transaction that holds the write lock from the start.
+
+    ``BEGIN IMMEDIATE`` takes the write lock before the first statement, so
+    read-then-write sequences (such as computing the next sequential ID) cannot
+    be interleaved with another writer. Lock acquisition and the final commit
+    are retried with jittered exponential backoff; if the lock is still held
+    after ``max_attempts`` the ``sqlite3.OperationalError`` is raised. The
+    transaction is rolled back if the block raises, and the connection closed.
+
+    Args:
+        db_path: Path to the recruitment database
+        max_attempts: Lock attempts before giving up (default: ``WRITE_MAX_ATTEMPTS``)
+        attach: Databases to attach before the transaction starts, by schema name;
+            writes to them commit atomically with the main database
+
+    Yields:
+        sqlite3.Connection: Connection inside the open transaction
+
+    Example:
+        >>> with write_transaction() as conn:
+        ...     conn.execute("INSERT INTO evaluations (...) VALUES (...)")
+    """
+    attempts = max_attempts or WRITE_MAX_ATTEMPTS
+    conn = sqlite3.connect(db_path, timeout=WRITE_BUSY_TIMEOUT, isolation_level=None)
+    try:
+        for schema, path in (attach or {}).items():
+            conn.execute(f"ATTACH DATABASE ? AS {schema}", (path,))
+        _with_retry(conn, "BEGIN IMMEDIATE", attempts)
+        try:
+            yield conn
+            _with_retry(conn, "COMMIT", attempts)
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        WRITE_METRICS.committed()
+    finally:
+        conn.close()
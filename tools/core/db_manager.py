@@ -0,0 +1,183 @@
+import json
+import uuid
+from datetime import datetime
+from typing import Dict, Any
+from tools.core.db_connection import write_transaction
+from tools.core.experience import parse_experience_years
+from tools.core.facet_index import index_candidate_facets
+from tools.core.skill_dictionary import build_skill_profile, store_skill_ids
+from tools.core.skill_gaps import refresh_bando_gaps, refresh_candidate_gaps
+from tools.core.skill_matching import embed_entity
+
+
+def insert_candidate(data: Dict[str, Any]) -> str:
+    """
+    Insert extracted CV data into the candidates table
+
+    :param data: Extracted CV information
+    :returns: The generated candidate ID
+    """
+    # Generate unique candidate ID
+    candidate_id = f"CAND_{uuid.uuid4().hex[:8].upper()}"
+
+    # Extract contact info
+    contact_info = data.get("contact_info", {})
+
+    # Canonicalize skills and pick up skills mentioned in the free text
+    profile = build_skill_profile(
+        data.get("technical_skills", []),
+        data.get("certifications", []),
+        (data.get("consulting_experience", ""), data.get("key_achievements", [])),
+    )
+
+    experience_min, experience_max = parse_experience_years(data.get("experience_years", ""))
+
+    # Take the write lock up front so parallel sessions wait instead of failing
+    with write_transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO candidates (
+                id, candidate_name, email, phone, location, position_applied,
+                technical_skills, experience_years, education, certifications,
+                previous_companies, consulting_experience, key_achievements,
+                languages, industry_experience, created_at,
+                experience_years_min, experience_years_max
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                candidate_id,
+                data.get("candidate_name", ""),
+                contact_info.get("email", ""),
+                contact_info.get("phone", ""),
+                contact_info.get("location", ""),
+                data.get("position_applied", ""),
+                json.dumps(profile.skills),
+                data.get("experience_years", ""),
+                data.get("education", ""),
+                json.dumps(profile.certifications),
+                json.dumps(data.get("previous_companies", [])),
+                data.get("consulting_experience", ""),
+                json.dumps(data.get("key_achievements", [])),
+                json.dumps(data.get("languages", [])),
+                json.dumps(data.get("industry_experience", [])),
+                datetime.now().isoformat(),
+                experience_min,
+                experience_max,
+            ),
+        )
+        index_candidate_facets(
+            cursor,
+            cursor.lastrowid,
+            {
+                "location": contact_info.get("location", ""),
+                "languages": data.get("languages", []),
+                "certifications": profile.certifications,
+            },
+        )
+        store_skill_ids(cursor, "candidate", candidate_id, profile.skill_ids)
+        refresh_candidate_gaps(cursor, candidate_id)
+        embed_entity(cursor, "candidates", candidate_id)
+
+    return candidate_id
+
+
+def insert_bando(data: Dict[str, Any]) -> str:
+    """
+    Insert extracted Bando di Gara data into the bando_di_gara table
+
+    :param data: Extracted Bando di Gara information
+    :returns: The generated bando ID
+    """
+    # Generate unique bando ID
+    bando_id = f"BANDO_{uuid.uuid4().hex[:8].upper()}"
+
+    # Canonicalize skills and pick up skills mentioned in the free text
+    profile = build_skill_profile(
+        data.get("required_skills", []),
+        data.get("certifications_required", []),
+        (data.get("project_description", ""), data.get("key_deliverables", [])),
+    )
+
+    experience_min, experience_max = parse_experience_years(data.get("experience_required", ""))
+
+    with write_transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO bando_di_gara (
+                id, client_name, project_title, project_description, required_skills,
+                experience_required, education_requirements, certifications_required,
+                project_duration, team_size, location, deadline, budget_range,
+                industry_sector, key_deliverables, created_at,
+                experience_required_min, experience_required_max
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                bando_id,
+                data.get("client_name", ""),
+                data.get("project_title", ""),
+                data.get("project_description", ""),
+                json.dumps(profile.skills),
+                data.get("experience_required", ""),
+                json.dumps(data.get("education_requirements", [])),
+                json.dumps(profile.certifications),
+                data.get("project_duration", ""),
+                data.get("team_size", ""),
+                data.get("location", ""),
+                data.get("deadline", ""),
+                data.get("budget_range", ""),
+                data.get("industry_sector", ""),
+                json.dumps(data.get("key_deliverables", [])),
+                datetime.now().isoformat(),
+                experience_min,
+                experience_max,
+            ),
+        )
+        store_skill_ids(cursor, "bando", bando_id, profile.skill_ids)
+        refresh_bando_gaps(cursor, bando_id)
+        embed_entity(cursor, "bando_di_gara", bando_id)
+
+    return bando_id
+
+
+def save_candidate_data(extracted_data: str) -> str:
+    """
+    Save candidate CV data to database with unique ID
+
+    :param extracted_data: JSON string containing extracted CV information
+    :returns: Success message with candidate ID
+    """
+    try:
+        data = json.loads(extracted_data)
+
+        if data.get("document_type") != "CV":
+            return "Error: This is not CV data"
+
+        candidate_id = insert_candidate(data)
+
+        return f"✅ Candidate saved successfully with ID: {candidate_id}"
+
+    except Exception as e:
+        return f"❌ Error saving candidate: {str(e)}"
+
+
+def save_bando_data(extracted_data: str) -> str:
+    """
+    Save Bando di Gara data to database with unique ID
+
+    :param extracted_data: JSON string containing extracted Bando di Gara information
+    :returns: Success message with bando ID
+    """
+    try:
+        data = json.loads(extracted_data)
+
+        if data.get("document_type") != "Bando di Gara":
+            return "Error: This is not Bando di Gara data"
+
+        bando_id = insert_bando(data)
+
+        return f"✅ Bando di Gara saved successfully with ID: {bando_id}"
+
+    except Exception as e:
+        return f"❌ Error saving bando: {str(e)}"
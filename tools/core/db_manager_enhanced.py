@@ -0,0 +1,529 @@
+"""
+Enhanced Database Manager for AI Recruitment Suite.
+
+This module provides enhanced database management functionality with sequential ID generation,
+JSON cleaning, and comprehensive CRUD operations for candidates and tender documents.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from tools.core.change_log import fetch_changes, high_water_mark, install_change_log
+from tools.core.db_connection import DB_PATH, read_connection, write_transaction
+from tools.core.experience import (
+    add_experience_columns,
+    backfill_experience_ranges,
+    parse_experience_years,
+)
+from tools.core.facet_index import index_candidate_facets
+from tools.core.records import BANDO_RECORDS, CANDIDATE_RECORDS
+from tools.core.response_budget import (
+    CHARS_PER_TOKEN,
+    DEFAULT_MAX_TOKENS,
+    paginate_blocks,
+    truncate_text,
+)
+from tools.core.skill_dictionary import build_skill_profile, store_skill_ids
+from tools.core.skill_gaps import refresh_bando_gaps, refresh_candidate_gaps
+from tools.core.skill_matching import embed_entity
+
+
+def clean_json_string(raw: str) -> str:
+    """
+    Clean a potentially malformed JSON string by fixing common issues.
+
+    This function handles:
+    - BOM removal
+    - JavaScript-style comments
+    - Single quotes to double quotes conversion
+    - Trailing commas before closing brackets
+
+    Args:
+        raw: The raw JSON string to clean
+
+    Returns:
+        str: The cleaned JSON string
+
+    Example:
+        >>> clean_json_string("{'name': 'John',}")
+        '{"name": "John"}'
+    """
+    s = raw.strip()
+    # Remove BOM if present
+    s = s.lstrip("\ufeff")
+    # Remove JS-style comments
+    s = re.sub(r"//.*?$|/\*.*?\*/", "", s, flags=re.DOTALL | re.MULTILINE)
+    # Replace single quotes around keys with double quotes
+    s = re.sub(r"'([A-Za-z0-9_]+)'(?=\s*:)", r'"\1"', s)
+    # Replace single-quoted values with double quotes
+    s = re.sub(r":\s*'([^']*?)'", r': "\1"', s)
+    # Remove trailing commas before } or ]
+    s = re.sub(r",(\s*[}\]])", r"\1", s)
+    return s
+
+
+def init_db(db_path: str = DB_PATH) -> None:
+    """
+    Initialize the recruitment database with required tables and schema migrations.
+
+    Creates:
+    - candidates table for CV data
+    - bando_di_gara table for tender documents
+
+    Performs migration-aware schema updates to add missing columns, including the
+    numeric experience ranges parsed from the free-text experience fields.
+
+    Args:
+        db_path: Path to the recruitment database file
+
+    Raises:
+        sqlite3.Error: If database initialization fails
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    # Create base candidates table (with a text-based primary key)
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS candidates (
+            id TEXT PRIMARY KEY,
+            candidate_name TEXT,
+            email TEXT,
+            phone TEXT,
+            location TEXT,
+            position_applied TEXT,
+            technical_skills TEXT,
+            experience_years TEXT,
+            education TEXT,
+            certifications TEXT,
+            previous_companies TEXT,
+            consulting_experience TEXT,
+            key_achievements TEXT,
+            languages TEXT,
+            industry_experience TEXT,
+            created_at TEXT
+        )
+    """
+    )
+
+    # Add missing source_filename column if needed
+    cursor.execute("PRAGMA table_info(candidates);")
+    existing_cols = {row[1] for row in cursor.fetchall()}
+    if "source_filename" not in existing_cols:
+        cursor.execute("ALTER TABLE candidates ADD COLUMN source_filename TEXT;")
+
+    # Create base bando_di_gara table (with a text-based primary key)
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS bando_di_gara (
+            id TEXT PRIMARY KEY,
+            client_name TEXT,
+            project_title TEXT,
+            project_description TEXT,
+            required_skills TEXT,
+            experience_required TEXT,
+            education_requirements TEXT,
+            certifications_required TEXT,
+            project_duration TEXT,
+            team_size TEXT,
+            location TEXT,
+            deadline TEXT,
+            budget_range TEXT,
+            industry_sector TEXT,
+            key_deliverables TEXT,
+            created_at TEXT
+        )
+    """
+    )
+
+    # Add missing source_filename column if needed
+    cursor.execute("PRAGMA table_info(bando_di_gara);")
+    existing_cols = {row[1] for row in cursor.fetchall()}
+    if "source_filename" not in existing_cols:
+        cursor.execute("ALTER TABLE bando_di_gara ADD COLUMN source_filename TEXT;")
+
+    # Add numeric experience ranges (indexed) and parse existing rows
+    add_experience_columns(cursor)
+    backfill_experience_ranges(cursor)
+
+    # Record every change in the change feed
+    install_change_log(cursor)
+
+    conn.commit()
+    conn.close()
+
+
+def get_next_id(table_name: str, conn: Optional[sqlite3.Connection] = None) -> str:
+    """
+    Calculate the next sequential string ID for a given table.
+
+    Pass the connection of an open ``write_transaction`` to reserve the ID:
+    no other writer can take it before that transaction commits.
+
+    Args:
+        table_name: Name of the database table
+        conn: Optional connection to read from (default: a read connection to DB_PATH)
+
+    Returns:
+        str: The next sequential ID as a string
+
+    Example:
+        >>> get_next_id('candidates')
+        '5'
+    """
+    # Find the maximum ID value by converting the text IDs to integers
+    query = f"SELECT MAX(CAST(id AS INTEGER)) FROM {table_name}"
+    if conn is not None:
+        max_id = conn.execute(query).fetchone()[0]
+    else:
+        with read_connection(DB_PATH) as own:
+            max_id = own.execute(query).fetchone()[0]
+
+    # If the table is empty (max_id is None), start with "1". Otherwise, increment.
+    next_id = 1 if max_id is None else max_id + 1
+    return str(next_id)
+
+
+def format_and_save_processed_data(processed_data: str) -> str:
+    """
+    Format processed data with a sequential string ID and save to the database.
+
+    Args:
+        processed_data: JSON string containing extracted document information
+
+    Returns:
+        str: Success message with assigned ID and document details
+
+    Raises:
+        json.JSONDecodeError: If JSON is invalid even after cleaning
+        Exception: For general database or processing errors
+    """
+    try:
+        cleaned = clean_json_string(processed_data)
+        data = json.loads(cleaned)
+
+        document_type = data.get("document_type", "Unknown")
+        source_filename = data.get("source_filename", "Unknown")
+
+        if document_type == "CV":
+            now = datetime.now().isoformat()
+            profile = build_skill_profile(
+                data.get("technical_skills", []),
+                data.get("certifications", []),
+                (data.get("consulting_experience", ""), data.get("key_achievements", [])),
+            )
+
+            formatted_data = {
+                "id": None,  # Assigned inside the write transaction
+                "candidate_name": data.get("candidate_name", ""),
+                "email": data.get("contact_info", {}).get("email", ""),
+                "phone": data.get("contact_info", {}).get("phone", ""),
+                "location": data.get("contact_info", {}).get("location", ""),
+                "position_applied": data.get("position_applied", ""),
+                "technical_skills": json.dumps(profile.skills),
+                "experience_years": data.get("experience_years", ""),
+                "education": data.get("education", ""),
+                "certifications": json.dumps(profile.certifications),
+                "previous_companies": json.dumps(data.get("previous_companies", [])),
+                "consulting_experience": data.get("consulting_experience", ""),
+                "key_achievements": json.dumps(data.get("key_achievements", [])),
+                "languages": json.dumps(data.get("languages", [])),
+                "industry_experience": json.dumps(data.get("industry_experience", [])),
+                "source_filename": source_filename,
+                "created_at": now,
+            }
+            (
+                formatted_data["experience_years_min"],
+                formatted_data["experience_years_max"],
+            ) = parse_experience_years(formatted_data["experience_years"])
+
+            with write_transaction() as conn:
+                new_id = formatted_data["id"] = get_next_id("candidates", conn)
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO candidates (
+                        id, candidate_name, email, phone, location, position_applied,
+                        technical_skills, experience_years, education, certifications,
+                        previous_companies, consulting_experience, key_achievements,
+                        languages, industry_experience, source_filename, created_at,
+                        experience_years_min, experience_years_max
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    tuple(formatted_data.values()),
+                )
+                index_candidate_facets(cursor, cursor.lastrowid, formatted_data)
+                store_skill_ids(cursor, "candidate", new_id, profile.skill_ids)
+                refresh_candidate_gaps(cursor, new_id)
+                embed_entity(cursor, "candidates", new_id)
+
+            return (
+                f"✅ **CV Successfully Processed and Saved**\n\n"
+                f"Assigned ID: {new_id}\n"
+                f"Candidate Name: {formatted_data['candidate_name']}\n"
+                f"Source File: {source_filename}\n"
+                f"Saved At: {formatted_data['created_at']}"
+            )
+
+        elif document_type == "Bando di Gara":
+            now = datetime.now().isoformat()
+            profile = build_skill_profile(
+                data.get("required_skills", []),
+                data.get("certifications_required", []),
+                (data.get("project_description", ""), data.get("key_deliverables", [])),
+            )
+
+            formatted_data = {
+                "id": None,  # Assigned inside the write transaction
+                "client_name": data.get("client_name", ""),
+                "project_title": data.get("project_title", ""),
+                "project_description": data.get("project_description", ""),
+                "required_skills": json.dumps(profile.skills),
+                "experience_required": data.get("experience_required", ""),
+                "education_requirements": data.get("education_requirements", ""),
+                "certifications_required": json.dumps(profile.certifications),
+                "project_duration": data.get("project_duration", ""),
+                "team_size": data.get("team_size", ""),
+                "location": data.get("location", ""),
+                "deadline": data.get("deadline", ""),
+                "budget_range": data.get("budget_range", ""),
+                "industry_sector": data.get("industry_sector", ""),
+                "key_deliverables": json.dumps(data.get("key_deliverables", [])),
+                "source_filename": source_filename,
+                "created_at": now,
+            }
+            (
+                formatted_data["experience_required_min"],
+                formatted_data["experience_required_max"],
+            ) = parse_experience_years(formatted_data["experience_required"])
+
+            with write_transaction() as conn:
+                new_id = formatted_data["id"] = get_next_id("bando_di_gara", conn)
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO bando_di_gara (
+                        id, client_name, project_title, project_description, required_skills,
+                        experience_required, education_requirements, certifications_required,
+                        project_duration, team_size, location, deadline, budget_range,
+                        industry_sector, key_deliverables, source_filename, created_at,
+                        experience_required_min, experience_required_max
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    tuple(formatted_data.values()),
+                )
+                store_skill_ids(cursor, "bando", new_id, profile.skill_ids)
+                refresh_bando_gaps(cursor, new_id)
+                embed_entity(cursor, "bando_di_gara", new_id)
+
+            return (
+                f"✅ **Bando di Gara Successfully Processed and Saved**\n\n"
+                f"Assigned ID: {new_id}\n"
+                f"Client Name: {formatted_data['client_name']}\n"
+                f"Project Title: {formatted_data['project_title']}\n"
+                f"Source File: {source_filename}\n"
+                f"Saved At: {formatted_data['created_at']}"
+            )
+
+        else:
+            return f"❌ Unknown document type: {document_type}. Cannot format and save."
+
+    except json.JSONDecodeError:
+        return "❌ Error: Invalid JSON format in processed data even after cleaning"
+    except Exception as e:
+        return f"❌ Error formatting and saving data: {str(e)}"
+
+
+def get_all_candidates(
+    since: Optional[int] = None, max_tokens: int = DEFAULT_MAX_TOKENS, offset: int = 0
+) -> str:
+    """
+    Retrieve all candidates from the database.
+
+    Args:
+        since: Optional change sequence (high-water mark) from a previous call. If
+               provided, lists only candidates added, updated or deleted after it
+        max_tokens: Approximate response budget in LLM tokens; longer lists are
+                    paginated (0 = no limit)
+        offset: Index of the first candidate to list when paginating
+
+    Returns:
+        str: Formatted list of all candidates with key information, ending with the
+             high-water mark to pass as ``since`` on the next call
+    """
+    try:
+        deleted = []
+        with read_connection() as conn:
+            if since is None:
+                mark = high_water_mark(conn)
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM candidates ORDER BY created_at DESC")
+                candidates = CANDIDATE_RECORDS.fetchall(cursor)
+            else:
+                changes = fetch_changes(conn, "candidates", since, CANDIDATE_RECORDS)
+                candidates, deleted, mark = changes
+
+        if since is not None and not candidates and not deleted:
+            return f"No candidate changes since {since} (high-water mark: {mark})"
+        if not candidates and not deleted:
+            return "No candidates found in database"
+
+        if since is None:
+            result = "📋 **All Candidates:**\n\n"
+        else:
+            result = f"📋 **Candidates changed since {since}:**\n\n"
+        blocks = [
+            f"**ID:** {candidate.id}\n"
+            f"**Name:** {candidate.candidate_name}\n"
+            f"**Email:** {candidate.email}\n"
+            f"**Position:** {candidate.position_applied}\n"
+            f"**Experience:** {candidate.experience_years}\n"
+            f"**Source File:** {candidate.source_filename}\n"
+            f"**Added:** {candidate.created_at}\n"
+            "---\n"
+            for candidate in candidates
+        ]
+        shown, next_offset = paginate_blocks(blocks, max_tokens, offset)
+        result += "".join(shown)
+        if next_offset is not None:
+            result += (
+                f"⏭️ **{len(blocks) - next_offset} more not shown.** "
+                f"Call get_all_candidates(offset={next_offset}) for the next page.\n"
+            )
+        if deleted:
+            result += f"🗑️ **Deleted IDs:** {', '.join(deleted)}\n"
+        result += f"🔖 **High-water mark:** {mark}\n"
+
+        return result
+
+    except Exception as e:
+        return f"❌ Error retrieving candidates: {str(e)}"
+
+
+def get_all_bandos(
+    since: Optional[int] = None, max_tokens: int = DEFAULT_MAX_TOKENS, offset: int = 0
+) -> str:
+    """
+    Retrieve all Bando di Gara (tender documents) from the database.
+
+    Args:
+        since: Optional change sequence (high-water mark) from a previous call. If
+               provided, lists only tenders added, updated or deleted after it
+        max_tokens: Approximate response budget in LLM tokens; longer lists are
+                    paginated (0 = no limit)
+        offset: Index of the first tender to list when paginating
+
+    Returns:
+        str: Formatted list of all tender documents with key information, ending
+             with the high-water mark to pass as ``since`` on the next call
+    """
+    try:
+        deleted = []
+        with read_connection() as conn:
+            if since is None:
+                mark = high_water_mark(conn)
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM bando_di_gara ORDER BY created_at DESC")
+                bandos = BANDO_RECORDS.fetchall(cursor)
+            else:
+                bandos, deleted, mark = fetch_changes(conn, "bando_di_gara", since, BANDO_RECORDS)
+
+        if since is not None and not bandos and not deleted:
+            return f"No Bando di Gara changes since {since} (high-water mark: {mark})"
+        if not bandos and not deleted:
+            return "No Bando di Gara found in database"
+
+        if since is None:
+            result = "📋 **All Bando di Gara:**\n\n"
+        else:
+            result = f"📋 **Bando di Gara changed since {since}:**\n\n"
+        blocks = [
+            f"**ID:** {bando.id}\n"
+            f"**Client:** {bando.client_name}\n"
+            f"**Project:** {bando.project_title}\n"
+            f"**Description:** {(bando.project_description or '')[:100]}...\n"
+            f"**Location:** {bando.location}\n"
+            f"**Source File:** {bando.source_filename}\n"
+            f"**Added:** {bando.created_at}\n"
+            "---\n"
+            for bando in bandos
+        ]
+        shown, next_offset = paginate_blocks(blocks, max_tokens, offset)
+        result += "".join(shown)
+        if next_offset is not None:
+            result += (
+                f"⏭️ **{len(blocks) - next_offset} more not shown.** "
+                f"Call get_all_bandos(offset={next_offset}) for the next page.\n"
+            )
+        if deleted:
+            result += f"🗑️ **Deleted IDs:** {', '.join(deleted)}\n"
+        result += f"🔖 **High-water mark:** {mark}\n"
+
+        return result
+
+    except Exception as e:
+        return f"❌ Error retrieving bandos: {str(e)}"
+
+
+def get_candidate_by_id(candidate_id: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str:
+    """
+    Get specific candidate details by ID.
+
+    Args:
+        candidate_id: The candidate ID to search for
+        max_tokens: Approximate response budget in LLM tokens; the consulting
+                    experience text is shortened to fit (0 = no limit)
+
+    Returns:
+        str: Detailed candidate information or error message
+    """
+    try:
+        with read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM candidates WHERE id = ?", (candidate_id,))
+            candidate = CANDIDATE_RECORDS.fetchone(cursor)
+
+        if not candidate:
+            return f"❌ Candidate with ID {candidate_id} not found"
+
+        result = f"👤 **Candidate Details - {candidate.id}**\n\n"
+        result += f"**Name:** {candidate.candidate_name}\n"
+        result += f"**Email:** {candidate.email}\n"
+        result += f"**Phone:** {candidate.phone}\n"
+        result += f"**Location:** {candidate.location}\n"
+        result += f"**Position Applied:** {candidate.position_applied}\n"
+        result += f"**Experience Years:** {candidate.experience_years}\n"
+        result += f"**Education:** {candidate.education}\n"
+        result += f"**Technical Skills:** {candidate.raw('technical_skills')}\n"
+        consulting = candidate.consulting_experience or ""
+        if max_tokens and max_tokens > 0:
+            room = max(max_tokens * CHARS_PER_TOKEN - len(result) - 200, 200)
+            if len(consulting) > room:
+                consulting = truncate_text(consulting, room) + (
+                    " _(truncated; call again with max_tokens=0 for the full text)_"
+                )
+        result += f"**Consulting Experience:** {consulting}\n"
+        result += f"**Source File:** {candidate.source_filename}\n"
+        result += f"**Added:** {candidate.created_at}\n"
+
+        return result
+
+    except Exception as e:
+        return f"❌ Error retrieving candidate: {str(e)}"
+
+
+def clear_thread_files() -> str:
+    """
+    Clear information about uploaded files in the current thread.
+
+    Returns:
+        str: Confirmation message
+    """
+    return "✅ Thread file cache cleared. You can now upload new documents."
@@ -0,0 +1,305 @@
+"""
+Database Retrieval Tools for AI Recruitment Suite.
+
+This module provides tools for retrieving candidate and tender information
+from the recruitment database, including comparison data for evaluations.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from tools.core.change_log import fetch_changes
+from tools.core.db_connection import read_connection
+from tools.core.records import BANDO_RECORDS, CANDIDATE_RECORDS, Record, RecordCodec
+from tools.core.response_budget import (
+    BANDO_POLICY,
+    CANDIDATE_POLICY,
+    DEFAULT_MAX_TOKENS,
+    listing_payload,
+    shape_record,
+    shape_records,
+)
+
+# Stay below SQLite's default limit on bound parameters per statement
+_MAX_IN_PARAMS = 900
+
+
+def get_comparison_data(
+    candidate_id: str, bando_id: str, max_tokens: int = DEFAULT_MAX_TOKENS
+) -> str:
+    """
+    Retrieve full details for a candidate and tender document for comparison.
+
+    Args:
+        candidate_id: The ID of the candidate to retrieve
+        bando_id: The ID of the Bando di Gara to retrieve
+        max_tokens: Approximate response budget in LLM tokens, split between the
+                    two records; long text fields are shortened to fit (0 = no limit)
+
+    Returns:
+        str: JSON object with 'candidate' and 'bando_di_gara' keys, plus 'omitted'
+             when fields were shortened or left out
+    """
+    with read_connection() as conn:
+        cursor = conn.cursor()
+
+        # Fetch Candidate Data
+        cursor.execute("SELECT * FROM candidates WHERE id = ?", (candidate_id,))
+        candidate = CANDIDATE_RECORDS.fetchone(cursor)
+        candidate_data = candidate.to_dict() if candidate else {}
+
+        # Fetch Bando di Gara Data
+        cursor.execute("SELECT * FROM bando_di_gara WHERE id = ?", (bando_id,))
+        bando = BANDO_RECORDS.fetchone(cursor)
+        bando_data = bando.to_dict() if bando else {}
+
+    # Fit both records into the budget, half each
+    half = max_tokens // 2 if max_tokens and max_tokens > 0 else 0
+    candidate_data, candidate_omitted = shape_record(candidate_data, CANDIDATE_POLICY, half)
+    bando_data, bando_omitted = shape_record(bando_data, BANDO_POLICY, half)
+
+    # Combine into a single JSON object
+    comparison_payload = {"candidate": candidate_data, "bando_di_gara": bando_data}
+    omitted = {
+        key: value
+        for key, value in (("candidate", candidate_omitted), ("bando_di_gara", bando_omitted))
+        if value
+    }
+    if omitted:
+        comparison_payload["omitted"] = omitted
+
+    return json.dumps(comparison_payload, ensure_ascii=False, indent=2)
+
+
+def _split_ids(ids: Any) -> List[str]:
+    """Parse IDs given as a list, a JSON array or comma-separated text, dropping duplicates."""
+    if isinstance(ids, str):
+        text = ids.strip()
+        if text.startswith("["):
+            try:
+                ids = json.loads(text)
+            except json.JSONDecodeError:
+                ids = text.strip("[]").split(",")
+        else:
+            ids = text.split(",")
+    parsed = (str(i).strip().strip("'\"") for i in ids or ())
+    return list(dict.fromkeys(i for i in parsed if i))
+
+
+def fetch_records_by_id(
+    cursor: Any, table: str, codec: RecordCodec, ids: Sequence[str]
+) -> Dict[str, Record]:
+    """
+    Fetch rows by ID with ``IN (...)`` queries, one per 900 IDs.
+
+    Args:
+        cursor: Cursor of an open connection
+        table: Table to read
+        codec: Record codec of the table
+        ids: IDs to fetch
+
+    Returns:
+        Dict[str, Record]: Records found, keyed by ID
+    """
+    found: Dict[str, Record] = {}
+    for start in range(0, len(ids), _MAX_IN_PARAMS):
+        chunk = list(ids[start : start + _MAX_IN_PARAMS])
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"SELECT * FROM {table} WHERE id IN ({placeholders})", chunk)
+        found.update((record.id, record) for record in codec.fetchall(cursor))
+    return found
+
+
+def _batched_comparison(
+    anchor_kind: str,
+    anchor_id: str,
+    other_ids: Any,
+    max_tokens: int,
+    offset: int,
+) -> str:
+    """Build the deduplicated payload for one record compared with many."""
+    tables = {
+        "candidate": ("candidates", CANDIDATE_RECORDS, CANDIDATE_POLICY, "candidates"),
+        "bando_di_gara": ("bando_di_gara", BANDO_RECORDS, BANDO_POLICY, "bandi"),
+    }
+    other_kind = "bando_di_gara" if anchor_kind == "candidate" else "candidate"
+    anchor_table, anchor_codec, anchor_policy, _ = tables[anchor_kind]
+    other_table, other_codec, other_policy, other_key = tables[other_kind]
+
+    ids = _split_ids(other_ids)
+    if not ids:
+        return json.dumps({"error": f"No {other_kind} IDs provided"}, ensure_ascii=False)
+
+    with read_connection() as conn:
+        cursor = conn.cursor()
+        anchor = fetch_records_by_id(cursor, anchor_table, anchor_codec, [anchor_id])
+        others = fetch_records_by_id(cursor, other_table, other_codec, ids)
+
+    if anchor_id not in anchor:
+        return json.dumps({"error": f"{anchor_kind} {anchor_id} not found"}, ensure_ascii=False)
+
+    # The shared record is sent once; the other side is paginated with the rest of the budget
+    half = max_tokens // 2 if max_tokens and max_tokens > 0 else 0
+    anchor_data, anchor_omitted = shape_record(anchor[anchor_id].to_dict(), anchor_policy, half)
+    found = [others[i] for i in ids if i in others]
+    page = shape_records(found, other_policy, half, offset)
+
+    payload: Dict[str, Any] = {
+        anchor_kind: anchor_data,
+        other_key: {item["id"]: item for item in page.items},
+        "pairs": [
+            {
+                "candidate_id": anchor_id if anchor_kind == "candidate" else item["id"],
+                "bando_id": item["id"] if anchor_kind == "candidate" else anchor_id,
+            }
+            for item in page.items
+        ],
+    }
+    missing = [i for i in ids if i not in others]
+    if missing:
+        payload["not_found"] = missing
+    omitted: Dict[str, Any] = {}
+    if anchor_omitted:
+        omitted[anchor_kind] = anchor_omitted
+    other_omitted = page.omissions("get_comparison_data(candidate_id=..., bando_id=...)")
+    if other_omitted:
+        omitted[other_key] = other_omitted
+    if omitted:
+        payload["omitted"] = omitted
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def get_comparison_data_for_bandos(
+    candidate_id: str, bando_ids: str, max_tokens: int = DEFAULT_MAX_TOKENS, offset: int = 0
+) -> str:
+    """
+    Retrieve one candidate and several tender documents for comparison in one call.
+
+    Args:
+        candidate_id: The ID of the candidate to compare
+        bando_ids: Comma-separated Bando di Gara IDs (e.g. "1,2,5")
+        max_tokens: Approximate response budget in LLM tokens, half for the
+                    candidate and half for the tenders (0 = no limit)
+        offset: Index of the first tender to return when paginating
+
+    Returns:
+        str: JSON object with 'candidate', 'bandi' (keyed by ID) and 'pairs', plus
+             'not_found' for unknown IDs and 'omitted' when the response was shaped
+    """
+    return _batched_comparison("candidate", candidate_id, bando_ids, max_tokens, offset)
+
+
+def get_comparison_data_for_candidates(
+    bando_id: str, candidate_ids: str, max_tokens: int = DEFAULT_MAX_TOKENS, offset: int = 0
+) -> str:
+    """
+    Retrieve one tender document and several candidates for comparison in one call.
+
+    Args:
+        bando_id: The ID of the Bando di Gara to compare
+        candidate_ids: Comma-separated candidate IDs (e.g. "1,4,7")
+        max_tokens: Approximate response budget in LLM tokens, half for the
+                    tender and half for the candidates (0 = no limit)
+        offset: Index of the first candidate to return when paginating
+
+    Returns:
+        str: JSON object with 'bando_di_gara', 'candidates' (keyed by ID) and 'pairs',
+             plus 'not_found' for unknown IDs and 'omitted' when the response was shaped
+    """
+    return _batched_comparison("bando_di_gara", bando_id, candidate_ids, max_tokens, offset)
+
+
+def get_info_candidate(
+    candidate_id: Optional[str] = None,
+    since: Optional[int] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+) -> str:
+    """
+    Retrieve candidate(s) from the database.
+
+    Args:
+        candidate_id: Optional candidate ID. If provided, returns only that candidate;
+                     otherwise returns all candidates
+        since: Optional change sequence from a previous call. If provided, returns
+               only candidates changed after it (use 0 for a first full read)
+        max_tokens: Approximate response budget in LLM tokens (0 = no limit)
+        offset: Index of the first candidate to return when paginating
+
+    Returns:
+        str: JSON-encoded candidate data (single object or list), or with ``since``
+             an object with ``changed``, ``deleted`` and the new ``high_water_mark``
+    """
+    fetch_hint = "get_info_candidate(candidate_id=...)"
+    with read_connection() as conn:
+        cursor = conn.cursor()
+        if since is not None and not candidate_id:
+            changes = fetch_changes(conn, "candidates", since, CANDIDATE_RECORDS)
+            changed = listing_payload(
+                changes.records, CANDIDATE_POLICY, max_tokens, offset, fetch_hint
+            )
+            return json.dumps(changes.as_payload(since, changed), ensure_ascii=False, indent=2)
+        if candidate_id:
+            cursor.execute("SELECT * FROM candidates WHERE id = ?", (candidate_id,))
+        else:
+            cursor.execute("SELECT * FROM candidates ORDER BY created_at DESC")
+        records = CANDIDATE_RECORDS.fetchall(cursor)
+
+    if candidate_id:
+        if not records:
+            return json.dumps({}, ensure_ascii=False, indent=2)
+        result, omitted = shape_record(records[0].to_dict(), CANDIDATE_POLICY, max_tokens)
+        if omitted:
+            result["_omitted"] = omitted
+        return json.dumps(result, ensure_ascii=False, indent=2)
+    payload = listing_payload(records, CANDIDATE_POLICY, max_tokens, offset, fetch_hint)
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def get_info_bando(
+    bando_id: Optional[str] = None,
+    since: Optional[int] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+) -> str:
+    """
+    Retrieve Bando di Gara project(s) from the database.
+
+    Args:
+        bando_id: Optional tender ID. If provided, returns only that project;
+                 otherwise returns all projects
+        since: Optional change sequence from a previous call. If provided, returns
+               only projects changed after it (use 0 for a first full read)
+        max_tokens: Approximate response budget in LLM tokens (0 = no limit)
+        offset: Index of the first project to return when paginating
+
+    Returns:
+        str: JSON-encoded tender data (single object or list), or with ``since``
+             an object with ``changed``, ``deleted`` and the new ``high_water_mark``
+    """
+    fetch_hint = "get_info_bando(bando_id=...)"
+    with read_connection() as conn:
+        cursor = conn.cursor()
+        if since is not None and not bando_id:
+            changes = fetch_changes(conn, "bando_di_gara", since, BANDO_RECORDS)
+            changed = listing_payload(changes.records, BANDO_POLICY, max_tokens, offset, fetch_hint)
+            return json.dumps(changes.as_payload(since, changed), ensure_ascii=False, indent=2)
+        if bando_id:
+            cursor.execute("SELECT * FROM bando_di_gara WHERE id = ?", (bando_id,))
+        else:
+            cursor.execute("SELECT * FROM bando_di_gara ORDER BY created_at DESC")
+        records = BANDO_RECORDS.fetchall(cursor)
+
+    if bando_id:
+        if not records:
+            return json.dumps({}, ensure_ascii=False, indent=2)
+        result, omitted = shape_record(records[0].to_dict(), BANDO_POLICY, max_tokens)
+        if omitted:
+            result["_omitted"] = omitted
+        return json.dumps(result, ensure_ascii=False, indent=2)
+    payload = listing_payload(records, BANDO_POLICY, max_tokens, offset, fetch_hint)
+    return json.dumps(payload, ensure_ascii=False, indent=2)
@@ -0,0 +1,309 @@
+"""
+Document Ingest Fast Path for AI Recruitment Suite.
+
+This module classifies extracted documents as CV or Bando di Gara with a
+deterministic keyword and field scorer, validates them against compiled schemas
+and saves them in a single tool call, so the orchestrator does not need an extra
+LLM turn to choose between ``save_candidate_data`` and ``save_bando_data``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from tools.core.db_manager import insert_bando, insert_candidate
+
+CV = "CV"
+BANDO = "Bando di Gara"
+UNKNOWN = "Unknown"
+
+# Values the extractor uses for fields it could not find
+_PLACEHOLDERS = {"", "not specified", "not found in document", "n/a", "na", "none", "null", "-"}
+
+_KEYWORDS = {
+    CV: (
+        "curriculum", "curriculum vitae", "resume", "cv", "esperienza professionale",
+        "work experience", "istruzione", "education", "competenze", "skills",
+        "dati personali", "personal information", "lingue", "languages",
+    ),
+    BANDO: (
+        "bando", "gara", "tender", "appalto", "capitolato", "lotto", "cig",
+        "stazione appaltante", "procurement", "offerta", "requisiti", "requirements",
+        "deliverable", "scadenza", "deadline", "importo", "budget",
+    ),
+}  # fmt: skip
+
+_KEYWORD_PATTERNS = {
+    kind: re.compile(r"\b(?:" + "|".join(re.escape(k) for k in words) + r")\b", re.IGNORECASE)
+    for kind, words in _KEYWORDS.items()
+}
+
+# Scores added for the declared type, each distinctive field and each distinct keyword
+_DECLARED_WEIGHT = 3.0
+_FIELD_WEIGHT = 1.0
+_KEYWORD_WEIGHT = 0.5
+_MAX_KEYWORD_SCORE = 3.0
+
+# A type is accepted when it scores at least this much and beats the other by the margin
+_MIN_SCORE = 1.5
+_MIN_MARGIN = 1.0
+
+Validator = Callable[[Any, str, List[str]], Any]
+
+
+def _is_placeholder(value: Any) -> bool:
+    return isinstance(value, str) and value.strip().lower() in _PLACEHOLDERS
+
+
+def _text(value: Any, path: str, errors: List[str]) -> str:
+    if value is None or _is_placeholder(value):
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return ", ".join(item.strip() for item in value if not _is_placeholder(item))
+    errors.append(f"{path}: expected text, got {type(value).__name__}")
+    return ""
+
+
+def _text_list(value: Any, path: str, errors: List[str]) -> List[str]:
+    if value is None or _is_placeholder(value):
+        return []
+    if isinstance(value, str):
+        value = re.split(r"[,;\n]", value)
+    if not isinstance(value, list):
+        errors.append(f"{path}: expected a list of text, got {type(value).__name__}")
+        return []
+    items = []
+    for i, item in enumerate(value):
+        if isinstance(item, (int, float)) and not isinstance(item, bool):
+            item = str(item)
+        if not isinstance(item, str):
+            errors.append(f"{path}[{i}]: expected text, got {type(item).__name__}")
+        elif not _is_placeholder(item):
+            items.append(item.strip())
+    return items
+
+
+def _object(fields: Dict[str, Validator]) -> Validator:
+    def validate(value: Any, path: str, errors: List[str]) -> Dict[str, Any]:
+        if value is None or _is_placeholder(value):
+            value = {}
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected an object, got {type(value).__name__}")
+            value = {}
+        return {
+            name: check(value.get(name), f"{path}.{name}", errors) for name, check in fields.items()
+        }
+
+    return validate
+
+
+class DocumentSchema:
+    """
+    Compiled schema of one document type: one validator per field.
+
+    Validation normalizes the payload (placeholders become empty values,
+    comma-separated text becomes lists, unknown fields are dropped) and reports
+    structural errors and missing required fields.
+
+    Args:
+        document_type: Value of the ``document_type`` field for this schema
+        fields: Field name -> validator
+        required: Fields that must be non-empty (any one of each tuple)
+    """
+
+    def __init__(
+        self,
+        document_type: str,
+        fields: Dict[str, Validator],
+        required: Tuple[Tuple[str, ...], ...],
+    ) -> None:
+        self.document_type = document_type
+        self.fields = fields
+        self.required = required
+        self.check = _object(fields)
+
+    def validate(self, data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Validate and normalize an extracted payload.
+
+        Args:
+            data: Extracted document fields
+
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: Normalized payload and validation errors
+        """
+        errors: List[str] = []
+        clean = self.check(data, "$", errors)
+        clean["document_type"] = self.document_type
+        for alternatives in self.required:
+            if not any(clean.get(name) for name in alternatives):
+                errors.append(f"$.{' or $.'.join(alternatives)}: required")
+        return clean, errors
+
+
+CV_SCHEMA = DocumentSchema(
+    CV,
+    {
+        "candidate_name": _text,
+        "contact_info": _object({"email": _text, "phone": _text, "location": _text}),
+        "position_applied": _text,
+        "technical_skills": _text_list,
+        "experience_years": _text,
+        "education": _text,
+        "certifications": _text_list,
+        "previous_companies": _text_list,
+        "consulting_experience": _text,
+        "key_achievements": _text_list,
+        "languages": _text_list,
+        "industry_experience": _text_list,
+    },
+    required=(("candidate_name",),),
+)
+
+BANDO_SCHEMA = DocumentSchema(
+    BANDO,
+    {
+        "client_name": _text,
+        "project_title": _text,
+        "project_description": _text,
+        "required_skills": _text_list,
+        "experience_required": _text,
+        "education_requirements": _text,
+        "certifications_required": _text_list,
+        "project_duration": _text,
+        "team_size": _text,
+        "location": _text,
+        "deadline": _text,
+        "budget_range": _text,
+        "industry_sector": _text,
+        "key_deliverables": _text_list,
+    },
+    required=(("project_title", "client_name"),),
+)
+
+SCHEMAS = {CV: CV_SCHEMA, BANDO: BANDO_SCHEMA}
+
+# Fields that only appear in one document type
+_DISTINCTIVE_FIELDS = {
+    CV: tuple(name for name in CV_SCHEMA.fields if name not in BANDO_SCHEMA.fields),
+    BANDO: tuple(name for name in BANDO_SCHEMA.fields if name not in CV_SCHEMA.fields),
+}
+
+
+class Classification(NamedTuple):
+    """Detected document type with its scores."""
+
+    document_type: str  # CV, Bando di Gara or Unknown
+    confidence: float  # Share of the total score held by the detected type
+    scores: Dict[str, float]
+
+
+def _iter_text(value: Any):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_text(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_text(item)
+
+
+def classify_document(data: Any, source_filename: Optional[str] = None) -> Classification:
+    """
+    Decide whether extracted data (or raw text) is a CV or a Bando di Gara.
+
+    Scores each type from the declared ``document_type``, the distinctive fields
+    that are filled in and the distinct keywords found in the text and file name.
+
+    Args:
+        data: Extracted fields as a dict, or raw document text
+        source_filename: Optional uploaded file name
+
+    Returns:
+        Classification: Detected type, confidence and per-type scores
+
+    Example:
+        >>> classify_document("Bando di gara per appalto servizi cloud").document_type
+        'Bando di Gara'
+    """
+    fields = data if isinstance(data, dict) else {}
+    text = "\n".join(_iter_text(data))
+    if source_filename:
+        text += "\n" + re.sub(r"[_\-.]+", " ", source_filename)
+
+    scores = {CV: 0.0, BANDO: 0.0}
+    declared = fields.get("document_type")
+    if declared in scores:
+        scores[declared] += _DECLARED_WEIGHT
+    for kind in scores:
+        filled = sum(
+            1
+            for name in _DISTINCTIVE_FIELDS[kind]
+            if fields.get(name) and not _is_placeholder(fields.get(name))
+        )
+        keywords = {match.lower() for match in _KEYWORD_PATTERNS[kind].findall(text)}
+        scores[kind] += filled * _FIELD_WEIGHT
+        scores[kind] += min(len(keywords) * _KEYWORD_WEIGHT, _MAX_KEYWORD_SCORE)
+
+    best, other = sorted(scores, key=scores.get, reverse=True)
+    total = scores[best] + scores[other]
+    if scores[best] < _MIN_SCORE or scores[best] - scores[other] < _MIN_MARGIN:
+        return Classification(UNKNOWN, 0.0, scores)
+    return Classification(best, round(scores[best] / total, 2), scores)
+
+
+def classify_and_save_document(extracted_data: str, source_filename: Optional[str] = None) -> str:
+    """
+    Classify an extracted document, validate it and save it in one step.
+
+    Args:
+        extracted_data: JSON string returned by the document extractor
+        source_filename: Optional name of the uploaded file (improves classification)
+
+    Returns:
+        str: Confirmation with the detected type and new ID, or the validation
+             errors to fix before retrying
+    """
+    try:
+        from tools.core.db_manager_enhanced import clean_json_string
+
+        data = json.loads(clean_json_string(extracted_data))
+    except json.JSONDecodeError:
+        classification = classify_document(extracted_data, source_filename)
+        return (
+            f"❌ Error: extracted_data is not valid JSON (text looks like "
+            f"{classification.document_type}). Extract the structured fields first."
+        )
+    if not isinstance(data, dict):
+        return "❌ Error: extracted_data must be a JSON object"
+
+    classification = classify_document(data, source_filename)
+    if classification.document_type == UNKNOWN:
+        scores = ", ".join(f"{kind}: {score:g}" for kind, score in classification.scores.items())
+        return f"❌ Could not determine the document type ({scores}). Check the extraction."
+
+    clean, errors = SCHEMAS[classification.document_type].validate(data)
+    if errors:
+        return f"❌ Validation failed for {classification.document_type}:\n- " + "\n- ".join(errors)
+
+    try:
+        if classification.document_type == CV:
+            new_id = insert_candidate(clean)
+        else:
+            new_id = insert_bando(clean)
+    except Exception as e:
+        return f"❌ Error saving {classification.document_type}: {str(e)}"
+
+    return (
+        f"✅ Classified as {classification.document_type} "
+        f"(confidence {classification.confidence}) and saved with ID: {new_id}"
+    )
@@ -0,0 +1,313 @@
+"""
+Evaluation Retention and Archival for AI Recruitment Suite.
+
+The ``evaluations`` table is append-only, so re-evaluations of the same
+candidate/bando pair accumulate and slow down every scan and backup. This module
+applies a retention policy (keep the latest N evaluations of each pair and
+everything newer than a number of days), moves the rest into a compressed
+``evaluations_archive`` table, either in the recruitment database or in a
+separate archive database, and compacts the file with incremental vacuum.
+
+Archived evaluations are deleted from ``evaluations``, so clients reading the
+change feed with ``since`` see them as deleted.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import sqlite3
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from tools.core.db_connection import DB_PATH, write_transaction
+from tools.core.evaluation_tools import initialize_evaluation_database
+
+ARCHIVE_TABLE = "evaluations_archive"
+
+# Evaluations moved per INSERT/DELETE round trip
+_BATCH_SIZE = 500
+
+# PRAGMA auto_vacuum value for INCREMENTAL
+_INCREMENTAL = 2
+
+
+class RetentionPolicy(NamedTuple):
+    """Which evaluations stay in the hot database."""
+
+    keep_latest: int = 3  # Most recent evaluations kept for each candidate/bando pair
+    keep_days: int = 90  # Evaluations newer than this are always kept
+
+
+class SpaceReport(NamedTuple):
+    """Page usage of a database file."""
+
+    page_size: int
+    page_count: int
+    freelist_count: int  # Unused pages that incremental vacuum can release
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the database file in bytes."""
+        return self.page_size * self.page_count
+
+    @property
+    def free_bytes(self) -> int:
+        """Bytes held by unused pages."""
+        return self.page_size * self.freelist_count
+
+
+class MaintenanceReport(NamedTuple):
+    """Outcome of a retention and compaction run."""
+
+    archived: int  # Evaluations moved to the archive
+    remaining: int  # Evaluations left in the hot table
+    before: SpaceReport
+    after: SpaceReport
+    dry_run: bool
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        """Bytes released from the hot database file."""
+        # Switching to incremental mode adds pointer-map pages, which can grow a tiny file
+        return max(self.before.size_bytes - self.after.size_bytes, 0)
+
+    def summary(self) -> str:
+        """Describe the run in one line per fact."""
+        verb = "Would archive" if self.dry_run else "Archived"
+        return (
+            f"🗄️ {verb} {self.archived} evaluation(s); {self.remaining} remain in the hot table.\n"
+            f"💾 Database size: {self.before.size_bytes:,} → {self.after.size_bytes:,} bytes "
+            f"({self.reclaimed_bytes:,} reclaimed, {self.after.free_bytes:,} still free)"
+        )
+
+
+def space_report(conn: sqlite3.Connection) -> SpaceReport:
+    """
+    Read the page usage of the main database of a connection.
+
+    Args:
+        conn: Open connection to the recruitment database
+
+    Returns:
+        SpaceReport: Page size, page count and free pages
+    """
+    return SpaceReport(
+        *(conn.execute(f"PRAGMA {pragma}").fetchone()[0] for pragma in SpaceReport._fields)
+    )
+
+
+def ensure_archive_table(conn: sqlite3.Connection, schema: str = "main") -> None:
+    """
+    Create the archive table in the given schema if it does not exist.
+
+    Identifiers, scores and dates stay queryable; the summary text, which is
+    most of each row, is stored zlib-compressed.
+
+    Args:
+        conn: Open connection to the recruitment database
+        schema: ``main`` or the name of an attached archive database
+    """
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}.{ARCHIVE_TABLE} (
+            evaluation_id INTEGER PRIMARY KEY,
+            candidate_id TEXT NOT NULL,
+            bando_id TEXT NOT NULL,
+            match_score INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            archived_at TEXT NOT NULL,
+            evaluation_summary BLOB
+        )
+    """
+    )
+
+
+def expired_evaluation_ids(
+    conn: sqlite3.Connection, policy: RetentionPolicy, now: Optional[datetime] = None
+) -> List[int]:
+    """
+    List the evaluations that fall outside the retention policy.
+
+    An evaluation expires when it is older than ``keep_days`` and is not among
+    the ``keep_latest`` most recent evaluations of its candidate/bando pair.
+
+    Args:
+        conn: Open connection to the recruitment database
+        policy: Retention policy to apply
+        now: Reference time for ``keep_days`` (default: current time)
+
+    Returns:
+        List[int]: IDs of the expired evaluations, oldest first
+    """
+    cutoff = ((now or datetime.now()) - timedelta(days=policy.keep_days)).isoformat()
+    rows = conn.execute(
+        """
+        SELECT evaluation_id FROM (
+            SELECT evaluation_id, created_at,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY candidate_id, bando_id
+                       ORDER BY created_at DESC, evaluation_id DESC
+                   ) AS recency
+            FROM evaluations
+        )
+        WHERE recency > ? AND created_at < ?
+        ORDER BY evaluation_id
+    """,
+        (max(policy.keep_latest, 0), cutoff),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def archive_evaluations(
+    conn: sqlite3.Connection, evaluation_ids: List[int], schema: str = "main"
+) -> int:
+    """
+    Move evaluations into the compressed archive table.
+
+    Runs on the caller's connection and does not commit, so the copy and the
+    delete are applied together.
+
+    Args:
+        conn: Open connection to the recruitment database
+        evaluation_ids: Evaluations to move
+        schema: ``main`` or the name of an attached archive database
+
+    Returns:
+        int: Number of evaluations moved
+    """
+    ensure_archive_table(conn, schema)
+    archived_at = datetime.now().isoformat()
+    moved = 0
+    for start in range(0, len(evaluation_ids), _BATCH_SIZE):
+        batch = evaluation_ids[start : start + _BATCH_SIZE]
+        placeholders = ",".join("?" * len(batch))
+        rows = conn.execute(
+            f"""
+            SELECT evaluation_id, candidate_id, bando_id, match_score, created_at,
+                   evaluation_summary
+            FROM evaluations WHERE evaluation_id IN ({placeholders})
+        """,
+            batch,
+        ).fetchall()
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {schema}.{ARCHIVE_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (*row[:5], archived_at, zlib.compress((row[5] or "").encode("utf-8")))
+                for row in rows
+            ],
+        )
+        conn.execute(f"DELETE FROM evaluations WHERE evaluation_id IN ({placeholders})", batch)
+        moved += len(rows)
+    return moved
+
+
+def load_archived_evaluations(
+    db_path: str = DB_PATH,
+    candidate_id: Optional[str] = None,
+    bando_id: Optional[str] = None,
+    archive_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Read archived evaluations with their summaries decompressed.
+
+    Args:
+        db_path: Path to the recruitment database file
+        candidate_id: Optional candidate filter
+        bando_id: Optional Bando di Gara filter
+        archive_path: Separate archive database, if one was used
+
+    Returns:
+        List[Dict[str, Any]]: Archived evaluations, newest first
+    """
+    clauses, params = [], []
+    for column, value in (("candidate_id", candidate_id), ("bando_id", bando_id)):
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    with sqlite3.connect(archive_path or db_path) as conn:
+        ensure_archive_table(conn)
+        cursor = conn.execute(
+            f"SELECT * FROM {ARCHIVE_TABLE} {where} ORDER BY created_at DESC, evaluation_id DESC",
+            params,
+        )
+        columns = [col[0] for col in cursor.description]
+        records = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    for record in records:
+        record["evaluation_summary"] = zlib.decompress(record["evaluation_summary"]).decode("utf-8")
+    return records
+
+
+def compact_database(conn: sqlite3.Connection, max_pages: Optional[int] = None) -> None:
+    """
+    Release free pages back to the file system.
+
+    The first run switches the database to ``auto_vacuum = INCREMENTAL``, which
+    takes one full ``VACUUM``; later runs only use ``PRAGMA incremental_vacuum``,
+    which is cheap enough to schedule often.
+
+    Args:
+        conn: Connection in autocommit mode (``isolation_level=None``)
+        max_pages: Maximum pages to release in this run (default: all)
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != _INCREMENTAL:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+    elif max_pages:
+        conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})").fetchall()
+    else:
+        conn.execute("PRAGMA incremental_vacuum").fetchall()
+
+
+def run_maintenance(
+    db_path: str = DB_PATH,
+    policy: Optional[RetentionPolicy] = None,
+    archive_path: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    dry_run: bool = False,
+    now: Optional[datetime] = None,
+) -> MaintenanceReport:
+    """
+    Archive expired evaluations and compact the hot database.
+
+    Meant for the ``ai-recruitment maintain`` command and cron jobs: the first run
+    on a database rewrites the whole file (see ``compact_database``).
+
+    Args:
+        db_path: Path to the recruitment database file
+        policy: Retention policy to apply (default: ``RetentionPolicy()``)
+        archive_path: Separate archive database (default: archive in ``db_path``)
+        max_pages: Maximum pages released by incremental vacuum (default: all)
+        dry_run: Only count the evaluations that would be archived
+        now: Reference time for the policy (default: current time)
+
+    Returns:
+        MaintenanceReport: Evaluations archived and space reclaimed
+
+    Example:
+        >>> print(run_maintenance(policy=RetentionPolicy(keep_latest=1, keep_days=30)).summary())
+        🗄️ Archived 412 evaluation(s); 88 remain in the hot table.
+        💾 Database size: 1,236,992 → 389,120 bytes (847,872 reclaimed, 0 still free)
+    """
+    policy = policy or RetentionPolicy()
+    initialize_evaluation_database(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        before = space_report(conn)
+        expired = expired_evaluation_ids(conn, policy, now)
+        archived = len(expired)
+        if expired and not dry_run:
+            attach = {"archive": archive_path} if archive_path else None
+            with write_transaction(db_path, attach=attach) as writer:
+                archived = archive_evaluations(writer, expired, "archive" if attach else "main")
+        if not dry_run:
+            compact_database(conn, max_pages)
+        remaining = conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+        if dry_run:
+            remaining -= archived
+        return MaintenanceReport(archived, remaining, before, space_report(conn), dry_run)
+    finally:
+        conn.close()
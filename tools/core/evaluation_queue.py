@@ -0,0 +1,291 @@
+"""
+Evaluation Work Queue for AI Recruitment Suite.
+
+This module keeps a persistent queue of (candidate, bando) evaluation jobs in the
+``evaluation_jobs`` table. Jobs are ordered by the parsed bando deadline (soonest
+first, no deadline last) and then by the candidate's pre-rank score (the coverage
+from the skill-gap matrix), so parallel evaluator sessions drain the most urgent
+and most promising work first.
+
+Workers claim jobs with a lease: a claimed job is invisible to other workers until
+its lease expires, after which it is handed out again (up to ``MAX_ATTEMPTS``
+times). Claims run in a ``BEGIN IMMEDIATE`` transaction, and completing a job
+saves the evaluation and closes the job in the same transaction, so no pair is
+evaluated twice.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+import time
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from tools.core.db_connection import DB_PATH, write_transaction
+from tools.core.evaluation_tools import insert_evaluation
+from tools.core.skill_gaps import parse_deadline, refresh_bando_gaps
+
+DEFAULT_LEASE_SECONDS = 600
+MAX_ATTEMPTS = 3
+
+
+def initialize_queue_table(db_path: str = DB_PATH) -> None:
+    """
+    Create the evaluation_jobs table.
+
+    Args:
+        db_path: Path to the recruitment database file
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluation_jobs (
+                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                candidate_id TEXT NOT NULL,
+                bando_id TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                due_date TEXT,
+                prerank REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                leased_by TEXT,
+                lease_token TEXT,
+                lease_expires_at REAL,
+                evaluation_id INTEGER,
+                created_at TEXT NOT NULL,
+                completed_at TEXT,
+                UNIQUE (candidate_id, bando_id)
+            )
+        """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_evaluation_jobs_queue "
+            "ON evaluation_jobs (status, due_date, prerank)"
+        )
+
+
+def _pending_count(cursor: sqlite3.Cursor) -> int:
+    return cursor.execute(
+        "SELECT COUNT(*) FROM evaluation_jobs WHERE status IN ('pending', 'leased')"
+    ).fetchone()[0]
+
+
+def enqueue_bando_evaluations(
+    bando_id: str, min_coverage: float = 0.0, reevaluate: bool = False
+) -> str:
+    """
+    Queue an evaluation job for every candidate against one open Bando di Gara.
+
+    Args:
+        bando_id: The ID of the Bando di Gara
+        min_coverage: Skip candidates meeting less than this share of the requirements
+        reevaluate: Also queue pairs that were already evaluated
+
+    Returns:
+        str: Confirmation with the number of jobs queued and skipped
+    """
+    try:
+        with write_transaction() as conn:
+            cursor = conn.cursor()
+            bando = cursor.execute(
+                "SELECT deadline FROM bando_di_gara WHERE id = ?", (bando_id,)
+            ).fetchone()
+            if bando is None:
+                return f"❌ Bando di Gara with ID {bando_id} not found"
+            due = parse_deadline(bando[0])
+            if due is not None and due < date.today():
+                return f"❌ Bando di Gara {bando_id} is closed (deadline {due.isoformat()})"
+            due_date = due.isoformat() if due else None
+
+            # Pre-rank by requirement coverage from the skill-gap matrix
+            refresh_bando_gaps(cursor, bando_id, only_missing=True)
+            cursor.execute(
+                "SELECT g.candidate_id, COALESCE(g.coverage, 0) FROM skill_gaps g "
+                "JOIN candidates c ON c.id = g.candidate_id WHERE g.bando_id = ?",
+                (bando_id,),
+            )
+            coverage = dict(cursor.fetchall())
+            evaluated = {
+                row[0]
+                for row in cursor.execute(
+                    "SELECT DISTINCT candidate_id FROM evaluations WHERE bando_id = ?", (bando_id,)
+                )
+            }
+            existing = dict(
+                cursor.execute(
+                    "SELECT candidate_id, status FROM evaluation_jobs WHERE bando_id = ?",
+                    (bando_id,),
+                ).fetchall()
+            )
+
+            counts = {"queued": 0, "already queued": 0, "already evaluated": 0, "below": 0}
+            now = datetime.now().isoformat()
+            for candidate_id, score in coverage.items():
+                status = existing.get(candidate_id)
+                if score < min_coverage:
+                    counts["below"] += 1
+                elif status in ("pending", "leased"):
+                    counts["already queued"] += 1
+                elif (status == "done" or candidate_id in evaluated) and not reevaluate:
+                    counts["already evaluated"] += 1
+                else:
+                    cursor.execute(
+                        """
+                        INSERT INTO evaluation_jobs
+                            (candidate_id, bando_id, due_date, prerank, created_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT (candidate_id, bando_id) DO UPDATE SET
+                            status = 'pending', due_date = excluded.due_date,
+                            prerank = excluded.prerank, attempts = 0, leased_by = NULL,
+                            lease_token = NULL, lease_expires_at = NULL,
+                            evaluation_id = NULL, completed_at = NULL
+                        """,
+                        (candidate_id, bando_id, due_date, score, now),
+                    )
+                    counts["queued"] += 1
+            pending = _pending_count(cursor)
+
+        return (
+            f"✅ Queued {counts['queued']} evaluation job(s) for Bando {bando_id} "
+            f"(deadline {due_date or 'not specified'}); skipped {counts['already queued']} "
+            f"already queued, {counts['already evaluated']} already evaluated, "
+            f"{counts['below']} below {min_coverage:.0%} coverage. Open jobs: {pending}"
+        )
+
+    except sqlite3.Error as e:
+        return f"❌ Database error while queueing evaluations: {str(e)}"
+
+
+def claim_evaluation_jobs(
+    worker_id: str,
+    limit: int = 1,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    now: Optional[float] = None,
+) -> str:
+    """
+    Lease the most urgent pending evaluation jobs to a worker.
+
+    Jobs whose lease expired are handed out again; after ``MAX_ATTEMPTS`` expired
+    leases a job is marked failed instead.
+
+    Args:
+        worker_id: Name of the evaluator session claiming the jobs
+        limit: Maximum number of jobs to claim
+        lease_seconds: Seconds before an uncompleted job is handed out again
+        now: Current time as a UNIX timestamp (default: ``time.time()``)
+
+    Returns:
+        str: JSON object with the claimed jobs (and their lease tokens) and the
+             number of open jobs
+    """
+    now = time.time() if now is None else now
+    try:
+        with write_transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE evaluation_jobs SET status = 'failed', lease_token = NULL "
+                "WHERE status = 'leased' AND lease_expires_at < ? AND attempts >= ?",
+                (now, MAX_ATTEMPTS),
+            )
+            cursor.execute(
+                """
+                SELECT job_id, candidate_id, bando_id, due_date, prerank, attempts
+                FROM evaluation_jobs
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires_at < ?)
+                ORDER BY due_date IS NULL, due_date, prerank DESC, job_id
+                LIMIT ?
+                """,
+                (now, max(int(limit), 1)),
+            )
+            jobs: List[Dict[str, Any]] = []
+            for job_id, candidate_id, bando_id, due_date, prerank, attempts in cursor.fetchall():
+                token = uuid.uuid4().hex[:16]
+                cursor.execute(
+                    "UPDATE evaluation_jobs SET status = 'leased', leased_by = ?, "
+                    "lease_token = ?, lease_expires_at = ?, attempts = attempts + 1 "
+                    "WHERE job_id = ?",
+                    (worker_id, token, now + lease_seconds, job_id),
+                )
+                jobs.append(
+                    {
+                        "job_id": job_id,
+                        "lease_token": token,
+                        "candidate_id": candidate_id,
+                        "bando_id": bando_id,
+                        "deadline": due_date,
+                        "prerank": prerank,
+                        "attempt": attempts + 1,
+                        "lease_expires_at": datetime.fromtimestamp(now + lease_seconds).isoformat(
+                            timespec="seconds"
+                        ),
+                    }
+                )
+            pending = _pending_count(cursor)
+
+        return json.dumps({"worker_id": worker_id, "jobs": jobs, "open_jobs": pending}, indent=2)
+
+    except sqlite3.Error as e:
+        return f"❌ Database error while claiming evaluation jobs: {str(e)}"
+
+
+def complete_evaluation_job(
+    job_id: int, lease_token: str, match_score: int, evaluation_summary: str
+) -> str:
+    """
+    Save the evaluation of a claimed job and close the job in one transaction.
+
+    Args:
+        job_id: ID of the claimed job
+        lease_token: Token returned by :func:`claim_evaluation_jobs`
+        match_score: Numerical score (0-100) representing the candidate's fit
+        evaluation_summary: Brief text summary justifying the score
+
+    Returns:
+        str: Confirmation with the new evaluation ID, or why the job was not completed
+    """
+    if not all([job_id, lease_token, evaluation_summary]) or match_score is None:
+        return (
+            "❌ Error: Missing one or more required parameters "
+            "(job_id, lease_token, match_score, evaluation_summary)."
+        )
+
+    try:
+        with write_transaction() as conn:
+            cursor = conn.cursor()
+            job = cursor.execute(
+                "SELECT candidate_id, bando_id, status, lease_token FROM evaluation_jobs "
+                "WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+            if job is None:
+                return f"❌ Evaluation job {job_id} not found"
+            candidate_id, bando_id, status, token = job
+            if status != "leased" or token != lease_token:
+                return (
+                    f"❌ Evaluation job {job_id} is not leased with this token (status: {status}); "
+                    "its lease expired and it was claimed again, or it is already completed"
+                )
+
+            now = datetime.now().isoformat()
+            evaluation_id = insert_evaluation(
+                cursor, candidate_id, bando_id, match_score, evaluation_summary, now, True
+            )
+            cursor.execute(
+                "UPDATE evaluation_jobs SET status = 'done', evaluation_id = ?, "
+                "completed_at = ?, lease_token = NULL WHERE job_id = ?",
+                (evaluation_id, now, job_id),
+            )
+
+        return (
+            f"✅ Evaluation job {job_id} completed (candidate {candidate_id}, bando {bando_id}). "
+            f"Assigned Evaluation ID: {evaluation_id}"
+        )
+
+    except ValueError as e:
+        # The transaction was rolled back: the job stays leased and can be completed again
+        return f"❌ Error: {str(e)}"
+    except sqlite3.Error as e:
+        return f"❌ Database error while completing evaluation job: {str(e)}"
@@ -0,0 +1,238 @@
+"""
+Evaluation Tools for AI Recruitment Suite.
+
+This module provides tools for evaluating candidate-to-tender matches,
+saving evaluation results, and retrieving evaluation history.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import Dict, Optional
+
+from tools.core.change_log import fetch_changes, install_change_log
+from tools.core.db_connection import DB_PATH, read_connection, write_transaction
+from tools.core.records import EVALUATION_RECORDS
+from tools.core.response_budget import DEFAULT_MAX_TOKENS, EVALUATION_POLICY, listing_payload
+from tools.core.result_cache import RESULT_CACHE
+
+
+def initialize_evaluation_database(db_path: str = DB_PATH) -> None:
+    """
+    Initialize the evaluations table in the recruitment database.
+
+    Creates the evaluations table if it doesn't exist, with foreign key
+    references to candidates and bando_di_gara tables.
+
+    Args:
+        db_path: Path to the recruitment database file
+
+    Raises:
+        sqlite3.Error: If database initialization fails
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluations (
+                evaluation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                candidate_id TEXT NOT NULL,
+                bando_id TEXT NOT NULL,
+                match_score INTEGER NOT NULL,
+                evaluation_summary TEXT,
+                created_at TEXT NOT NULL,
+                FOREIGN KEY (candidate_id) REFERENCES candidates (id),
+                FOREIGN KEY (bando_id) REFERENCES bando_di_gara (id)
+            )
+        """
+        )
+        install_change_log(cursor)
+
+
+def insert_evaluation(
+    cursor: sqlite3.Cursor,
+    candidate_id: str,
+    bando_id: str,
+    match_score: int,
+    evaluation_summary: str,
+    created_at: Optional[str] = None,
+    require_existing: bool = False,
+) -> int:
+    """
+    Validate an evaluation and insert it on the caller's cursor.
+
+    Shared by every tool that writes evaluations, so each one applies the same
+    score check; nothing is committed here.
+
+    Args:
+        cursor: Cursor inside an open write transaction
+        candidate_id: The ID of the evaluated candidate
+        bando_id: The ID of the Bando di Gara
+        match_score: Score from 0 to 100 (integral floats such as 85.0 are accepted)
+        evaluation_summary: Brief text summary justifying the score
+        created_at: ISO timestamp of the evaluation (default: now)
+        require_existing: Reject IDs that are not in the candidates and bando tables
+
+    Returns:
+        int: The new evaluation ID
+
+    Raises:
+        ValueError: If the score is not a whole number from 0 to 100, or if
+            ``require_existing`` is set and the candidate or bando does not exist
+    """
+    try:
+        integral = not isinstance(match_score, bool) and float(match_score).is_integer()
+    except (TypeError, ValueError):
+        integral = False
+    if not integral or not 0 <= int(float(match_score)) <= 100:
+        raise ValueError(f"match_score must be a whole number from 0 to 100, got {match_score!r}.")
+    match_score = int(float(match_score))
+    if require_existing:
+        for table, label, entity_id in (
+            ("candidates", "Candidate", candidate_id),
+            ("bando_di_gara", "Bando di Gara", bando_id),
+        ):
+            row = cursor.execute(f"SELECT 1 FROM {table} WHERE id = ?", (entity_id,)).fetchone()
+            if row is None:
+                raise ValueError(f"{label} with ID {entity_id} not found.")
+
+    cursor.execute(
+        "INSERT INTO evaluations (candidate_id, bando_id, match_score, evaluation_summary, "
+        "created_at) VALUES (?, ?, ?, ?, ?)",
+        (
+            candidate_id,
+            bando_id,
+            match_score,
+            evaluation_summary,
+            created_at or datetime.now().isoformat(),
+        ),
+    )
+    return cursor.lastrowid
+
+
+def save_evaluation_result(
+    candidate_id: str, bando_id: str, match_score: int, evaluation_summary: str
+) -> str:
+    """
+    Save the result of a candidate-to-tender evaluation to the database.
+
+    Args:
+        candidate_id: The ID of the candidate being evaluated
+        bando_id: The ID of the Bando di Gara used for comparison
+        match_score: Numerical score (0-100) representing the candidate's fit; scores
+                     outside that range or with a fractional part are rejected
+        evaluation_summary: Brief text summary justifying the score
+
+    Returns:
+        str: Confirmation message with the new evaluation ID
+
+    Raises:
+        sqlite3.Error: If database operation fails
+    """
+    if not all([candidate_id, bando_id, evaluation_summary]) or match_score is None:
+        return (
+            "❌ Error: Missing one or more required parameters "
+            "(candidate_id, bando_id, match_score, evaluation_summary)."
+        )
+
+    try:
+        with write_transaction() as conn:
+            new_evaluation_id = insert_evaluation(
+                conn.cursor(), candidate_id, bando_id, match_score, evaluation_summary
+            )
+
+        return f"✅ Evaluation saved successfully. Assigned Evaluation ID: {new_evaluation_id}"
+
+    except ValueError as e:
+        return f"❌ Error: {str(e)}"
+    except sqlite3.Error as e:
+        return f"❌ Database error while saving evaluation: {str(e)}"
+
+
+def get_evaluation_results(
+    evaluation_id: Optional[str] = None,
+    candidate_id: Optional[str] = None,
+    bando_id: Optional[str] = None,
+    since: Optional[int] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+) -> str:
+    """
+    Retrieve saved evaluation records from the database based on optional filters.
+
+    Args:
+        evaluation_id: Optional specific ID of an evaluation to retrieve
+        candidate_id: Optional candidate ID to retrieve all evaluations for
+        bando_id: Optional Bando di Gara ID to retrieve all evaluations for
+        since: Optional change sequence from a previous call. If provided, returns
+               only evaluations changed after it (use 0 for a first full read)
+        max_tokens: Approximate response budget in LLM tokens (0 = no limit)
+        offset: Index of the first evaluation to return when paginating
+
+    Returns:
+        str: JSON formatted list of matching evaluation records, or with ``since``
+             an object with ``changed``, ``deleted`` and the new ``high_water_mark``
+    """
+    fetch_hint = "get_evaluation_results(evaluation_id=...)"
+    # Filters are applied only when truthy and compared as text, so this key
+    # identifies the query; unchanged results are served from the result cache
+    filters = {
+        "evaluation_id": str(evaluation_id) if evaluation_id else None,
+        "candidate_id": str(candidate_id) if candidate_id else None,
+        "bando_id": str(bando_id) if bando_id else None,
+    }
+    try:
+        if since is None:
+            return RESULT_CACHE.get_or_compute(
+                DB_PATH,
+                "evaluations",
+                (tuple(filters.items()), max_tokens, offset),
+                lambda: _list_evaluations(filters, max_tokens, offset, fetch_hint),
+            )
+
+        with read_connection(DB_PATH) as conn:
+            changes = fetch_changes(conn, "evaluations", since, EVALUATION_RECORDS)
+            records = [
+                record
+                for record in changes.records
+                if all(not v or str(record[k]) == v for k, v in filters.items())
+            ]
+            changed = listing_payload(records, EVALUATION_POLICY, max_tokens, offset, fetch_hint)
+            return json.dumps(changes.as_payload(since, changed), indent=2)
+
+    except sqlite3.Error as e:
+        return f"❌ Database error while retrieving evaluations: {str(e)}"
+
+
+def _list_evaluations(
+    filters: Dict[str, Optional[str]], max_tokens: int, offset: int, fetch_hint: str
+) -> str:
+    """Run the filtered evaluation query and serialize one page of the results."""
+    with read_connection(DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row  # Access columns by name
+        cursor = conn.cursor()
+
+        query = "SELECT * FROM evaluations"
+        conditions = [f"{column} = ?" for column, value in filters.items() if value]
+        params = [value for value in filters.values() if value]
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY created_at DESC"
+
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+
+        # Convert rows to a list of dictionaries
+        results = [dict(row) for row in rows]
+
+    if not results:
+        return "No matching evaluations found."
+
+    payload = listing_payload(results, EVALUATION_POLICY, max_tokens, offset, fetch_hint)
+    return json.dumps(payload, indent=2)
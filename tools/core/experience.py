@@ -0,0 +1,257 @@
+"""
+Experience Normalization Tools for AI Recruitment Suite.
+
+This module parses the free-text ``experience_years`` (candidates) and
+``experience_required`` (tenders) fields into numeric minimum/maximum years, stores
+them in indexed columns and provides a range filter that runs entirely in SQLite.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import re
+import sqlite3
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from tools.core.db_connection import read_connection
+from tools.core.response_budget import DEFAULT_MAX_TOKENS, PAGINATE_ONLY, listing_payload
+
+# (table, free-text column, min column, max column)
+EXPERIENCE_COLUMNS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("candidates", "experience_years", "experience_years_min", "experience_years_max"),
+    (
+        "bando_di_gara",
+        "experience_required",
+        "experience_required_min",
+        "experience_required_max",
+    ),
+)
+
+_NUMBER_WORDS = {
+    "uno": 1, "un": 1, "one": 1, "due": 2, "two": 2, "tre": 3, "three": 3,
+    "quattro": 4, "four": 4, "cinque": 5, "five": 5, "sei": 6, "six": 6,
+    "sette": 7, "seven": 7, "otto": 8, "eight": 8, "nove": 9, "nine": 9,
+    "dieci": 10, "ten": 10, "quindici": 15, "fifteen": 15, "venti": 20, "twenty": 20,
+}  # fmt: skip
+
+_NUM = r"(\d+(?:[.,]\d+)?)"
+_NUMBER_WORD = re.compile(r"\b(" + "|".join(_NUMBER_WORDS) + r")\b")
+_RANGE = re.compile(
+    rf"(?:\bda\s+|\btra\s+|\bbetween\s+|\bfrom\s+)?{_NUM}"
+    rf"\s*(?:-|–|—|/|\bto\b|\ba\b|\be\b|\band\b)\s*{_NUM}"
+)
+_AT_LEAST = re.compile(
+    r"(?:\bat\s+least|\balmeno|\bminimo|\bmin\.?|\bminimum|\boltre|\bpiù\s+di|\bpiu\s+di"
+    r"|\bmore\s+than|\bover|>=?|≥)\s*$"
+)
+_AT_MOST = re.compile(
+    r"(?:\bup\s+to|\bfino\s+a|\bmassimo|\bmax\.?|\bmaximum|\bmeno\s+di|\bless\s+than"
+    r"|\bunder|<=?|≤)\s*$"
+)
+_SINGLE = re.compile(rf"{_NUM}\s*(\+)?")
+_MONTHS = re.compile(r"^\s*\+?\s*(?:mesi|mese|months?|mos?)\b")
+
+
+def _calendar_year(value: str) -> Optional[int]:
+    year = int(value) if value.isdigit() else 0
+    return year if 1950 <= year <= datetime.now().year else None
+
+
+def _to_years(value: str, unit_text: str) -> float:
+    year = _calendar_year(value)
+    if year is not None:  # "dal 2015" / "since 2015"
+        return float(datetime.now().year - year)
+    years = float(value.replace(",", "."))
+    if _MONTHS.match(unit_text):
+        return round(years / 12, 2)
+    return years
+
+
+def parse_experience_years(text: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Parse a free-text experience statement into a (min, max) range in years.
+
+    Handles Italian and English phrasing such as "5+ anni", "circa 10 years",
+    "3-5 anni", "6-12 mesi", "almeno 7 anni", "fino a 2 anni", "18 mesi",
+    "2015-2020" (a calendar span) and "dal 2015" (open-ended).
+
+    Args:
+        text: Free-text experience value
+
+    Returns:
+        Tuple[Optional[float], Optional[float]]: Minimum and maximum years; an
+        open-ended bound is None, and (None, None) means the text had no number
+
+    Example:
+        >>> parse_experience_years("5+ anni")
+        (5.0, None)
+        >>> parse_experience_years("3-5 years")
+        (3.0, 5.0)
+    """
+    if not text:
+        return None, None
+    s = _NUMBER_WORD.sub(lambda m: str(_NUMBER_WORDS[m.group(1)]), str(text).lower())
+
+    match = _RANGE.search(s)
+    if match:
+        start, end = _calendar_year(match.group(1)), _calendar_year(match.group(2))
+        if start is not None and end is not None:  # "2015-2020" is a calendar span
+            span = float(abs(end - start))
+            return span, span
+        # One unit for both bounds: "6-12 mesi" is half a year to a year
+        unit = s[match.end() :]
+        low, high = _to_years(match.group(1), unit), _to_years(match.group(2), unit)
+        return min(low, high), max(low, high)
+
+    match = _SINGLE.search(s)
+    if not match:
+        return None, None
+    years = _to_years(match.group(1), s[match.end() :])
+    prefix = s[: match.start()]
+    # Experience counted from a calendar year keeps growing, so it has no maximum
+    if match.group(2) or _AT_LEAST.search(prefix) or _calendar_year(match.group(1)):
+        return years, None
+    if _AT_MOST.search(prefix):
+        return 0.0, years
+    return years, years
+
+
+def add_experience_columns(cursor: sqlite3.Cursor) -> None:
+    """
+    Add the numeric experience columns and their indexes if they are missing.
+
+    Called from the ``init_db`` migrations; tables that do not exist yet are skipped.
+
+    Args:
+        cursor: Cursor of the connection running the migration
+    """
+    for table, _, min_col, max_col in EXPERIENCE_COLUMNS:
+        cursor.execute(f"PRAGMA table_info({table});")
+        existing_cols = {row[1] for row in cursor.fetchall()}
+        if not existing_cols:
+            continue
+        for column in (min_col, max_col):
+            if column not in existing_cols:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} REAL;")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{min_col} ON {table} ({min_col})")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{max_col} ON {table} ({max_col})")
+
+
+def backfill_experience_ranges(cursor: sqlite3.Cursor) -> int:
+    """
+    Parse the experience text of rows that have no numeric range yet.
+
+    Args:
+        cursor: Cursor of the connection running the migration
+
+    Returns:
+        int: Number of rows updated
+    """
+    updated = 0
+    for table, text_col, min_col, max_col in EXPERIENCE_COLUMNS:
+        cursor.execute(f"PRAGMA table_info({table});")
+        if min_col not in {row[1] for row in cursor.fetchall()}:
+            continue
+        rows = cursor.execute(
+            f"SELECT id, {text_col} FROM {table} "
+            f"WHERE {min_col} IS NULL AND {max_col} IS NULL AND COALESCE({text_col}, '') != ''"
+        ).fetchall()
+        updates = []
+        for row_id, text in rows:
+            low, high = parse_experience_years(text)
+            if low is not None or high is not None:
+                updates.append((low, high, row_id))
+        cursor.executemany(f"UPDATE {table} SET {min_col} = ?, {max_col} = ? WHERE id = ?", updates)
+        updated += len(updates)
+    return updated
+
+
+def _experience_range_clause(
+    min_years: Optional[float], max_years: Optional[float]
+) -> Tuple[str, List[float]]:
+    clause = "experience_years_min IS NOT NULL"
+    params: List[float] = []
+    if min_years is not None:
+        clause += " AND experience_years_min >= ?"
+        params.append(min_years)
+    if max_years is not None:
+        clause += " AND experience_years_min <= ?"
+        params.append(max_years)
+    return clause, params
+
+
+def candidates_with_experience(
+    conn: sqlite3.Connection, min_years: Optional[float] = None, max_years: Optional[float] = None
+) -> List[str]:
+    """
+    Return the IDs of candidates whose stated experience falls in a range.
+
+    A candidate qualifies when the lower bound of their experience is at least
+    ``min_years`` and at most ``max_years``; both predicates use the indexed column.
+
+    Args:
+        conn: Open connection to the recruitment database
+        min_years: Minimum years of experience required
+        max_years: Maximum years of experience accepted
+
+    Returns:
+        List[str]: Matching candidate IDs
+    """
+    clause, params = _experience_range_clause(min_years, max_years)
+    return [row[0] for row in conn.execute(f"SELECT id FROM candidates WHERE {clause}", params)]
+
+
+def filter_candidates_by_experience(
+    min_years: Optional[float] = None,
+    max_years: Optional[float] = None,
+    bando_id: Optional[str] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+) -> str:
+    """
+    Find candidates by years of experience without reading every profile.
+
+    Args:
+        min_years: Optional minimum years of experience (e.g. 7 for "at least 7 years")
+        max_years: Optional maximum years of experience
+        bando_id: Optional Bando di Gara ID; its required experience is used as
+                  the minimum when min_years is not given
+        max_tokens: Approximate response budget in LLM tokens; longer results are
+                    paginated (0 = no limit)
+        offset: Index of the first candidate to return when paginating
+
+    Returns:
+        str: JSON list of matching candidates with their parsed experience range
+    """
+    try:
+        with read_connection() as conn:
+            if bando_id and min_years is None:
+                row = conn.execute(
+                    "SELECT experience_required_min FROM bando_di_gara WHERE id = ?", (bando_id,)
+                ).fetchone()
+                if row is None:
+                    return f"❌ Bando di Gara with ID {bando_id} not found"
+                min_years = row[0]
+
+            clause, params = _experience_range_clause(min_years, max_years)
+            cursor = conn.execute(
+                "SELECT id, candidate_name, experience_years, experience_years_min, "
+                f"experience_years_max FROM candidates WHERE {clause} "
+                "ORDER BY experience_years_min DESC",
+                params,
+            )
+            cols = [col[0] for col in cursor.description]
+            results = [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+        if not results:
+            return "No candidates found matching the experience range."
+        payload = listing_payload(
+            results, PAGINATE_ONLY, max_tokens, offset, "get_info_candidate(candidate_id=...)"
+        )
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    except sqlite3.Error as e:
+        return f"❌ Database error while filtering candidates: {str(e)}"
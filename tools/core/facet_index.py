@@ -0,0 +1,385 @@
+"""
+Faceted Candidate Filtering Tools for AI Recruitment Suite.
+
+This module keeps one bitmap per facet value (location, language, certification)
+over candidate row IDs. Bitmaps are stored zlib-compressed in SQLite, updated in the
+same transaction as each candidate insert, and combined in memory with integer bit
+operations, so AND/OR facet queries never scan the candidates table.
+
+The stored bitmaps record the ``change_log`` sequence of the last candidate change
+they include. Readers compare it with the candidates' latest change: if rows were
+updated, deleted or inserted by code that bypasses the index, the query is served
+from bitmaps built in memory (readers never write), and the next indexed insert
+rebuilds the stored bitmaps inside its write transaction.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from tools.core.db_connection import DB_PATH, read_connection
+from tools.core.skill_dictionary import canonicalize_labels, flatten_terms, normalize_label
+
+FACETS = ("location", "languages", "certifications")
+
+# Bitmap of every indexed candidate
+_ALL = ("__all__", "")
+# Sequence of the latest candidates change_log entry the stored bitmaps include
+_SEQ = ("__seq__", "")
+
+_LOCATION_ALIASES = {
+    "milan": "milano", "rome": "roma", "turin": "torino", "naples": "napoli",
+    "florence": "firenze", "venice": "venezia", "genoa": "genova", "remoto": "remote",
+    "da remoto": "remote", "full remote": "remote", "smart working": "remote",
+    "remote working": "remote", "italia": "italy",
+}  # fmt: skip
+
+_LANGUAGE_ALIASES = {
+    "inglese": "english", "italiano": "italian", "francese": "french", "tedesco": "german",
+    "spagnolo": "spanish", "portoghese": "portuguese", "cinese": "chinese",
+    "russo": "russian", "arabo": "arabic", "giapponese": "japanese",
+}  # fmt: skip
+
+_LOCATION_SPLIT = re.compile(r"[,/;|()]|\s+-\s+|\bor\b|\bo\b|\be\b|\band\b")
+_LANGUAGE_LEVEL = re.compile(r"[(\-:–].*$|\b(?:[abc][12]|native|madrelingua|fluent|basic)\b")
+
+
+def facet_values(facet: str, raw: Any) -> Set[str]:
+    """
+    Normalize a raw candidate field into the facet values it belongs to.
+
+    Args:
+        facet: One of ``FACETS``
+        raw: Field value (string, list or JSON-encoded list)
+
+    Returns:
+        Set[str]: Normalized facet values
+
+    Example:
+        >>> sorted(facet_values("location", "Milan, Italy / Remote"))
+        ['italy', 'milano', 'remote']
+    """
+    if facet == "location":
+        parts = _LOCATION_SPLIT.split(str(raw or "").lower())
+        values = {normalize_label(part) for part in parts}
+        return {_LOCATION_ALIASES.get(value, value) for value in values if value}
+    if facet == "languages":
+        terms = flatten_terms(raw)
+        values = {normalize_label(_LANGUAGE_LEVEL.sub("", term.lower())) for term in terms}
+        return {_LANGUAGE_ALIASES.get(value, value) for value in values if value}
+    names, _ = canonicalize_labels(flatten_terms(raw))
+    return {normalize_label(name) for name in names}
+
+
+def _encode(bitmap: int) -> bytes:
+    return zlib.compress(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little"))
+
+
+def _decode(blob: bytes) -> int:
+    return int.from_bytes(zlib.decompress(blob), "little")
+
+
+def _iter_bits(bitmap: int) -> Iterator[int]:
+    while bitmap:
+        low = bitmap & -bitmap
+        yield low.bit_length() - 1
+        bitmap ^= low
+
+
+def initialize_facet_table(db_path: str = DB_PATH) -> None:
+    """
+    Create the candidate_facets table, building it from existing candidates if empty.
+
+    Args:
+        db_path: Path to the recruitment database file
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS candidate_facets (
+                facet TEXT NOT NULL,
+                value TEXT NOT NULL,
+                bitmap BLOB NOT NULL,
+                PRIMARY KEY (facet, value)
+            )
+        """
+        )
+        has_candidates = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candidates'"
+        ).fetchone()
+        indexed = conn.execute("SELECT 1 FROM candidate_facets LIMIT 1").fetchone()
+        if has_candidates and not indexed:
+            rebuild_facets(conn.cursor())
+
+
+def _candidates_generation(cursor: Any, below: Optional[int] = None) -> int:
+    """Return the latest change_log sequence of the candidates table (optionally below a bound)."""
+    if below is None:
+        sql, params = "SELECT MAX(seq) FROM change_log WHERE table_name = 'candidates'", ()
+    else:
+        sql = "SELECT MAX(seq) FROM change_log WHERE table_name = 'candidates' AND seq < ?"
+        params = (below,)
+    return cursor.execute(sql, params).fetchone()[0] or 0
+
+
+def _indexed_generation(cursor: Any) -> Optional[int]:
+    row = cursor.execute(
+        "SELECT bitmap FROM candidate_facets WHERE facet = ? AND value = ?", _SEQ
+    ).fetchone()
+    return _decode(row[0]) if row else None
+
+
+def _set_indexed_generation(cursor: sqlite3.Cursor, generation: int) -> None:
+    cursor.execute(
+        "INSERT OR REPLACE INTO candidate_facets (facet, value, bitmap) VALUES (?, ?, ?)",
+        (*_SEQ, _encode(generation)),
+    )
+
+
+def index_candidate_facets(cursor: sqlite3.Cursor, rowid: int, record: Dict[str, Any]) -> None:
+    """
+    Set the candidate's bit in the bitmap of each of its facet values.
+
+    Runs on the caller's cursor so it commits together with the candidate insert.
+    If candidates changed outside the index since the bitmaps were last written,
+    they are rebuilt instead, in the same transaction.
+
+    Args:
+        cursor: Cursor of the connection that inserted the candidate
+        rowid: SQLite rowid of the inserted candidate
+        record: Candidate fields (``location``, ``languages``, ``certifications``)
+    """
+    generation = _candidates_generation(cursor)
+    if _indexed_generation(cursor) != _candidates_generation(cursor, below=generation):
+        rebuild_facets(cursor)
+        return
+
+    bit = 1 << rowid
+    keys = [_ALL]
+    for facet in FACETS:
+        keys.extend((facet, value) for value in facet_values(facet, record.get(facet)))
+    for facet, value in keys:
+        row = cursor.execute(
+            "SELECT bitmap FROM candidate_facets WHERE facet = ? AND value = ?", (facet, value)
+        ).fetchone()
+        bitmap = (_decode(row[0]) if row else 0) | bit
+        cursor.execute(
+            "INSERT OR REPLACE INTO candidate_facets (facet, value, bitmap) VALUES (?, ?, ?)",
+            (facet, value, _encode(bitmap)),
+        )
+    _set_indexed_generation(cursor, generation)
+
+
+def _compute_bitmaps(cursor: Any) -> Dict[Tuple[str, str], int]:
+    bitmaps: Dict[Tuple[str, str], int] = {_ALL: 0}
+    for rowid, *fields in cursor.execute(f"SELECT rowid, {', '.join(FACETS)} FROM candidates"):
+        bit = 1 << rowid
+        bitmaps[_ALL] |= bit
+        for facet, raw in zip(FACETS, fields):
+            for value in facet_values(facet, raw):
+                bitmaps[(facet, value)] = bitmaps.get((facet, value), 0) | bit
+    return bitmaps
+
+
+def rebuild_facets(cursor: sqlite3.Cursor) -> int:
+    """
+    Rebuild every facet bitmap from the candidates table.
+
+    Args:
+        cursor: Cursor inside an open write transaction
+
+    Returns:
+        int: Number of candidates indexed
+    """
+    bitmaps = _compute_bitmaps(cursor)
+    cursor.execute("DELETE FROM candidate_facets")
+    cursor.executemany(
+        "INSERT INTO candidate_facets (facet, value, bitmap) VALUES (?, ?, ?)",
+        [(facet, value, _encode(bitmap)) for (facet, value), bitmap in bitmaps.items()],
+    )
+    _set_indexed_generation(cursor, _candidates_generation(cursor))
+    return bitmaps[_ALL].bit_count()
+
+
+class FacetIndex:
+    """
+    In-memory copy of the facet bitmaps, reloaded when the database changes.
+
+    Args:
+        db_path: Path to the recruitment database file
+    """
+
+    def __init__(self, db_path: str = DB_PATH) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._watch: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._bitmaps: Dict[str, Dict[str, int]] = {}
+        self._all = 0
+
+    def _load(self) -> None:
+        if self._watch is None:
+            self._watch = sqlite3.connect(self.db_path, check_same_thread=False)
+        version = self._watch.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version:
+            return
+
+        with read_connection(self.db_path) as conn:
+            stored = {
+                (facet, value): blob
+                for facet, value, blob in conn.execute(
+                    "SELECT facet, value, bitmap FROM candidate_facets"
+                )
+            }
+            indexed_generation = _decode(stored.pop(_SEQ)) if _SEQ in stored else None
+            if indexed_generation == _candidates_generation(conn):
+                decoded = {key: _decode(blob) for key, blob in stored.items()}
+            else:
+                # Candidates changed outside the index: build it in memory, read-only
+                decoded = _compute_bitmaps(conn)
+
+        bitmaps: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+        for (facet, value), bitmap in decoded.items():
+            if (facet, value) != _ALL:
+                bitmaps.setdefault(facet, {})[value] = bitmap
+        self._bitmaps, self._all, self._data_version = bitmaps, decoded.get(_ALL, 0), version
+
+    def _match(self, facet: str, terms: Iterable[str]) -> int:
+        """OR together the bitmaps of every value matching any of the terms."""
+        result = 0
+        for term in terms:
+            for wanted in facet_values(facet, [term] if facet != "location" else term):
+                pattern = re.compile(rf"(?<!\w){re.escape(wanted)}(?!\w)")
+                for value, bitmap in self._bitmaps.get(facet, {}).items():
+                    if value == wanted or pattern.search(value):
+                        result |= bitmap
+        return result
+
+    def query(self, filters: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Combine facet filters: values of one facet are ORed, facets are ANDed.
+
+        Args:
+            filters: Mapping of facet name to accepted values
+
+        Returns:
+            Dict[str, Any]: ``rowids`` of matching candidates and per-facet value
+            ``counts`` within the result
+        """
+        with self._lock:
+            self._load()
+            result = self._all
+            for facet, terms in filters.items():
+                if terms:
+                    result &= self._match(facet, terms)
+            counts = {
+                facet: {
+                    value: (bitmap & result).bit_count()
+                    for value, bitmap in sorted(values.items())
+                    if bitmap & result
+                }
+                for facet, values in self._bitmaps.items()
+            }
+        return {"rowids": list(_iter_bits(result)), "counts": counts}
+
+    def close(self) -> None:
+        """Close the connection used to watch for database changes."""
+        with self._lock:
+            if self._watch is not None:
+                self._watch.close()
+            self._watch = self._data_version = None
+
+
+_indexes: Dict[str, FacetIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_facet_index(db_path: str = DB_PATH) -> FacetIndex:
+    """
+    Return the process-wide facet index for a database file.
+
+    Args:
+        db_path: Path to the recruitment database file
+
+    Returns:
+        FacetIndex: The shared index for ``db_path``
+    """
+    with _indexes_lock:
+        index = _indexes.get(db_path)
+        if index is None:
+            index = _indexes[db_path] = FacetIndex(db_path)
+        return index
+
+
+def _split_terms(value: Optional[str]) -> List[str]:
+    return [term.strip() for term in (value or "").split(",") if term.strip()]
+
+
+def filter_candidates(
+    locations: Optional[str] = None,
+    languages: Optional[str] = None,
+    certifications: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> str:
+    """
+    Filter candidates by location, spoken languages and certifications.
+
+    Matching candidates are listed newest first.
+
+    Args:
+        locations: Optional comma-separated locations (e.g. "Milano, Remote")
+        languages: Optional comma-separated languages (e.g. "English")
+        certifications: Optional comma-separated certifications (e.g. "AWS")
+        limit: Maximum number of candidates listed in the response (default 50)
+        offset: Index of the first matching candidate to list when paginating
+
+    Returns:
+        str: JSON object with the total, one page of matching candidates, the
+             ``next_offset`` of the following page (null on the last page) and
+             facet counts
+    """
+    try:
+        start = time.perf_counter()
+        result = get_facet_index().query(
+            {
+                "location": _split_terms(locations),
+                "languages": _split_terms(languages),
+                "certifications": _split_terms(certifications),
+            }
+        )
+        # Rowids grow with every insert, so the highest bits are the newest candidates
+        offset = max(int(offset), 0)
+        end = offset + max(int(limit), 0)
+        rowids = result["rowids"][::-1][offset:end]
+        candidates = []
+        if rowids:
+            with read_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT id, candidate_name, location FROM candidates "
+                    f"WHERE rowid IN ({', '.join('?' * len(rowids))}) ORDER BY rowid DESC",
+                    rowids,
+                )
+                cols = [col[0] for col in cursor.description]
+                candidates = [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+        payload = {
+            "total": len(result["rowids"]),
+            "offset": offset,
+            "next_offset": end if rowids and end < len(result["rowids"]) else None,
+            "candidates": candidates,
+            "facet_counts": result["counts"],
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    except sqlite3.Error as e:
+        return f"❌ Database error while filtering candidates: {str(e)}"
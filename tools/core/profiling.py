@@ -0,0 +1,330 @@
+"""
+Tool Invocation Profiling for AI Recruitment Suite.
+
+This module provides the opt-in ``profiled`` decorator applied to every watsonx
+Orchestrate tool. When enabled it captures, for a sample of invocations, the
+cProfile statistics and the top tracemalloc allocations of the call, and writes
+them to a local capture directory together with the tool name, the timing and the
+size of each argument (never the argument values, which hold personal data).
+The directory is rotated so only the newest captures are kept.
+
+Profiling is off unless ``RECRUITMENT_PROFILE`` is set: ``1``/``true`` profiles
+every call, a number between 0 and 1 profiles that share of calls. The capture
+directory is ``RECRUITMENT_PROFILE_DIR`` (default ``profiles``), the number of
+captures kept is ``RECRUITMENT_PROFILE_KEEP`` (default 200), and
+``RECRUITMENT_PROFILE_MEMORY=0`` skips tracemalloc, which otherwise inflates
+the cProfile timings. Disabled, the decorator costs one environment lookup.
+
+Each capture is a ``<id>.prof`` file (readable with ``pstats`` or snakeviz) and a
+``<id>.json`` summary. ``ai-recruitment profiles`` aggregates them per tool and
+compares them against a baseline directory.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import functools
+import glob
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+PROFILE_ENV_VAR = "RECRUITMENT_PROFILE"
+PROFILE_DIR_ENV_VAR = "RECRUITMENT_PROFILE_DIR"
+PROFILE_KEEP_ENV_VAR = "RECRUITMENT_PROFILE_KEEP"
+PROFILE_MEMORY_ENV_VAR = "RECRUITMENT_PROFILE_MEMORY"
+
+DEFAULT_PROFILE_DIR = "profiles"
+DEFAULT_PROFILE_KEEP = 200
+TOP_ENTRIES = 15
+
+_TRUTHY = {"1", "true", "yes", "on"}
+_FALSY = {"0", "false", "no", "off"}
+
+# cProfile and tracemalloc are process-wide (and imported on the first sampled call, to keep
+# the adapters cheap to load); calls overlapping a capture run unprofiled
+_capture_lock = threading.Lock()
+
+
+class ToolProfile(NamedTuple):
+    """Aggregated captures of one tool."""
+
+    tool: str
+    captures: int
+    median_ms: float
+    max_ms: float
+    median_peak_kb: Optional[float]
+    max_peak_kb: Optional[float]
+    median_arg_bytes: float
+
+
+def sample_rate() -> float:
+    """
+    Return the share of tool calls to profile from ``RECRUITMENT_PROFILE``.
+
+    Returns:
+        float: 0.0 (disabled) to 1.0 (every call)
+    """
+    value = os.environ.get(PROFILE_ENV_VAR, "").strip().lower()
+    if not value or value in _FALSY:
+        return 0.0
+    if value in _TRUTHY:
+        return 1.0
+    try:
+        return min(max(float(value), 0.0), 1.0)
+    except ValueError:
+        return 0.0
+
+
+def profile_dir() -> str:
+    """Return the capture directory from ``RECRUITMENT_PROFILE_DIR``."""
+    return os.environ.get(PROFILE_DIR_ENV_VAR) or DEFAULT_PROFILE_DIR
+
+
+def _keep() -> int:
+    try:
+        return int(os.environ.get(PROFILE_KEEP_ENV_VAR, DEFAULT_PROFILE_KEEP))
+    except ValueError:
+        return DEFAULT_PROFILE_KEEP
+
+
+def _size(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return len(repr(value))
+
+
+def _arg_sizes(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Optional[int]]:
+    import inspect
+
+    try:
+        bound = inspect.signature(fn).bind_partial(*args, **kwargs)
+    except (TypeError, ValueError):
+        return {str(i): _size(value) for i, value in enumerate(args)}
+    return {name: _size(value) for name, value in bound.arguments.items()}
+
+
+def _top_functions(stats: Any, limit: int = TOP_ENTRIES) -> List[Dict[str, Any]]:
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            "function": f"{os.path.basename(filename)}:{line}({name})",
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in rows
+    ]
+
+
+def _location(frame: Any) -> str:
+    return f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+
+def _rotate(directory: str, keep: int) -> None:
+    summaries = sorted(glob.glob(os.path.join(directory, "*.json")))
+    for summary in summaries[: max(len(summaries) - keep, 0)]:
+        for path in (summary, summary[: -len(".json")] + ".prof"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def _capture(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    trace_memory = os.environ.get(PROFILE_MEMORY_ENV_VAR, "1").strip().lower() not in _FALSY
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    baseline = None
+    if trace_memory:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.take_snapshot()
+
+    profiler = cProfile.Profile()
+    result, error = None, None
+    start, cpu_start = time.perf_counter(), time.process_time()
+    profiler.enable()
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as e:
+        error = e
+    finally:
+        profiler.disable()
+    wall_ms = (time.perf_counter() - start) * 1000
+    cpu_ms = (time.process_time() - cpu_start) * 1000
+
+    summary: Dict[str, Any] = {
+        "tool": fn.__name__,
+        "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+        "pid": os.getpid(),
+        "wall_ms": round(wall_ms, 3),
+        "cpu_ms": round(cpu_ms, 3),
+        "arg_sizes": _arg_sizes(fn, args, kwargs),
+        "result_size": _size(result),
+        "error": type(error).__name__ if error is not None else None,
+        "peak_kb": None,
+        "top_allocations": [],
+    }
+    if trace_memory:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        )
+        summary["peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        summary["top_allocations"] = [
+            {
+                "location": _location(stat.traceback[0]),
+                "size_kb": round(stat.size_diff / 1024, 1),
+                "count": stat.count_diff,
+            }
+            for stat in snapshot.compare_to(baseline, "lineno")[:TOP_ENTRIES]
+            if stat.size_diff > 0
+        ]
+        if started_tracing:
+            tracemalloc.stop()
+    summary["top_functions"] = _top_functions(pstats.Stats(profiler))
+
+    # A capture that cannot be written must never fail the tool call
+    directory = profile_dir()
+    capture_id = f"{datetime.now():%Y%m%dT%H%M%S%f}-{fn.__name__}-{os.getpid()}"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(directory, capture_id + ".prof"))
+        with open(os.path.join(directory, capture_id + ".json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        _rotate(directory, _keep())
+    except OSError:
+        pass
+
+    if error is not None:
+        raise error
+    return result
+
+
+def profiled(fn: Callable) -> Callable:
+    """
+    Profile a sample of calls of a tool function when ``RECRUITMENT_PROFILE`` is set.
+
+    Args:
+        fn: The tool function; apply this decorator below ``@tool``
+
+    Returns:
+        Callable: A wrapper with the same name, signature and docstring
+
+    Example:
+        >>> @tool
+        ... @profiled
+        ... def get_info_candidate(candidate_id: Optional[str] = None) -> str:
+        ...     ...
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        rate = sample_rate()
+        if rate <= 0.0:
+            return fn(*args, **kwargs)
+        if rate < 1.0:
+            import random
+
+            if random.random() >= rate:
+                return fn(*args, **kwargs)
+        if not _capture_lock.acquire(blocking=False):
+            return fn(*args, **kwargs)
+        try:
+            return _capture(fn, args, kwargs)
+        finally:
+            _capture_lock.release()
+
+    return wrapper
+
+
+def load_captures(directory: str, tool: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Load the capture summaries of a directory, oldest first.
+
+    Args:
+        directory: Capture directory
+        tool: Only load captures of this tool
+
+    Returns:
+        List[Dict[str, Any]]: One summary per capture, with its ``id``
+    """
+    captures = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        try:
+            with open(path, encoding="utf-8") as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if tool is None or summary.get("tool") == tool:
+            summary["id"] = os.path.basename(path)[: -len(".json")]
+            captures.append(summary)
+    return captures
+
+
+def summarize(captures: List[Dict[str, Any]]) -> Dict[str, ToolProfile]:
+    """
+    Aggregate capture summaries per tool.
+
+    Args:
+        captures: Summaries from :func:`load_captures`
+
+    Returns:
+        Dict[str, ToolProfile]: Tool name mapped to its aggregate, slowest median first
+    """
+    import statistics
+
+    by_tool: Dict[str, List[Dict[str, Any]]] = {}
+    for capture in captures:
+        by_tool.setdefault(capture["tool"], []).append(capture)
+
+    profiles = {}
+    for tool, group in by_tool.items():
+        times = [c["wall_ms"] for c in group]
+        peaks = [c["peak_kb"] for c in group if c.get("peak_kb") is not None]
+        arg_bytes = [sum(s or 0 for s in c["arg_sizes"].values()) for c in group]
+        profiles[tool] = ToolProfile(
+            tool=tool,
+            captures=len(group),
+            median_ms=statistics.median(times),
+            max_ms=max(times),
+            median_peak_kb=statistics.median(peaks) if peaks else None,
+            max_peak_kb=max(peaks) if peaks else None,
+            median_arg_bytes=statistics.median(arg_bytes),
+        )
+    return dict(sorted(profiles.items(), key=lambda item: item[1].median_ms, reverse=True))
+
+
+def merged_top_functions(
+    directory: str, captures: List[Dict[str, Any]], limit: int = TOP_ENTRIES
+) -> List[Dict[str, Any]]:
+    """
+    Merge the cProfile statistics of several captures.
+
+    Args:
+        directory: Capture directory
+        captures: Summaries from :func:`load_captures`
+        limit: Number of functions returned
+
+    Returns:
+        List[Dict[str, Any]]: Functions with the highest total cumulative time
+    """
+    import pstats
+
+    paths = [os.path.join(directory, c["id"] + ".prof") for c in captures]
+    paths = [path for path in paths if os.path.exists(path)]
+    if not paths:
+        return []
+    return _top_functions(pstats.Stats(*paths), limit)
@@ -0,0 +1,189 @@
+"""
+Row Codecs for AI Recruitment Suite.
+
+This module maps rows of the recruitment tables to compact
+``__slots__`` records with name-based access. JSON-encoded columns are decoded
+only when first read, so tools that list names or IDs never pay for parsing
+skills, achievements or deliverables.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import sqlite3
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Type
+
+CANDIDATE_JSON_FIELDS = (
+    "technical_skills",
+    "certifications",
+    "previous_companies",
+    "key_achievements",
+    "languages",
+    "industry_experience",
+)
+
+BANDO_JSON_FIELDS = (
+    "required_skills",
+    "certifications_required",
+    "key_deliverables",
+)
+
+
+def _loads(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value  # Keep as string if it's not valid JSON
+
+
+class Record:
+    """
+    One database row, read by column name.
+
+    Values are available as attributes (``record.candidate_name``) or items
+    (``record["candidate_name"]``). JSON columns are decoded on first access and
+    cached on the record; ``raw`` returns the stored value without decoding.
+    Subclasses are generated by ``RecordCodec`` for each column layout.
+    """
+
+    __slots__ = ("_row", "_decoded")
+
+    _fields: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+    _json_fields: FrozenSet[str] = frozenset()
+
+    def __init__(self, row: Tuple[Any, ...]) -> None:
+        self._row = row
+        self._decoded: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, name: str) -> Any:
+        value = self._row[self._index[name]]
+        if name not in self._json_fields or not isinstance(value, str):
+            return value
+        if self._decoded is None:
+            self._decoded = {}
+        elif name in self._decoded:
+            return self._decoded[name]
+        decoded = self._decoded[name] = _loads(value)
+        return decoded
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no column {name!r}") from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._row[0]!r})"
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the column names in table order."""
+        return self._fields
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a column value, or ``default`` if the column does not exist."""
+        return self[name] if name in self._index else default
+
+    def raw(self, name: str) -> Any:
+        """Return a column value as stored, without JSON decoding."""
+        return self._row[self._index[name]]
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Convert the record to a dictionary with JSON columns decoded.
+
+        Args:
+            fields: Optional subset of columns to include (default: all)
+
+        Returns:
+            Dict[str, Any]: Column names mapped to values
+        """
+        if fields is not None:
+            return {name: self[name] for name in fields}
+        rec = dict(zip(self._fields, self._row))
+        decoded = self._decoded or {}
+        for name in self._json_fields:
+            value = rec[name]
+            if isinstance(value, str):
+                rec[name] = decoded[name] if name in decoded else _loads(value)
+        return rec
+
+
+class RecordCodec:
+    """
+    Schema-driven decoder from cursor rows to ``Record`` objects for one table.
+
+    The record class is built once per column layout (taken from the cursor
+    description) and reused, so adding columns to a table needs no code change.
+
+    Args:
+        table: Table name, used to name the generated record classes
+        json_fields: Columns holding JSON-encoded values
+
+    Example:
+        >>> cursor.execute("SELECT * FROM candidates")
+        >>> [c.candidate_name for c in CANDIDATE_RECORDS.fetchall(cursor)]
+        ['Maria Rossi', 'Luca Bianchi']
+    """
+
+    def __init__(self, table: str, json_fields: Iterable[str] = ()) -> None:
+        self.table = table
+        self.json_fields = frozenset(json_fields)
+        self._types: Dict[Tuple[str, ...], Type[Record]] = {}
+
+    def record_type(self, description: Iterable[Tuple[Any, ...]]) -> Type[Record]:
+        """
+        Return the record class for a cursor description.
+
+        Args:
+            description: ``cursor.description`` of the executed query
+
+        Returns:
+            Type[Record]: Record class whose fields match the query columns
+        """
+        fields = tuple(col[0] for col in description)
+        record_type = self._types.get(fields)
+        if record_type is None:
+            name = "".join(part.title() for part in self.table.split("_")) + "Record"
+            record_type = self._types[fields] = type(
+                name,
+                (Record,),
+                {
+                    "__slots__": (),
+                    "_fields": fields,
+                    "_index": {field: i for i, field in enumerate(fields)},
+                    "_json_fields": self.json_fields.intersection(fields),
+                },
+            )
+        return record_type
+
+    def fetchone(self, cursor: sqlite3.Cursor) -> Optional[Record]:
+        """Fetch the next row of an executed query as a record, or None."""
+        row = cursor.fetchone()
+        return None if row is None else self.record_type(cursor.description)(row)
+
+    def fetchall(self, cursor: sqlite3.Cursor) -> List[Record]:
+        """Fetch the remaining rows of an executed query as records."""
+        rows = cursor.fetchall()
+        if not rows:
+            return []
+        record_type = self.record_type(cursor.description)
+        return [record_type(row) for row in rows]
+
+
+CANDIDATE_RECORDS = RecordCodec("candidates", CANDIDATE_JSON_FIELDS)
+BANDO_RECORDS = RecordCodec("bando_di_gara", BANDO_JSON_FIELDS)
+EVALUATION_RECORDS = RecordCodec("evaluations")
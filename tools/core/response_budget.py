@@ -0,0 +1,332 @@
+"""
+Token-Budget Response Shaping for AI Recruitment Suite.
+
+The agents consume tool output inside a finite LLM context, so list tools must
+not return unbounded payloads. This module estimates the serialized size of a
+response and, when it exceeds the caller's budget, degrades it step by step:
+long text fields are truncated, low-priority fields are dropped and, if that is
+still not enough, the result is paginated. Every reduction is reported so the
+agent knows what was omitted and how to fetch it.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import math
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_MAX_TOKENS = 4000
+
+# Rough size of one token in characters for the serialized JSON/Markdown output
+CHARS_PER_TOKEN = 4
+
+# Records are measured on their own but emitted nested inside a list or envelope, where
+# each line gets up to this many more characters of indentation
+_NESTED_INDENT = 6
+
+_ELLIPSIS = "…"
+
+
+class FieldPolicy(NamedTuple):
+    """How the records of one table may be reduced to fit a budget."""
+
+    truncate: Dict[str, int]  # Text field -> maximum characters kept
+    drop: Tuple[str, ...]  # Fields that may be removed, lowest priority first
+
+
+CANDIDATE_POLICY = FieldPolicy(
+    truncate={"consulting_experience": 300, "education": 200},
+    drop=(
+        "key_achievements",
+        "consulting_experience",
+        "previous_companies",
+        "industry_experience",
+        "education",
+        "phone",
+        "source_filename",
+    ),
+)
+
+BANDO_POLICY = FieldPolicy(
+    truncate={"project_description": 400},
+    drop=(
+        "key_deliverables",
+        "project_description",
+        "education_requirements",
+        "budget_range",
+        "team_size",
+        "source_filename",
+    ),
+)
+
+EVALUATION_POLICY = FieldPolicy(truncate={"evaluation_summary": 300}, drop=())
+
+# Compact records that are only ever paginated
+PAGINATE_ONLY = FieldPolicy(truncate={}, drop=())
+
+
+class ShapedPage(NamedTuple):
+    """A page of records reduced to fit a token budget."""
+
+    items: List[Dict[str, Any]]
+    total: int  # Records available from offset 0
+    offset: int
+    next_offset: Optional[int]  # Offset of the first record not returned, if any
+    truncated: List[str]  # Fields shortened in the returned items
+    dropped: List[str]  # Fields removed from the returned items
+
+    @property
+    def shaped(self) -> bool:
+        """Whether anything was left out of the response."""
+        return bool(self.next_offset is not None or self.truncated or self.dropped)
+
+    def omissions(self, fetch_hint: str) -> Dict[str, Any]:
+        """
+        Describe what was left out of the response and how to fetch it.
+
+        Args:
+            fetch_hint: Tool call that returns a complete record, e.g.
+                        ``"get_info_candidate(candidate_id=...)"``
+
+        Returns:
+            Dict[str, Any]: Truncated and dropped fields, remaining records and hints
+        """
+        report: Dict[str, Any] = {}
+        if self.truncated:
+            report["truncated_fields"] = self.truncated
+        if self.dropped:
+            report["dropped_fields"] = self.dropped
+        hints = []
+        if self.truncated or self.dropped:
+            hints.append(f"call {fetch_hint} for a complete record")
+        if self.next_offset is not None:
+            report["remaining_records"] = self.total - self.next_offset
+            report["next_offset"] = self.next_offset
+            hints.append(f"repeat the call with offset={self.next_offset} for the next page")
+        if hints:
+            report["how_to_fetch"] = "; ".join(hints).capitalize() + "."
+        return report
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens of a serialized response.
+
+    Args:
+        text: Serialized response
+
+    Returns:
+        int: Estimated token count
+
+    Example:
+        >>> estimate_tokens("x" * 400)
+        100
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    Shorten text to at most ``max_chars`` characters, marking the cut with an ellipsis.
+
+    Args:
+        text: Text to shorten
+        max_chars: Maximum characters kept
+
+    Returns:
+        str: The text, shortened if needed
+
+    Example:
+        >>> truncate_text("Senior consultant with ten years", 17)
+        'Senior consultant…'
+    """
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + _ELLIPSIS
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def _as_dict(record: Any) -> Dict[str, Any]:
+    return record if isinstance(record, dict) else record.to_dict()
+
+
+def _reduce(
+    record: Dict[str, Any], policy: FieldPolicy, level: int
+) -> Tuple[Dict[str, Any], List[str], List[str]]:
+    """Apply degradation ``level``: 0 = none, 1 = truncate, n > 1 = also drop n - 1 fields."""
+    if level == 0:
+        return record, [], []
+    reduced = dict(record)
+    truncated = []
+    for field, limit in policy.truncate.items():
+        value = reduced.get(field)
+        if isinstance(value, str) and len(value) > limit:
+            reduced[field] = truncate_text(value, limit)
+            truncated.append(field)
+    dropped = [field for field in policy.drop[: level - 1] if field in reduced]
+    for field in dropped:
+        del reduced[field]
+    return reduced, [field for field in truncated if field in reduced], dropped
+
+
+def shape_records(
+    records: Sequence[Any],
+    policy: FieldPolicy,
+    max_tokens: Optional[int] = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+    overhead_tokens: int = 150,
+) -> ShapedPage:
+    """
+    Fit a list of records into a token budget.
+
+    Tries each degradation level in turn (full records, truncated text, then
+    dropping the policy's fields one by one) and keeps the first that fits the
+    whole page. If even the most reduced records do not fit, returns as many of
+    them as the budget allows, always at least one. ``Record`` objects are only
+    converted to dictionaries when they are measured.
+
+    Args:
+        records: Records as dictionaries or ``Record`` objects, in display order
+        policy: Reduction policy for the records' table
+        max_tokens: Token budget for the serialized records (None or <= 0: unlimited)
+        offset: Index of the first record to return
+        overhead_tokens: Budget reserved for the response envelope
+
+    Returns:
+        ShapedPage: The records returned and what was omitted
+
+    Example:
+        >>> page = shape_records(candidates, CANDIDATE_POLICY, max_tokens=2000)
+        >>> page.next_offset, page.dropped
+        (12, ['consulting_experience', 'key_achievements'])
+    """
+    offset = max(offset, 0)
+    page = records[offset:]
+    if not max_tokens or max_tokens <= 0:
+        return ShapedPage([_as_dict(record) for record in page], len(records), offset, None, [], [])
+
+    budget = max_tokens - overhead_tokens
+    levels = 2 + len(policy.drop)
+    converted: List[Dict[str, Any]] = []
+    for level in range(levels):
+        items, sizes, truncated, dropped = [], 0, set(), set()
+        for i, record in enumerate(page):
+            if i == len(converted):
+                converted.append(_as_dict(record))
+            reduced, cut, removed = _reduce(converted[i], policy, level)
+            text = _dumps(reduced)
+            sizes += estimate_tokens(text) + math.ceil(
+                (text.count("\n") + 1) * _NESTED_INDENT / CHARS_PER_TOKEN
+            )
+            # Stop measuring once this level cannot hold the whole page, unless it is
+            # the last one, which keeps the records that fit
+            if sizes > budget and (level < levels - 1 or items):
+                break
+            items.append(reduced)
+            truncated.update(cut)
+            dropped.update(removed)
+        else:
+            return ShapedPage(items, len(records), offset, None, sorted(truncated), sorted(dropped))
+
+    next_offset = offset + len(items)
+    return ShapedPage(
+        items,
+        len(records),
+        offset,
+        next_offset if next_offset < len(records) else None,
+        sorted(truncated),
+        sorted(dropped),
+    )
+
+
+def shape_record(
+    record: Dict[str, Any], policy: FieldPolicy, max_tokens: Optional[int] = DEFAULT_MAX_TOKENS
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Fit a single record into a token budget by truncating and dropping fields.
+
+    Args:
+        record: Record as a dictionary
+        policy: Reduction policy for the record's table
+        max_tokens: Token budget for the serialized record
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any]]: The reduced record and the fields
+        that were truncated or dropped (empty when the record fits)
+    """
+    page = shape_records([record], policy, max_tokens, overhead_tokens=0)
+    omitted: Dict[str, Any] = {}
+    if page.truncated:
+        omitted["truncated_fields"] = page.truncated
+    if page.dropped:
+        omitted["dropped_fields"] = page.dropped
+    if omitted:
+        omitted["how_to_fetch"] = "Repeat the call with max_tokens=0 for the complete record."
+    return page.items[0], omitted
+
+
+def listing_payload(
+    records: Sequence[Any],
+    policy: FieldPolicy,
+    max_tokens: Optional[int] = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+    fetch_hint: str = "the matching get_* tool with the record ID",
+) -> Any:
+    """
+    Build the JSON payload of a list tool within a token budget.
+
+    Returns the plain list when everything fits from the first record, so small
+    results keep their usual shape; otherwise returns an envelope with the page,
+    the total count and an ``omitted`` report.
+
+    Args:
+        records: Records as dictionaries or ``Record`` objects, in display order
+        policy: Reduction policy for the records' table
+        max_tokens: Token budget for the response (None or <= 0: unlimited)
+        offset: Index of the first record to return
+        fetch_hint: Tool call that returns a complete record
+
+    Returns:
+        Any: A list of records, or a dict with ``items``, ``total``, ``offset``
+        and ``omitted``
+    """
+    page = shape_records(records, policy, max_tokens, offset)
+    if not page.shaped and page.offset == 0:
+        return page.items
+    payload: Dict[str, Any] = {"items": page.items, "total": page.total, "offset": page.offset}
+    omitted = page.omissions(fetch_hint)
+    if omitted:
+        payload["omitted"] = omitted
+    return payload
+
+
+def paginate_blocks(
+    blocks: Sequence[str], max_tokens: Optional[int] = DEFAULT_MAX_TOKENS, offset: int = 0
+) -> Tuple[List[str], Optional[int]]:
+    """
+    Select the text blocks (one per record) that fit a token budget.
+
+    Args:
+        blocks: Pre-rendered Markdown blocks, in display order
+        max_tokens: Token budget for the selected blocks (None or <= 0: unlimited)
+        offset: Index of the first block to return
+
+    Returns:
+        Tuple[List[str], Optional[int]]: Selected blocks (at least one if any
+        remain) and the offset of the next block, or None if all were returned
+    """
+    offset = max(offset, 0)
+    selected: List[str] = []
+    used = 0
+    for block in blocks[offset:]:
+        used += estimate_tokens(block)
+        if max_tokens and max_tokens > 0 and used > max_tokens and selected:
+            break
+        selected.append(block)
+    next_offset = offset + len(selected)
+    return selected, next_offset if next_offset < len(blocks) else None
@@ -0,0 +1,233 @@
+"""
+Query Result Cache for AI Recruitment Suite.
+
+This module keeps a bounded LRU cache of serialized tool responses (currently
+``get_evaluation_results``) keyed by the normalized filter set, so an agent
+session asking for the same candidate's or bando's evaluations again does not
+re-run and re-serialize the query.
+
+Entries are validated against a per-table generation: the sequence number of
+the table's latest entry in the ``change_log``, which the change-feed triggers
+bump on every insert, update and delete, whichever process or tool made it.
+``PRAGMA data_version`` on a dedicated watcher connection tells cheaply whether
+anything was committed since the last check, so the generation is only re-read
+after a commit. A cached response is therefore never served once its table has
+changed; the TTL only bounds how long unused entries are kept.
+
+Configure the cache with ``RECRUITMENT_RESULT_CACHE_SIZE`` (entries, 0 disables
+it) and ``RECRUITMENT_RESULT_CACHE_TTL`` (seconds, 0 for no expiry).
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+CACHE_SIZE_ENV_VAR = "RECRUITMENT_RESULT_CACHE_SIZE"
+CACHE_TTL_ENV_VAR = "RECRUITMENT_RESULT_CACHE_TTL"
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 300.0
+
+
+class _GenerationWatcher:
+    """Per-table generations of one database file, re-read only after a commit."""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._data_version: Optional[int] = None
+        self._generations: Dict[str, int] = {}
+
+    def generation(self, table: str) -> Optional[Tuple[Tuple[int, int], int]]:
+        """Return the file identity and the table's latest change sequence, or None."""
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        # A database file replaced at the same path needs a new watcher connection
+        file_id = (stat.st_dev, stat.st_ino)
+        if self._conn is None or file_id != self._file_id:
+            self.close()
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._file_id = file_id
+
+        try:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._data_version:
+                self._generations.clear()
+                self._data_version = version
+            if table not in self._generations:
+                self._generations[table] = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq), 0) FROM change_log WHERE table_name = ?",
+                    (table,),
+                ).fetchone()[0]
+        except sqlite3.Error:
+            # No change feed (yet): results cannot be validated, so they are not cached
+            return None
+        return self._file_id, self._generations[table]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = self._file_id = self._data_version = None
+        self._generations.clear()
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of tool responses, invalidated by table generation.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted (0 disables)
+        ttl: Seconds an entry may be served after it was stored (0 for no expiry)
+
+    Example:
+        >>> cache = ResultCache(max_entries=128, ttl=60)
+        >>> cache.get_or_compute("recruitment.db", "evaluations", ("CAND_1",), run_query)
+        '[...]'
+        >>> cache.stats()["hit_rate"]
+        0.0
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL
+    ) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, float, str]]" = OrderedDict()
+        self._watchers: Dict[str, _GenerationWatcher] = {}
+        self.reset_stats()
+        self.configure(max_entries, ttl)
+
+    def configure(self, max_entries: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """
+        Change the size limit and/or TTL, evicting entries above the new limit.
+
+        Args:
+            max_entries: New entry limit (0 disables the cache)
+            ttl: New time-to-live in seconds (0 for no expiry)
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max(int(max_entries), 0)
+            if ttl is not None:
+                self.ttl = max(float(ttl), 0.0)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def reset_stats(self) -> None:
+        """Set every counter back to zero."""
+        with self._lock:
+            self.hits = 0  # Responses served from the cache
+            self.misses = 0  # Responses computed (including stale and expired entries)
+            self.stale = 0  # Entries dropped because their table changed
+            self.expired = 0  # Entries dropped because they outlived the TTL
+            self.evictions = 0  # Entries dropped to respect the size limit
+
+    def clear(self) -> None:
+        """Drop every entry and close the watcher connections."""
+        with self._lock:
+            self._entries.clear()
+            for watcher in self._watchers.values():
+                watcher.close()
+            self._watchers.clear()
+
+    def _generation(self, db_path: str, table: str) -> Optional[Hashable]:
+        watcher = self._watchers.get(db_path)
+        if watcher is None:
+            watcher = self._watchers[db_path] = _GenerationWatcher(db_path)
+        return watcher.generation(table)
+
+    def get_or_compute(
+        self, db_path: str, table: str, key: Hashable, compute: Callable[[], str]
+    ) -> str:
+        """
+        Return the cached response for ``key`` or compute and store it.
+
+        The table generation is read before ``compute`` runs, so a commit racing
+        with the query can only cause an extra miss, never a stale hit. Exceptions
+        raised by ``compute`` propagate and nothing is stored.
+
+        Args:
+            db_path: Path to the database the response was read from
+            table: Table whose changes invalidate the response
+            key: Hashable normalized request (filters, budget, page)
+            compute: Function producing the response on a miss
+
+        Returns:
+            str: The cached or freshly computed response
+        """
+        full_key = (os.path.abspath(db_path), table, key)
+        with self._lock:
+            if not self.max_entries:
+                self.misses += 1
+                generation = None
+            else:
+                generation = self._generation(full_key[0], table)
+                entry = self._entries.get(full_key)
+                if entry is not None:
+                    stored_generation, stored_at, value = entry
+                    if stored_generation != generation:
+                        self.stale += 1
+                        del self._entries[full_key]
+                    elif self.ttl and time.monotonic() - stored_at > self.ttl:
+                        self.expired += 1
+                        del self._entries[full_key]
+                    else:
+                        self.hits += 1
+                        self._entries.move_to_end(full_key)
+                        return value
+                self.misses += 1
+
+        value = compute()
+
+        if generation is not None:
+            with self._lock:
+                self._entries[full_key] = (generation, time.monotonic(), value)
+                self._entries.move_to_end(full_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the hit/miss counters, current size and configuration.
+
+        Returns:
+            Dict[str, float]: Counter name mapped to its value
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "stale": self.stale,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+RESULT_CACHE = ResultCache(
+    max_entries=int(_env_number(CACHE_SIZE_ENV_VAR, DEFAULT_CACHE_SIZE)),
+    ttl=_env_number(CACHE_TTL_ENV_VAR, DEFAULT_CACHE_TTL),
+)
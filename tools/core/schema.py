@@ -0,0 +1,56 @@
+"""
+Database Schema Setup for AI Recruitment Suite.
+
+Creates every table, index and trigger the suite uses, in dependency order,
+with one explicit call. Importing a core module never touches the database:
+the CLI, the ``@tool`` adapters and the tests call :func:`init_schema` on the
+database they are about to use.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import os
+import threading
+from typing import Set
+
+from tools.core.db_connection import DB_PATH
+from tools.core.db_manager_enhanced import init_db
+from tools.core.evaluation_queue import initialize_queue_table
+from tools.core.evaluation_tools import initialize_evaluation_database
+from tools.core.facet_index import initialize_facet_table
+from tools.core.skill_dictionary import initialize_skill_tables
+from tools.core.skill_gaps import initialize_gap_table
+from tools.core.skill_matching import initialize_embedding_table
+
+_INITIALIZED: Set[str] = set()
+_LOCK = threading.Lock()
+
+
+def init_schema(db_path: str = DB_PATH, force: bool = False) -> None:
+    """
+    Create or migrate the recruitment database schema.
+
+    Every step is idempotent. The work is done once per database file per
+    process, so adapters can call this before each tool call.
+
+    Args:
+        db_path: Path to the recruitment database file
+        force: Run the setup again even if it already ran in this process
+
+    Raises:
+        sqlite3.Error: If a schema statement fails
+    """
+    key = os.path.abspath(db_path)
+    with _LOCK:
+        if key in _INITIALIZED and not force and os.path.exists(key):
+            return
+        init_db(db_path)  # Candidates, bandos, experience columns and the change log
+        initialize_evaluation_database(db_path)
+        initialize_skill_tables(db_path)
+        initialize_facet_table(db_path)
+        initialize_embedding_table(db_path)
+        initialize_gap_table(db_path)
+        initialize_queue_table(db_path)
+        _INITIALIZED.add(key)
@@ -0,0 +1,478 @@
+"""
+Canonical Skill Dictionary for AI Recruitment Suite.
+
+This module maps the skill and certification labels produced by the extractor agents
+(mixed casing, abbreviations, Italian and English) to stable canonical skill IDs, and
+extracts skills mentioned in free text with an Aho-Corasick multi-pattern matcher so a
+whole document is scanned in a single linear pass.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import re
+import sqlite3
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from tools.core.db_connection import DB_PATH
+
+# (skill_id, canonical name, kind, aliases). IDs are persisted: never renumber an entry.
+CANONICAL_SKILLS: Tuple[Tuple[int, str, str, Tuple[str, ...]], ...] = (
+    # Programming languages
+    (101, "Python", "skill", ("python3", "python 3", "py")),
+    (102, "Java", "skill", ("java ee", "j2ee", "jakarta ee")),
+    (103, "JavaScript", "skill", ("js", "ecmascript", "es6")),
+    (104, "TypeScript", "skill", ("ts",)),
+    (105, "C#", "skill", ("c sharp", "csharp")),
+    (106, "C++", "skill", ("cpp",)),
+    (107, "C", "skill", ()),
+    (108, "Go", "skill", ("golang",)),
+    (109, "Rust", "skill", ()),
+    (110, "Scala", "skill", ()),
+    (111, "Kotlin", "skill", ()),
+    (112, "PHP", "skill", ()),
+    (113, "Ruby", "skill", ("ruby on rails", "rails")),
+    (114, "R", "skill", ("r language",)),
+    (115, "COBOL", "skill", ()),
+    (116, "SQL", "skill", ("t-sql", "pl/sql", "plsql", "linguaggio sql")),
+    (117, "Bash", "skill", ("shell scripting", "bash scripting")),
+    # Cloud, infrastructure and DevOps
+    (201, "AWS", "skill", ("amazon web services", "amazon aws")),
+    (202, "Microsoft Azure", "skill", ("azure", "ms azure")),
+    (203, "Google Cloud Platform", "skill", ("gcp", "google cloud")),
+    (204, "IBM Cloud", "skill", ("bluemix",)),
+    (205, "Kubernetes", "skill", ("k8s", "kube")),
+    (206, "Docker", "skill", ("container docker", "containerizzazione")),
+    (207, "OpenShift", "skill", ("red hat openshift", "openshift container platform")),
+    (208, "Terraform", "skill", ()),
+    (209, "Ansible", "skill", ()),
+    (210, "CI/CD", "skill", ("cicd", "continuous integration", "continuous delivery")),
+    (211, "Jenkins", "skill", ()),
+    (212, "Git", "skill", ("github", "gitlab")),
+    (213, "Linux", "skill", ("unix", "red hat linux", "ubuntu")),
+    (214, "DevOps", "skill", ()),
+    (215, "Microservices", "skill", ("microservizi", "micro-services")),
+    (216, "Cloud Computing", "skill", ("cloud", "architetture cloud")),
+    # Data and AI
+    (301, "Machine Learning", "skill", ("ml", "apprendimento automatico")),
+    (302, "Artificial Intelligence", "skill", ("ai", "intelligenza artificiale", "ia")),
+    (303, "Deep Learning", "skill", ("dl", "reti neurali", "neural networks")),
+    (304, "Natural Language Processing", "skill", ("nlp", "elaborazione del linguaggio naturale")),
+    (
+        305,
+        "Generative AI",
+        "skill",
+        ("genai", "gen ai", "ai generativa", "llm", "large language models"),
+    ),
+    (306, "Data Analysis", "skill", ("analisi dei dati", "data analytics", "analytics")),
+    (307, "Data Engineering", "skill", ("ingegneria dei dati", "etl", "data pipelines")),
+    (308, "Data Science", "skill", ()),
+    (309, "Apache Spark", "skill", ("spark", "pyspark")),
+    (310, "Apache Kafka", "skill", ("kafka",)),
+    (311, "Hadoop", "skill", ()),
+    (312, "TensorFlow", "skill", ()),
+    (313, "PyTorch", "skill", ()),
+    (314, "Pandas", "skill", ()),
+    (315, "Power BI", "skill", ("powerbi",)),
+    (316, "Tableau", "skill", ()),
+    (317, "PostgreSQL", "skill", ("postgres",)),
+    (318, "MySQL", "skill", ()),
+    (319, "Oracle Database", "skill", ("oracle db", "oracle")),
+    (320, "MongoDB", "skill", ("mongo",)),
+    (321, "SQL Server", "skill", ("mssql", "microsoft sql server")),
+    (322, "Data Warehousing", "skill", ("data warehouse", "dwh")),
+    (323, "watsonx", "skill", ("ibm watsonx", "watsonx.ai", "watsonx orchestrate")),
+    # Web and mobile
+    (401, "React", "skill", ("react.js", "reactjs")),
+    (402, "Angular", "skill", ("angularjs",)),
+    (403, "Vue.js", "skill", ("vue", "vuejs")),
+    (404, "Node.js", "skill", ("node", "nodejs")),
+    (405, "Spring", "skill", ("spring boot", "spring framework")),
+    (406, "Django", "skill", ()),
+    (407, "Flask", "skill", ()),
+    (408, "FastAPI", "skill", ()),
+    (409, ".NET", "skill", ("dotnet", "asp.net", ".net core")),
+    (410, "REST APIs", "skill", ("rest", "restful", "rest api", "api rest")),
+    (411, "Web Development", "skill", ("sviluppo web", "web design")),
+    (412, "Mobile Development", "skill", ("sviluppo mobile", "android", "ios")),
+    (413, "HTML/CSS", "skill", ("html", "css", "html5", "css3")),
+    # Enterprise applications
+    (501, "SAP", "skill", ("sap erp",)),
+    (502, "SAP S/4HANA", "skill", ("s/4hana", "s4hana", "sap hana")),
+    (503, "Salesforce", "skill", ()),
+    (504, "ServiceNow", "skill", ()),
+    (505, "Microsoft Excel", "skill", ("excel",)),
+    (506, "Mainframe", "skill", ("z/os", "ibm z")),
+    # Methods and management
+    (601, "Agile", "skill", ("metodologia agile", "metodologie agili", "agile methodology")),
+    (602, "Scrum", "skill", ()),
+    (603, "Project Management", "skill", ("gestione progetti", "gestione dei progetti")),
+    (604, "Business Analysis", "skill", ("analisi funzionale", "analisi dei requisiti")),
+    (605, "Software Development", "skill", ("sviluppo software", "software engineering")),
+    (606, "Software Architecture", "skill", ("architettura software", "solution architecture")),
+    (607, "Testing", "skill", ("software testing", "test automation", "quality assurance")),
+    (608, "ITIL", "skill", ()),
+    (609, "Change Management", "skill", ("gestione del cambiamento",)),
+    # Security and networking
+    (
+        701,
+        "Cybersecurity",
+        "skill",
+        ("sicurezza informatica", "cyber security", "information security"),
+    ),
+    (702, "Networking", "skill", ("reti di telecomunicazione", "network engineering")),
+    (703, "Identity and Access Management", "skill", ("iam",)),
+    (704, "GDPR", "skill", ("protezione dei dati",)),
+    # Certifications
+    (901, "AWS Certified Solutions Architect", "certification", ("aws solutions architect",)),
+    (902, "AWS Certified Developer", "certification", ()),
+    (903, "Microsoft Certified: Azure Fundamentals", "certification", ("az-900",)),
+    (904, "Microsoft Certified: Azure Solutions Architect Expert", "certification", ("az-305",)),
+    (
+        905,
+        "Google Cloud Professional Cloud Architect",
+        "certification",
+        ("gcp professional cloud architect",),
+    ),
+    (906, "Certified Kubernetes Administrator", "certification", ("cka",)),
+    (907, "PMP", "certification", ("project management professional",)),
+    (908, "PRINCE2", "certification", ("prince 2",)),
+    (909, "Certified ScrumMaster", "certification", ("csm", "professional scrum master", "psm")),
+    (910, "ITIL Foundation", "certification", ("itil v4 foundation", "itil 4 foundation")),
+    (911, "CISSP", "certification", ()),
+    (912, "CISM", "certification", ()),
+    (913, "TOGAF", "certification", ("togaf 9", "togaf certified")),
+    (914, "IBM Certified", "certification", ("ibm certification",)),
+    (915, "Red Hat Certified Engineer", "certification", ("rhce",)),
+    (916, "Oracle Certified Professional", "certification", ("ocp java",)),
+    (917, "SAP Certified", "certification", ("sap certification",)),
+    (918, "ISO 27001", "certification", ("iso/iec 27001", "iso27001")),
+)
+
+# Aliases too ambiguous to extract from prose; they only match whole list entries
+_LIST_ONLY_ALIASES = frozenset(
+    {"c", "go", "r", "ai", "ia", "py", "ts", "dl", "rest", "node", "cloud", "scala"}
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_label(label: str) -> str:
+    """
+    Normalize a label for dictionary lookup (lowercase, single spaces).
+
+    Args:
+        label: Raw skill or certification label
+
+    Returns:
+        str: Normalized label
+    """
+    return _WHITESPACE.sub(" ", label.strip().lower())
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton matching many patterns in one pass over a text.
+
+    Matches are reported only on word boundaries, and overlapping matches are
+    resolved leftmost-longest, so "machine learning engineer" yields
+    "machine learning" rather than "machine" or "learning".
+
+    Args:
+        patterns: Mapping of normalized pattern to the value reported on a match
+
+    Example:
+        >>> ac = AhoCorasick({"k8s": 205, "python": 101})
+        >>> [value for _, _, value in ac.find(normalize_label("Python and K8s"))]
+        [101, 205]
+    """
+
+    def __init__(self, patterns: Dict[str, int]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, int]]] = [[]]
+        for pattern, value in patterns.items():
+            self._add(pattern, value)
+        self._link()
+
+    def _add(self, pattern: str, value: int) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), value))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield every word-bounded match in ``text`` as (start, end, value).
+
+        Args:
+            text: Normalized text to scan
+        """
+        node = 0
+        for end, ch in enumerate(text, start=1):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, value in self._out[node]:
+                start = end - length
+                if (start == 0 or not text[start - 1].isalnum()) and (
+                    end == len(text) or not text[end].isalnum()
+                ):
+                    yield start, end, value
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Return non-overlapping matches, preferring the leftmost and then longest one.
+
+        Args:
+            text: Normalized text to scan
+
+        Returns:
+            List[Tuple[int, int, int]]: (start, end, value) triples in text order
+        """
+        selected = []
+        last_end = 0
+        for start, end, value in sorted(self.iter_matches(text), key=lambda m: (m[0], -m[1])):
+            if start >= last_end:
+                selected.append((start, end, value))
+                last_end = end
+        return selected
+
+
+SKILL_NAMES: Dict[int, str] = {skill_id: name for skill_id, name, _, _ in CANONICAL_SKILLS}
+SKILL_KINDS: Dict[int, str] = {skill_id: kind for skill_id, _, kind, _ in CANONICAL_SKILLS}
+
+_ALIASES: Dict[str, int] = {}
+for _skill_id, _name, _kind, _aliases in CANONICAL_SKILLS:
+    for _alias in (_name, *_aliases):
+        _ALIASES.setdefault(normalize_label(_alias), _skill_id)
+
+_TEXT_MATCHER = AhoCorasick(
+    {alias: skill_id for alias, skill_id in _ALIASES.items() if alias not in _LIST_ONLY_ALIASES}
+)
+
+
+def lookup_skill(label: str) -> Optional[int]:
+    """
+    Return the canonical skill ID for an exact (normalized) label or alias.
+
+    Args:
+        label: Skill or certification label
+
+    Returns:
+        Optional[int]: Canonical skill ID, or None if the label is unknown
+
+    Example:
+        >>> lookup_skill("K8s")
+        205
+    """
+    return _ALIASES.get(normalize_label(label))
+
+
+def extract_skill_ids(text: str) -> List[int]:
+    """
+    Extract the canonical skills mentioned in free text.
+
+    Args:
+        text: Free text (e.g. a project description)
+
+    Returns:
+        List[int]: Canonical skill IDs in order of first mention
+    """
+    found = dict.fromkeys(value for _, _, value in _TEXT_MATCHER.find(normalize_label(text)))
+    return list(found)
+
+
+def flatten_terms(value: Any) -> List[str]:
+    """
+    Flatten a JSON column or extractor field (string, list or objects) into strings.
+
+    Args:
+        value: Raw value, possibly a JSON-encoded string
+
+    Returns:
+        List[str]: Non-empty string terms
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return [part.strip() for part in re.split(r"[,;\n]", value) if part.strip()]
+        if isinstance(value, str):
+            return [value] if value.strip() else []
+    if isinstance(value, dict):
+        return [str(v) for v in value.values() if isinstance(v, (str, int, float)) and v]
+    if isinstance(value, list):
+        terms: List[str] = []
+        for item in value:
+            if isinstance(item, (dict, list)):
+                terms.extend(flatten_terms(item))
+            elif item not in (None, ""):
+                terms.append(str(item))
+        return terms
+    return [str(value)] if value else []
+
+
+def canonicalize_labels(labels: Iterable[str]) -> Tuple[List[str], List[int]]:
+    """
+    Replace known labels by their canonical names and collect their skill IDs.
+
+    Only exact aliases are renamed. Any other label is kept as written, and the
+    unambiguous skills embedded in it only add their IDs ("Cobol programming"
+    stays as is and adds COBOL; "Go-to-market strategy" adds nothing).
+
+    Args:
+        labels: Raw skill or certification labels
+
+    Returns:
+        Tuple[List[str], List[int]]: De-duplicated labels and canonical IDs
+
+    Example:
+        >>> canonicalize_labels(["k8s", "Kubernetes", "Cobol programming", "Excel"])
+        (['Kubernetes', 'Cobol programming', 'Microsoft Excel'], [205, 115, 505])
+    """
+    names: Dict[str, str] = {}
+    ids: Dict[int, None] = {}
+    for label in labels:
+        normalized = normalize_label(label)
+        if not normalized:
+            continue
+        skill_id = _ALIASES.get(normalized)
+        if skill_id:
+            ids[skill_id] = None
+            names.setdefault(SKILL_NAMES[skill_id].lower(), SKILL_NAMES[skill_id])
+            continue
+        names.setdefault(normalized, label.strip())
+        for _, _, embedded in _TEXT_MATCHER.find(normalized):
+            ids[embedded] = None
+    return list(names.values()), list(ids)
+
+
+class SkillProfile(NamedTuple):
+    """Canonicalized skills of a document, ready to be stored."""
+
+    skills: List[str]
+    certifications: List[str]
+    skill_ids: Dict[int, str]  # canonical ID -> source ("listed", "certification", "extracted")
+
+
+def build_skill_profile(
+    skills: Any, certifications: Any, texts: Iterable[Any] = ()
+) -> SkillProfile:
+    """
+    Normalize the skill and certification lists of a document and enrich them from its text.
+
+    Skills found only in the free-text fields are appended to the skill list.
+
+    Args:
+        skills: Skill list as produced by the extractor (list or JSON string)
+        certifications: Certification list (list or JSON string)
+        texts: Free-text fields to scan for additional skills
+
+    Returns:
+        SkillProfile: Canonical skill list, certification list and ID sources
+    """
+    skill_names, listed = canonicalize_labels(flatten_terms(skills))
+    cert_names, certified = canonicalize_labels(flatten_terms(certifications))
+
+    skill_ids: Dict[int, str] = {}
+    for skill_id in certified:
+        skill_ids[skill_id] = "certification"
+    for skill_id in listed:
+        skill_ids[skill_id] = "listed"
+
+    for text in texts:
+        for term in flatten_terms(text):
+            for skill_id in extract_skill_ids(term):
+                if skill_id not in skill_ids:
+                    skill_ids[skill_id] = "extracted"
+                    if SKILL_KINDS[skill_id] == "skill":
+                        skill_names.append(SKILL_NAMES[skill_id])
+
+    return SkillProfile(skill_names, cert_names, skill_ids)
+
+
+def initialize_skill_tables(db_path: str = DB_PATH) -> None:
+    """
+    Create the skills and entity_skills tables and sync the canonical dictionary.
+
+    Args:
+        db_path: Path to the recruitment database file
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS skills (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                kind TEXT NOT NULL
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_skills (
+                entity_type TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                skill_id INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                PRIMARY KEY (entity_type, entity_id, skill_id),
+                FOREIGN KEY (skill_id) REFERENCES skills (id)
+            )
+        """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entity_skills_skill "
+            "ON entity_skills (skill_id, entity_type)"
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO skills (id, name, kind) VALUES (?, ?, ?)",
+            [(skill_id, name, kind) for skill_id, name, kind, _ in CANONICAL_SKILLS],
+        )
+
+
+def store_skill_ids(
+    cursor: sqlite3.Cursor, entity_type: str, entity_id: str, skill_ids: Dict[int, str]
+) -> None:
+    """
+    Replace the canonical skills stored for a candidate or tender.
+
+    Runs on the caller's cursor so it commits together with the record itself.
+
+    Args:
+        cursor: Cursor of the connection saving the record
+        entity_type: "candidate" or "bando"
+        entity_id: ID of the saved record
+        skill_ids: Canonical ID to source mapping from :func:`build_skill_profile`
+    """
+    cursor.execute(
+        "DELETE FROM entity_skills WHERE entity_type = ? AND entity_id = ?",
+        (entity_type, entity_id),
+    )
+    cursor.executemany(
+        "INSERT INTO entity_skills (entity_type, entity_id, skill_id, source) VALUES (?, ?, ?, ?)",
+        [(entity_type, entity_id, skill_id, source) for skill_id, source in skill_ids.items()],
+    )
@@ -0,0 +1,546 @@
+"""
+Skill-Gap Matrix for AI Recruitment Suite.
+
+This module precomputes, for every open Bando di Gara (no deadline, or a deadline
+that has not passed), each candidate's matched skills, missing skills and missing
+certifications as compact arrays of canonical skill IDs. Rows are written in the
+same transaction as each candidate or bando insert, so the comparison agents read
+the "required vs. available" breakdown with one indexed query and the LLM only
+has to write the narrative.
+
+Candidate inserts reuse the bandos' requirements and parsed deadlines, cached per
+process until the ``bando_di_gara`` change-log generation moves. Reads never write:
+rows missing for a bando (closed bandos, records edited outside the tools) are
+computed in memory for the response and stored by ``ai-recruitment gaps``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from array import array
+from datetime import date
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from tools.core.db_connection import DB_PATH, read_connection, write_transaction
+from tools.core.skill_dictionary import SKILL_KINDS, SKILL_NAMES, flatten_terms, lookup_skill
+
+# Month names and abbreviations (Italian and English) by their first three letters
+_MONTHS = {
+    "gen": 1, "jan": 1, "feb": 2, "mar": 3, "apr": 4, "mag": 5, "may": 5, "giu": 6,
+    "jun": 6, "lug": 7, "jul": 7, "ago": 8, "aug": 8, "set": 9, "sep": 9, "ott": 10,
+    "oct": 10, "nov": 11, "dic": 12, "dec": 12,
+}  # fmt: skip
+
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b")
+_NUMERIC_DATE = re.compile(r"\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})\b")
+_WRITTEN_DATE = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th|°)?\s+([a-z]{3,})\.?,?\s+(\d{4})\b")
+
+
+class Requirements(NamedTuple):
+    """Canonical skills and certifications a Bando di Gara asks for."""
+
+    skills: FrozenSet[int]
+    certifications: FrozenSet[int]
+
+
+class SkillGap(NamedTuple):
+    """Gap between a bando's requirements and a candidate's canonical skills."""
+
+    matched_skills: List[int]
+    missing_skills: List[int]
+    missing_certifications: List[int]
+    coverage: Optional[float]  # Share of requirements met; None when nothing is required
+
+
+def pack_ids(ids: Iterable[int]) -> bytes:
+    """Serialize sorted skill IDs as unsigned 16-bit integers."""
+    return array("H", sorted(ids)).tobytes()
+
+
+def unpack_ids(blob: bytes) -> List[int]:
+    """Deserialize skill IDs written by :func:`pack_ids`."""
+    ids = array("H")
+    ids.frombytes(blob)
+    return ids.tolist()
+
+
+def parse_deadline(text: Optional[str]) -> Optional[date]:
+    """
+    Parse the deadline of a Bando di Gara as written by the extractor.
+
+    Understands ISO dates, day-first numeric dates and written Italian or English
+    months; anything else (e.g. "Not specified") is treated as no deadline.
+
+    Args:
+        text: Raw deadline text
+
+    Returns:
+        Optional[date]: The deadline, or None if none could be read
+
+    Example:
+        >>> parse_deadline("Scadenza: 15 marzo 2025, ore 12:00")
+        datetime.date(2025, 3, 15)
+    """
+    text = (text or "").lower()
+    match = _ISO_DATE.search(text)
+    if match:
+        year, month, day = map(int, match.groups())
+    else:
+        match = _NUMERIC_DATE.search(text)
+        if match:
+            day, month, year = map(int, match.groups())
+        else:
+            match = _WRITTEN_DATE.search(text)
+            if not match or match.group(2)[:3] not in _MONTHS:
+                return None
+            day, month, year = int(match.group(1)), _MONTHS[match.group(2)[:3]], int(match.group(3))
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _open_on(deadline: Optional[date], today: date) -> bool:
+    return deadline is None or deadline >= today
+
+
+def is_open(deadline: Optional[str], today: Optional[date] = None) -> bool:
+    """
+    Check whether a Bando di Gara still accepts candidates.
+
+    Args:
+        deadline: Raw deadline text
+        today: Reference date (default: today)
+
+    Returns:
+        bool: True if there is no readable deadline or it has not passed
+    """
+    return _open_on(parse_deadline(deadline), today or date.today())
+
+
+def compute_gap(requirements: Requirements, available: Set[int]) -> SkillGap:
+    """
+    Compare a bando's requirements with a candidate's canonical skills.
+
+    Args:
+        requirements: Required skill and certification IDs
+        available: Candidate's skill and certification IDs
+
+    Returns:
+        SkillGap: Matched and missing IDs and the share of requirements met
+
+    Example:
+        >>> compute_gap(Requirements(frozenset({101, 205}), frozenset({906})), {101})
+        SkillGap(matched_skills=[101], missing_skills=[205], missing_certifications=[906], ...)
+    """
+    missing_skills = sorted(requirements.skills - available)
+    missing_certifications = sorted(requirements.certifications - available)
+    total = len(requirements.skills) + len(requirements.certifications)
+    missing = len(missing_skills) + len(missing_certifications)
+    return SkillGap(
+        matched_skills=sorted(requirements.skills & available),
+        missing_skills=missing_skills,
+        missing_certifications=missing_certifications,
+        coverage=round((total - missing) / total, 4) if total else None,
+    )
+
+
+def initialize_gap_table(db_path: str = DB_PATH) -> None:
+    """
+    Create the skill_gaps table (rows are filled on insert or by a rebuild).
+
+    Args:
+        db_path: Path to the recruitment database file
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS skill_gaps (
+                bando_id TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                matched_skills BLOB NOT NULL,
+                missing_skills BLOB NOT NULL,
+                missing_certifications BLOB NOT NULL,
+                coverage REAL,
+                PRIMARY KEY (bando_id, candidate_id)
+            ) WITHOUT ROWID
+        """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_skill_gaps_coverage "
+            "ON skill_gaps (bando_id, coverage DESC)"
+        )
+
+
+def _requirements(
+    cursor: sqlite3.Cursor, bando_id: Optional[str] = None
+) -> Dict[str, Requirements]:
+    """Required skill and certification IDs per bando (one bando or all of them)."""
+    where = "AND entity_id = ?" if bando_id is not None else ""
+    params = (bando_id,) if bando_id is not None else ()
+    cursor.execute(
+        f"SELECT entity_id, skill_id FROM entity_skills WHERE entity_type = 'bando' {where}",
+        params,
+    )
+    ids: Dict[str, Set[int]] = {} if bando_id is None else {str(bando_id): set()}
+    for entity_id, skill_id in cursor.fetchall():
+        ids.setdefault(entity_id, set()).add(skill_id)
+    return {
+        entity_id: Requirements(
+            skills=frozenset(i for i in skill_ids if SKILL_KINDS.get(i) == "skill"),
+            certifications=frozenset(i for i in skill_ids if SKILL_KINDS.get(i) == "certification"),
+        )
+        for entity_id, skill_ids in ids.items()
+    }
+
+
+def _candidate_skills(
+    cursor: sqlite3.Cursor, candidate_id: Optional[str] = None
+) -> Dict[str, Set[int]]:
+    """Canonical skill IDs per candidate, including candidates without any."""
+    where = "WHERE id = ?" if candidate_id is not None else ""
+    params = (candidate_id,) if candidate_id is not None else ()
+    skills: Dict[str, Set[int]] = {
+        str(row[0]): set() for row in cursor.execute(f"SELECT id FROM candidates {where}", params)
+    }
+    where = "AND entity_id = ?" if candidate_id is not None else ""
+    cursor.execute(
+        f"SELECT entity_id, skill_id FROM entity_skills WHERE entity_type = 'candidate' {where}",
+        params,
+    )
+    for entity_id, skill_id in cursor.fetchall():
+        if entity_id in skills:
+            skills[entity_id].add(skill_id)
+    return skills
+
+
+def _store(cursor: sqlite3.Cursor, bando_id: str, gaps: Dict[str, SkillGap]) -> int:
+    cursor.executemany(
+        "INSERT OR REPLACE INTO skill_gaps (bando_id, candidate_id, matched_skills, "
+        "missing_skills, missing_certifications, coverage) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                bando_id,
+                candidate_id,
+                pack_ids(gap.matched_skills),
+                pack_ids(gap.missing_skills),
+                pack_ids(gap.missing_certifications),
+                gap.coverage,
+            )
+            for candidate_id, gap in gaps.items()
+        ],
+    )
+    return len(gaps)
+
+
+class _BandoCatalog(NamedTuple):
+    """Requirements and parsed deadlines of every bando at one change-log generation."""
+
+    generation: int
+    requirements: Dict[str, Requirements]
+    deadlines: Dict[str, Optional[date]]
+
+
+# Database file -> bando catalog, reused by candidate inserts until a bando changes
+_CATALOGS: Dict[str, _BandoCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def _database_key(cursor: sqlite3.Cursor) -> str:
+    return cursor.execute("PRAGMA database_list").fetchone()[2]
+
+
+def _bando_catalog(cursor: sqlite3.Cursor) -> _BandoCatalog:
+    """Return the bando catalog, re-reading it only when the bando generation moved."""
+    key = _database_key(cursor)
+    generation = (
+        cursor.execute(
+            "SELECT MAX(seq) FROM change_log WHERE table_name = 'bando_di_gara'"
+        ).fetchone()[0]
+        or 0
+    )
+    with _CATALOGS_LOCK:
+        catalog = _CATALOGS.get(key)
+    if catalog is not None and catalog.generation == generation:
+        return catalog
+
+    cursor.execute("SELECT id, deadline FROM bando_di_gara")
+    deadlines = {str(bando_id): parse_deadline(deadline) for bando_id, deadline in cursor}
+    catalog = _BandoCatalog(generation, _requirements(cursor), deadlines)
+    if key:  # In-memory databases have no file name to key the cache on
+        with _CATALOGS_LOCK:
+            _CATALOGS[key] = catalog
+    return catalog
+
+
+def open_bando_ids(cursor: sqlite3.Cursor, today: Optional[date] = None) -> List[str]:
+    """
+    Return the IDs of the bandos whose deadline has not passed.
+
+    Args:
+        cursor: Cursor of an open connection
+        today: Reference date (default: today)
+
+    Returns:
+        List[str]: Open bando IDs
+    """
+    today = today or date.today()
+    deadlines = _bando_catalog(cursor).deadlines
+    return [bando_id for bando_id, deadline in deadlines.items() if _open_on(deadline, today)]
+
+
+def refresh_candidate_gaps(
+    cursor: sqlite3.Cursor, candidate_id: str, today: Optional[date] = None
+) -> int:
+    """
+    Compute a candidate's gap against every open bando.
+
+    Runs on the caller's cursor so it commits together with the candidate insert.
+    Bando requirements and deadlines come from the cached catalog, so an insert
+    reads only the candidate's own skills.
+
+    Args:
+        cursor: Cursor of the connection saving the candidate
+        candidate_id: ID of the saved candidate
+        today: Reference date for open bandos (default: today)
+
+    Returns:
+        int: Number of gap rows written
+    """
+    available = _candidate_skills(cursor, candidate_id).get(str(candidate_id), set())
+    catalog = _bando_catalog(cursor)
+    nothing = Requirements(frozenset(), frozenset())
+    written = 0
+    for bando_id in open_bando_ids(cursor, today):
+        gap = compute_gap(catalog.requirements.get(bando_id, nothing), available)
+        written += _store(cursor, bando_id, {str(candidate_id): gap})
+    return written
+
+
+def refresh_bando_gaps(cursor: sqlite3.Cursor, bando_id: str, only_missing: bool = False) -> int:
+    """
+    Compute every candidate's gap against one bando.
+
+    Runs on the caller's cursor so it commits together with the bando insert.
+
+    Args:
+        cursor: Cursor of the connection saving the bando
+        bando_id: ID of the bando
+        only_missing: Skip candidates that already have a row for this bando
+
+    Returns:
+        int: Number of gap rows written
+    """
+    with _CATALOGS_LOCK:
+        # Drop the catalog even if the generation check would catch the new bando, in
+        # case this transaction rolls back and its sequence number is reused
+        _CATALOGS.pop(_database_key(cursor), None)
+    candidates = _candidate_skills(cursor)
+    if only_missing:
+        cursor.execute("SELECT candidate_id FROM skill_gaps WHERE bando_id = ?", (bando_id,))
+        for (candidate_id,) in cursor.fetchall():
+            candidates.pop(candidate_id, None)
+    requirements = _requirements(cursor, bando_id)[str(bando_id)]
+    return _store(
+        cursor,
+        str(bando_id),
+        {
+            candidate_id: compute_gap(requirements, available)
+            for candidate_id, available in candidates.items()
+        },
+    )
+
+
+class GapRefresh(NamedTuple):
+    """Outcome of a full skill-gap rebuild."""
+
+    bandos: int  # Open bandos recomputed
+    rows: int  # Gap rows written
+    pruned: int  # Rows removed for closed or deleted bandos and deleted candidates
+
+
+def rebuild_skill_gaps(db_path: str = DB_PATH, today: Optional[date] = None) -> GapRefresh:
+    """
+    Recompute the matrix for every open bando and prune rows that are no longer needed.
+
+    Inserts keep the matrix current; run this after bandos close or records are
+    edited outside the tools (e.g. from a daily scheduler).
+
+    Args:
+        db_path: Path to the recruitment database file
+        today: Reference date for open bandos (default: today)
+
+    Returns:
+        GapRefresh: Bandos recomputed, rows written and rows pruned
+    """
+    initialize_gap_table(db_path)
+    with write_transaction(db_path) as conn:
+        cursor = conn.cursor()
+        open_ids = open_bando_ids(cursor, today)
+        cursor.execute(
+            "DELETE FROM skill_gaps WHERE candidate_id NOT IN (SELECT id FROM candidates) "
+            "OR bando_id NOT IN (SELECT id FROM bando_di_gara)"
+        )
+        pruned = cursor.rowcount
+        cursor.execute("SELECT DISTINCT bando_id FROM skill_gaps")
+        still_open = set(open_ids)
+        closed = [(row[0],) for row in cursor.fetchall() if row[0] not in still_open]
+        cursor.executemany("DELETE FROM skill_gaps WHERE bando_id = ?", closed)
+        pruned += max(cursor.rowcount, 0)
+        rows = sum(refresh_bando_gaps(cursor, bando_id) for bando_id in open_ids)
+    return GapRefresh(len(open_ids), rows, pruned)
+
+
+def _names(ids: Iterable[int]) -> List[str]:
+    return [SKILL_NAMES.get(skill_id, str(skill_id)) for skill_id in ids]
+
+
+def _split_ids(value: Optional[str]) -> List[str]:
+    """Parse candidate IDs given as a JSON array or comma-separated text."""
+    return list(dict.fromkeys(i.strip().strip("'\"") for i in flatten_terms(value or "") if i))
+
+
+GapRow = Tuple[str, Optional[str], Optional[float], List[int], List[int], List[int]]
+
+
+def _stored_rows(
+    conn: sqlite3.Connection, bando_id: str, wanted: List[str], top_k: int
+) -> Tuple[List[GapRow], int]:
+    """Read a bando's precomputed gap rows, best coverage first."""
+    query = (
+        "SELECT g.candidate_id, c.candidate_name, g.coverage, g.matched_skills, "
+        "g.missing_skills, g.missing_certifications FROM skill_gaps g "
+        "JOIN candidates c ON c.id = g.candidate_id WHERE g.bando_id = ?"
+    )
+    params: List[Any] = [bando_id]
+    if wanted:
+        query += f" AND g.candidate_id IN ({', '.join('?' * len(wanted))})"
+        params.extend(wanted)
+    query += " ORDER BY g.coverage DESC, c.rowid"
+    if not wanted:
+        query += " LIMIT ?"
+        params.append(max(int(top_k), 1))
+    rows = [
+        (str(row[0]), row[1], row[2], unpack_ids(row[3]), unpack_ids(row[4]), unpack_ids(row[5]))
+        for row in conn.execute(query, params)
+    ]
+    total = conn.execute(
+        "SELECT COUNT(*) FROM skill_gaps g JOIN candidates c ON c.id = g.candidate_id "
+        "WHERE g.bando_id = ?",
+        (bando_id,),
+    ).fetchone()[0]
+    return rows, total
+
+
+def _computed_rows(
+    cursor: sqlite3.Cursor, requirements: Requirements, wanted: List[str], top_k: int
+) -> Tuple[List[GapRow], int]:
+    """Compute a bando's gap rows in memory, in the order of :func:`_stored_rows`."""
+    names = {
+        str(candidate_id): (rowid, name)
+        for rowid, candidate_id, name in cursor.execute(
+            "SELECT rowid, id, candidate_name FROM candidates"
+        )
+    }
+    candidates = _candidate_skills(cursor)
+    selected = [i for i in candidates if i in wanted] if wanted else list(candidates)
+    gaps = {i: compute_gap(requirements, candidates[i]) for i in selected}
+    # Same order as SQLite's "coverage DESC": NULL coverage sorts last
+    order = sorted(
+        gaps, key=lambda i: (gaps[i].coverage is None, -(gaps[i].coverage or 0), names[i][0])
+    )
+    if not wanted:
+        order = order[: max(int(top_k), 1)]
+    rows = [
+        (
+            candidate_id,
+            names[candidate_id][1],
+            gaps[candidate_id].coverage,
+            gaps[candidate_id].matched_skills,
+            gaps[candidate_id].missing_skills,
+            gaps[candidate_id].missing_certifications,
+        )
+        for candidate_id in order
+    ]
+    return rows, len(candidates)
+
+
+def get_skill_gaps(bando_id: str, candidate_ids: Optional[str] = None, top_k: int = 10) -> str:
+    """
+    Return the precomputed skill-gap breakdown of candidates for a Bando di Gara.
+
+    Args:
+        bando_id: The ID of the Bando di Gara
+        candidate_ids: Optional candidate IDs (comma-separated or JSON array); by
+                       default the ``top_k`` candidates with the best coverage
+        top_k: Maximum number of candidates returned without ``candidate_ids``
+
+    Returns:
+        str: JSON object with the bando's requirements and, per candidate, the
+             matched skills, missing skills, missing certifications and coverage
+    """
+    try:
+        with read_connection() as conn:
+            bando = conn.execute(
+                "SELECT id, project_title, deadline, required_skills, certifications_required "
+                "FROM bando_di_gara WHERE id = ?",
+                (bando_id,),
+            ).fetchone()
+            if bando is None:
+                return f"❌ Bando di Gara with ID {bando_id} not found"
+            missing = conn.execute(
+                "SELECT COUNT(*) FROM candidates c WHERE NOT EXISTS (SELECT 1 FROM skill_gaps g "
+                "WHERE g.bando_id = ? AND g.candidate_id = c.id)",
+                (bando_id,),
+            ).fetchone()[0]
+
+            wanted = _split_ids(candidate_ids)
+            requirements = _requirements(conn.cursor(), bando_id)[str(bando_id)]
+            if missing:
+                # Closed bandos or rows edited outside the tools: compute without storing
+                rows, total = _computed_rows(conn.cursor(), requirements, wanted, top_k)
+            else:
+                rows, total = _stored_rows(conn, bando_id, wanted, top_k)
+
+        # Requirements the dictionary does not know cannot be compared automatically
+        unrecognized = [
+            label
+            for label in flatten_terms(bando[3]) + flatten_terms(bando[4])
+            if lookup_skill(label) is None
+        ]
+        payload: Dict[str, Any] = {
+            "bando_id": str(bando[0]),
+            "project_title": bando[1],
+            "deadline": bando[2],
+            "open": is_open(bando[2]),
+            "required_skills": _names(sorted(requirements.skills)),
+            "required_certifications": _names(sorted(requirements.certifications)),
+            "candidates": [
+                {
+                    "candidate_id": str(candidate_id),
+                    "candidate_name": name,
+                    "coverage": coverage,
+                    "matched_skills": _names(matched),
+                    "missing_skills": _names(missing_skills),
+                    "missing_certifications": _names(missing_certs),
+                }
+                for candidate_id, name, coverage, matched, missing_skills, missing_certs in rows
+            ],
+            "total_candidates": total,
+        }
+        if unrecognized:
+            payload["unrecognized_requirements"] = unrecognized
+        if wanted:
+            found = {entry["candidate_id"] for entry in payload["candidates"]}
+            not_found = [i for i in wanted if i not in found]
+            if not_found:
+                payload["not_found"] = not_found
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    except sqlite3.Error as e:
+        return f"❌ Database error while retrieving skill gaps: {str(e)}"
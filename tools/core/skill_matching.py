@@ -0,0 +1,505 @@
+"""
+Semantic Skill Matching Tools for AI Recruitment Suite.
+
+This module embeds candidate and tender skill profiles locally (no network, no model
+download) with a feature-hashing vectorizer, stores the embeddings as packed float32
+blobs and searches them with an inverted-file (IVF) approximate nearest-neighbour index.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+import json
+import math
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from tools.core.db_connection import DB_PATH, read_connection, write_transaction
+from tools.core.experience import candidates_with_experience
+from tools.core.skill_dictionary import SKILL_NAMES, flatten_terms, lookup_skill, normalize_label
+
+EMBEDDING_DIM = 256
+
+# Weight of each feature family relative to the whole term
+_WORD_WEIGHT = 0.5
+_TRIGRAM_WEIGHT = 0.25
+_CONTEXT_WEIGHT = 0.5
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normalize a skill label for hashing, resolving aliases to their canonical skill.
+
+    Args:
+        skill: Raw skill label
+
+    Returns:
+        str: Lowercase canonical name, or the normalized label if it is unknown
+
+    Example:
+        >>> normalize_skill("  K8s ")
+        'kubernetes'
+    """
+    skill_id = lookup_skill(skill)
+    return SKILL_NAMES[skill_id].lower() if skill_id else normalize_label(skill)
+
+
+def _add_feature(vec: List[float], feature: str, weight: float, dim: int) -> None:
+    h = zlib.crc32(feature.encode("utf-8"))
+    sign = 1.0 if (h >> 31) & 1 else -1.0
+    vec[h % dim] += sign * weight
+
+
+def embed_terms(terms: Iterable[Tuple[str, float]], dim: int = EMBEDDING_DIM) -> "array[float]":
+    """
+    Embed weighted skill terms into a unit-length float32 vector.
+
+    Each term contributes its normalized label, its words and its character
+    trigrams, so spelling variants and multi-word skills still overlap.
+
+    Args:
+        terms: Iterable of (term, weight) pairs
+        dim: Embedding dimension
+
+    Returns:
+        array: L2-normalized float32 vector (empty terms give a zero vector)
+    """
+    vec = [0.0] * dim
+    for raw, weight in terms:
+        term = normalize_skill(raw)
+        if not term:
+            continue
+        _add_feature(vec, "s:" + term, weight, dim)
+        words = term.split(" ")
+        if len(words) > 1:
+            for word in words:
+                _add_feature(vec, "w:" + word, weight * _WORD_WEIGHT, dim)
+        padded = f"#{term}#"
+        trigrams = [padded[i : i + 3] for i in range(len(padded) - 2)]
+        trigram_weight = weight * _TRIGRAM_WEIGHT / math.sqrt(len(trigrams))
+        for trigram in trigrams:
+            _add_feature(vec, "c:" + trigram, trigram_weight, dim)
+
+    norm = math.sqrt(sum(x * x for x in vec))
+    if norm:
+        vec = [x / norm for x in vec]
+    return array("f", vec)
+
+
+def pack_vector(vec: Sequence[float]) -> bytes:
+    """Pack a vector as a float32 blob."""
+    return array("f", vec).tobytes()
+
+
+def unpack_vector(blob: bytes) -> "array[float]":
+    """Unpack a float32 blob produced by :func:`pack_vector`."""
+    vec = array("f")
+    vec.frombytes(blob)
+    return vec
+
+
+def _sparse(vec: Sequence[float]) -> List[Tuple[int, float]]:
+    return [(i, x) for i, x in enumerate(vec) if x]
+
+
+def _sparse_dot(sparse: List[Tuple[int, float]], dense: Sequence[float]) -> float:
+    return sum(x * dense[i] for i, x in sparse)
+
+
+def _nearest_centroid(sparse: List[Tuple[int, float]], centroids: List[List[float]]) -> int:
+    return max(range(len(centroids)), key=lambda cluster: _sparse_dot(sparse, centroids[cluster]))
+
+
+class IVFIndex:
+    """
+    Inverted-file approximate nearest-neighbour index over unit vectors.
+
+    Vectors are clustered with spherical k-means; a query only scans the
+    ``nprobe`` lists whose centroids are closest to it.
+
+    Args:
+        nlist: Number of clusters (defaults to the square root of the item count)
+        nprobe: Number of clusters scanned per query
+        iterations: k-means iterations used when building
+    """
+
+    def __init__(self, nlist: Optional[int] = None, nprobe: int = 4, iterations: int = 6):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.iterations = iterations
+        self._centroids: List[List[float]] = []
+        self._lists: List[List[Tuple[str, "array[float]"]]] = []
+
+    def __len__(self) -> int:
+        return sum(len(members) for members in self._lists)
+
+    def build(self, items: Dict[str, "array[float]"]) -> "IVFIndex":
+        """
+        Cluster the given vectors into inverted lists.
+
+        Args:
+            items: Mapping of item ID to unit vector
+
+        Returns:
+            IVFIndex: The index itself, for chaining
+        """
+        ids = sorted(items)
+        if not ids:
+            self._centroids, self._lists = [], []
+            return self
+
+        nlist = self.nlist or max(1, round(math.sqrt(len(ids))))
+        nlist = min(nlist, len(ids))
+        sparse = {item_id: _sparse(items[item_id]) for item_id in ids}
+
+        # Deterministic seeding: evenly spaced items in ID order
+        step = len(ids) / nlist
+        centroids = [list(items[ids[int(i * step)]]) for i in range(nlist)]
+        assignment: Dict[str, int] = {}
+        for _ in range(self.iterations):
+            assignment = {
+                item_id: _nearest_centroid(vec, centroids) for item_id, vec in sparse.items()
+            }
+            sums = [[0.0] * len(centroids[0]) for _ in range(nlist)]
+            for item_id, cluster in assignment.items():
+                target = sums[cluster]
+                for i, x in sparse[item_id]:
+                    target[i] += x
+            for cluster, total in enumerate(sums):
+                norm = math.sqrt(sum(x * x for x in total))
+                if norm:  # Empty clusters keep their previous centroid
+                    centroids[cluster] = [x / norm for x in total]
+
+        self._centroids = centroids
+        self._lists = [[] for _ in range(nlist)]
+        for item_id, cluster in assignment.items():
+            self._lists[cluster].append((item_id, items[item_id]))
+        return self
+
+    def search(
+        self, query: Sequence[float], top_k: int = 10, allowed: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the items most similar (cosine) to the query vector.
+
+        Args:
+            query: Unit query vector
+            top_k: Maximum number of results
+            allowed: Optional set of item IDs to restrict the search to; further
+                     lists are probed until ``top_k`` allowed items are found
+
+        Returns:
+            List[Tuple[str, float]]: (item ID, similarity) pairs, best first
+        """
+        q = _sparse(query)
+        if not q or not self._centroids:
+            return []
+        ranked = sorted(
+            range(len(self._centroids)),
+            key=lambda cluster: _sparse_dot(q, self._centroids[cluster]),
+            reverse=True,
+        )
+        scored: List[Tuple[str, float]] = []
+        for probed, cluster in enumerate(ranked):
+            if probed >= self.nprobe and len(scored) >= top_k:
+                break
+            scored.extend(
+                (item_id, _sparse_dot(q, vec))
+                for item_id, vec in self._lists[cluster]
+                if allowed is None or item_id in allowed
+            )
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        return scored[:top_k]
+
+
+# Columns that make up each profile, with the weight of their terms
+_PROFILE_COLUMNS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "candidates": (
+        ("technical_skills", 1.0),
+        ("certifications", 1.0),
+        ("position_applied", _CONTEXT_WEIGHT),
+        ("industry_experience", _CONTEXT_WEIGHT),
+    ),
+    "bando_di_gara": (
+        ("required_skills", 1.0),
+        ("certifications_required", 1.0),
+        ("project_title", _CONTEXT_WEIGHT),
+        ("industry_sector", _CONTEXT_WEIGHT),
+    ),
+}
+
+_ENTITY_TYPES = {"candidates": "candidate", "bando_di_gara": "bando"}
+
+
+def profile_terms(table: str, record: Dict[str, Any]) -> List[Tuple[str, float]]:
+    """
+    Build the weighted terms describing a candidate or tender record.
+
+    Args:
+        table: Source table ("candidates" or "bando_di_gara")
+        record: Row as a column-name mapping
+
+    Returns:
+        List[Tuple[str, float]]: Weighted terms for :func:`embed_terms`
+    """
+    terms = []
+    for column, weight in _PROFILE_COLUMNS[table]:
+        terms.extend((term, weight) for term in flatten_terms(record.get(column)))
+    return terms
+
+
+def initialize_embedding_table(db_path: str = DB_PATH) -> None:
+    """
+    Create the skill_embeddings table if it does not exist.
+
+    Args:
+        db_path: Path to the recruitment database file
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS skill_embeddings (
+                entity_type TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                source_hash INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (entity_type, entity_id)
+            )
+        """
+        )
+
+
+def _source_hash(values: Sequence[Any]) -> int:
+    return zlib.crc32("\x1f".join(str(v) for v in values).encode("utf-8"))
+
+
+def _profile_vector(table: str, values: Sequence[Any]) -> "array[float]":
+    columns = [column for column, _ in _PROFILE_COLUMNS[table]]
+    return embed_terms(profile_terms(table, dict(zip(columns, values))))
+
+
+def _upsert_embeddings(cursor: sqlite3.Cursor, rows: List[Tuple]) -> None:
+    cursor.executemany(
+        "INSERT OR REPLACE INTO skill_embeddings "
+        "(entity_type, entity_id, dim, vector, source_hash, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def embed_entity(cursor: sqlite3.Cursor, table: str, entity_id: str) -> None:
+    """
+    Write the embedding of one candidate or tender inside the caller's write transaction.
+
+    Called by the save tools right after the row is inserted, so searches never
+    have to embed anything.
+
+    Args:
+        cursor: Cursor inside an open write transaction
+        table: Source table ("candidates" or "bando_di_gara")
+        entity_id: ID of the inserted or updated row
+    """
+    entity_type = _ENTITY_TYPES[table]
+    columns = [column for column, _ in _PROFILE_COLUMNS[table]]
+    row = cursor.execute(
+        f"SELECT {', '.join(columns)} FROM {table} WHERE id = ?", (entity_id,)
+    ).fetchone()
+    if row is None:
+        cursor.execute(
+            "DELETE FROM skill_embeddings WHERE entity_type = ? AND entity_id = ?",
+            (entity_type, entity_id),
+        )
+        return
+    vec = _profile_vector(table, row)
+    _upsert_embeddings(
+        cursor,
+        [
+            (
+                entity_type,
+                entity_id,
+                EMBEDDING_DIM,
+                pack_vector(vec),
+                _source_hash(row),
+                datetime.now().isoformat(),
+            )
+        ],
+    )
+
+
+def refresh_embeddings(db_path: str = DB_PATH) -> int:
+    """
+    Reconcile all embeddings with their candidates and tenders.
+
+    The save tools keep embeddings current; this full pass (``ai-recruitment
+    embeddings``) covers rows written by other means, such as imports or an older
+    version of the suite. It embeds new or changed rows and drops embeddings of
+    deleted rows.
+
+    Args:
+        db_path: Path to the recruitment database file
+
+    Returns:
+        int: Number of embeddings written or removed
+    """
+    initialize_embedding_table(db_path)
+    changes = 0
+    with write_transaction(db_path) as conn:
+        cursor = conn.cursor()
+        for table, entity_type in _ENTITY_TYPES.items():
+            columns = [column for column, _ in _PROFILE_COLUMNS[table]]
+            known = dict(
+                cursor.execute(
+                    "SELECT entity_id, source_hash FROM skill_embeddings WHERE entity_type = ?",
+                    (entity_type,),
+                ).fetchall()
+            )
+            now = datetime.now().isoformat()
+            updates = []
+            for row in conn.execute(f"SELECT id, {', '.join(columns)} FROM {table}"):
+                entity_id, values = row[0], row[1:]
+                source_hash = _source_hash(values)
+                if known.pop(entity_id, None) == source_hash:
+                    continue
+                vec = _profile_vector(table, values)
+                updates.append(
+                    (entity_type, entity_id, EMBEDDING_DIM, pack_vector(vec), source_hash, now)
+                )
+            _upsert_embeddings(cursor, updates)
+            cursor.executemany(
+                "DELETE FROM skill_embeddings WHERE entity_type = ? AND entity_id = ?",
+                [(entity_type, entity_id) for entity_id in known],
+            )
+            changes += len(updates) + len(known)
+    return changes
+
+
+_index_cache: Dict[str, Tuple[Tuple[Any, ...], IVFIndex]] = {}
+_index_lock = threading.Lock()
+
+
+def get_candidate_index(db_path: str = DB_PATH) -> IVFIndex:
+    """
+    Return the IVF index over candidate embeddings, rebuilding it only when they changed.
+
+    Args:
+        db_path: Path to the recruitment database file
+
+    Returns:
+        IVFIndex: Index of candidate ID to profile embedding
+    """
+    with read_connection(db_path) as conn:
+        fingerprint = conn.execute(
+            "SELECT COUNT(*), MAX(updated_at), SUM(source_hash) FROM skill_embeddings "
+            "WHERE entity_type = 'candidate'"
+        ).fetchone()
+        with _index_lock:
+            cached = _index_cache.get(db_path)
+            if cached and cached[0] == fingerprint:
+                return cached[1]
+        rows = conn.execute(
+            "SELECT entity_id, vector FROM skill_embeddings WHERE entity_type = 'candidate'"
+        ).fetchall()
+
+    index = IVFIndex().build({entity_id: unpack_vector(blob) for entity_id, blob in rows})
+    with _index_lock:
+        _index_cache[db_path] = (fingerprint, index)
+    return index
+
+
+def nearest_candidates(
+    bando_id: str, top_k: int = 10, db_path: str = DB_PATH, min_years: Optional[float] = None
+) -> Optional[List[Tuple[str, float]]]:
+    """
+    Find the candidates whose skill profile is closest to a tender's requirements.
+
+    Read-only: candidate embeddings are written by the save tools (or by
+    :func:`refresh_embeddings`), never on the query path.
+
+    Args:
+        bando_id: The ID of the Bando di Gara
+        top_k: Maximum number of candidates to return
+        db_path: Path to the recruitment database file
+        min_years: Optional minimum years of experience, filtered in SQLite
+                   before ranking
+
+    Returns:
+        Optional[List[Tuple[str, float]]]: (candidate ID, similarity) pairs, best
+        first, or None if the tender does not exist
+    """
+    with read_connection(db_path) as conn:
+        row = conn.execute(
+            "SELECT vector FROM skill_embeddings WHERE entity_type = 'bando' AND entity_id = ?",
+            (bando_id,),
+        ).fetchone()
+        if row is not None:
+            query = unpack_vector(row[0])
+        else:
+            # Tender saved without an embedding (e.g. imported): embed it in memory
+            columns = [column for column, _ in _PROFILE_COLUMNS["bando_di_gara"]]
+            bando = conn.execute(
+                f"SELECT {', '.join(columns)} FROM bando_di_gara WHERE id = ?", (bando_id,)
+            ).fetchone()
+            if bando is None:
+                return None
+            query = _profile_vector("bando_di_gara", bando)
+        allowed = (
+            set(candidates_with_experience(conn, min_years=min_years))
+            if min_years is not None
+            else None
+        )
+    return get_candidate_index(db_path).search(query, top_k, allowed)
+
+
+def find_matching_candidates(
+    bando_id: str, top_k: int = 10, min_years: Optional[float] = None
+) -> str:
+    """
+    Find the candidates whose skills best match a Bando di Gara, without using the LLM.
+
+    Args:
+        bando_id: The ID of the Bando di Gara to match candidates against
+        top_k: Maximum number of candidates to return (default 10)
+        min_years: Optional minimum years of experience a candidate must have
+
+    Returns:
+        str: JSON object with the ranked candidates and their similarity scores
+    """
+    try:
+        start = time.perf_counter()
+        matches = nearest_candidates(bando_id, top_k, min_years=min_years)
+        if matches is None:
+            return f"❌ Bando di Gara with ID {bando_id} not found"
+
+        placeholders = ", ".join("?" * len(matches))
+        with read_connection() as conn:
+            names = dict(
+                conn.execute(
+                    f"SELECT id, candidate_name FROM candidates WHERE id IN ({placeholders})",
+                    [candidate_id for candidate_id, _ in matches],
+                ).fetchall()
+            )
+
+        payload = {
+            "bando_id": bando_id,
+            "matches": [
+                {
+                    "candidate_id": candidate_id,
+                    "candidate_name": names.get(candidate_id, ""),
+                    "similarity": round(score, 4),
+                }
+                for candidate_id, score in matches
+            ],
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    except sqlite3.Error as e:
+        return f"❌ Database error while matching candidates: {str(e)}"
@@ -1,50 +1,34 @@
 """
 Database Retrieval Tools for AI Recruitment Suite.
 
-This module provides tools for retrieving candidate and tender information
-from the recruitment database, including comparison data for evaluations.
+watsonx Orchestrate ``@tool`` adapters; the implementation is in ``tools.core.db_retrieval``.
 
 Author: Ruslan Magana Vsevolodovna
 Website: ruslanmv.com
 License: Apache 2.0
 """
 
-import json
-import sqlite3
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Optional
 
 from ibm_watsonx_orchestrate.agent_builder.tools import tool
 
+from tools.core.profiling import profiled
+from tools.core.response_budget import DEFAULT_MAX_TOKENS
 
-def _row_to_dict(
-    row: Optional[Tuple], description: List[Tuple], json_keys: Tuple[str, ...]
-) -> Dict[str, Any]:
-    """
-    Convert a database row to a dictionary, parsing JSON fields.
-
-    Args:
-        row: Database row tuple
-        description: Cursor description with column information
-        json_keys: Tuple of column names that contain JSON data
 
-    Returns:
-        Dict[str, Any]: Dictionary representation of the row
-    """
-    if not row:
-        return {}
+def _core():
+    from tools.core import db_retrieval
+    from tools.core.schema import init_schema
 
-    rec = dict(zip([col[0] for col in description], row))
-    for key in json_keys:
-        if key in rec and isinstance(rec[key], str):
-            try:
-                rec[key] = json.loads(rec[key])
-            except json.JSONDecodeError:
-                pass  # Keep as string if it's not valid JSON
-    return rec
+    init_schema()
+    return db_retrieval
 
 
 @tool
-def get_comparison_data(candidate_id: str, bando_id: str) -> str:
+@profiled
+def get_comparison_data(
+    candidate_id: str, bando_id: str, max_tokens: int = DEFAULT_MAX_TOKENS
+) -> str:
     """
     Retrieve full details for a candidate and tender document for comparison.
 
@@ -54,136 +38,143 @@ def get_comparison_data(candidate_id: str, bando_id: str) -> str:
     Args:
         candidate_id: The ID of the candidate to retrieve
         bando_id: The ID of the Bando di Gara to retrieve
+        max_tokens: Approximate response budget in LLM tokens, split between the
+                    two records; long text fields are shortened to fit (0 = no limit)
 
     Returns:
-        str: JSON object with 'candidate' and 'bando_di_gara' keys
+        str: JSON object with 'candidate' and 'bando_di_gara' keys, plus 'omitted'
+             when fields were shortened or left out
 
     Example:
         >>> get_comparison_data("1", "2")
         '{"candidate": {...}, "bando_di_gara": {...}}'
     """
-    with sqlite3.connect("recruitment.db") as conn:
-        cursor = conn.cursor()
-
-        # Fetch Candidate Data
-        cursor.execute("SELECT * FROM candidates WHERE id = ?", (candidate_id,))
-        candidate_row = cursor.fetchone()
-        candidate_desc = cursor.description
-        candidate_json_keys = (
-            "technical_skills",
-            "certifications",
-            "previous_companies",
-            "key_achievements",
-            "languages",
-            "industry_experience",
-        )
-        candidate_data = _row_to_dict(candidate_row, candidate_desc, candidate_json_keys)
-
-        # Fetch Bando di Gara Data
-        cursor.execute("SELECT * FROM bando_di_gara WHERE id = ?", (bando_id,))
-        bando_row = cursor.fetchone()
-        bando_desc = cursor.description
-        bando_json_keys = (
-            "required_skills",
-            "certifications_required",
-            "key_deliverables",
-        )
-        bando_data = _row_to_dict(bando_row, bando_desc, bando_json_keys)
-
-    # Combine into a single JSON object
-    comparison_payload = {"candidate": candidate_data, "bando_di_gara": bando_data}
-
-    return json.dumps(comparison_payload, ensure_ascii=False, indent=2)
+    return _core().get_comparison_data(candidate_id, bando_id, max_tokens)
 
 
 @tool
-def get_info_candidate(candidate_id: Optional[str] = None) -> str:
+@profiled
+def get_comparison_data_for_bandos(
+    candidate_id: str, bando_ids: str, max_tokens: int = DEFAULT_MAX_TOKENS, offset: int = 0
+) -> str:
+    """
+    Retrieve one candidate and several tender documents for comparison in one call.
+
+    Use this instead of calling get_comparison_data once per tender: the candidate
+    is fetched and sent once, and all tenders are fetched with a single query.
+
+    Args:
+        candidate_id: The ID of the candidate to compare
+        bando_ids: Comma-separated Bando di Gara IDs (e.g. "1,2,5")
+        max_tokens: Approximate response budget in LLM tokens, half for the
+                    candidate and half for the tenders (0 = no limit)
+        offset: Index of the first tender to return when paginating
+
+    Returns:
+        str: JSON object with 'candidate', 'bandi' (keyed by ID) and 'pairs', plus
+             'not_found' for unknown IDs and 'omitted' when the response was shaped
+
+    Example:
+        >>> get_comparison_data_for_bandos("1", "2,3")
+        '{"candidate": {...}, "bandi": {"2": {...}, "3": {...}}, "pairs": [...]}'
+    """
+    return _core().get_comparison_data_for_bandos(candidate_id, bando_ids, max_tokens, offset)
+
+
+@tool
+@profiled
+def get_comparison_data_for_candidates(
+    bando_id: str, candidate_ids: str, max_tokens: int = DEFAULT_MAX_TOKENS, offset: int = 0
+) -> str:
+    """
+    Retrieve one tender document and several candidates for comparison in one call.
+
+    Use this instead of calling get_comparison_data once per candidate: the tender
+    is fetched and sent once, and all candidates are fetched with a single query.
+
+    Args:
+        bando_id: The ID of the Bando di Gara to compare
+        candidate_ids: Comma-separated candidate IDs (e.g. "1,4,7")
+        max_tokens: Approximate response budget in LLM tokens, half for the
+                    tender and half for the candidates (0 = no limit)
+        offset: Index of the first candidate to return when paginating
+
+    Returns:
+        str: JSON object with 'bando_di_gara', 'candidates' (keyed by ID) and 'pairs',
+             plus 'not_found' for unknown IDs and 'omitted' when the response was shaped
+
+    Example:
+        >>> get_comparison_data_for_candidates("2", "1,4")
+        '{"bando_di_gara": {...}, "candidates": {"1": {...}, "4": {...}}, "pairs": [...]}'
+    """
+    return _core().get_comparison_data_for_candidates(bando_id, candidate_ids, max_tokens, offset)
+
+
+@tool
+@profiled
+def get_info_candidate(
+    candidate_id: Optional[str] = None,
+    since: Optional[int] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+) -> str:
     """
     Retrieve candidate(s) from the database.
 
+    Large results are shaped to fit ``max_tokens``: long text is truncated,
+    low-priority fields are dropped and the list is paginated. The response then
+    becomes an object with ``items``, ``total``, ``offset`` and an ``omitted``
+    report explaining how to fetch the rest.
+
     Args:
         candidate_id: Optional candidate ID. If provided, returns only that candidate;
                      otherwise returns all candidates
+        since: Optional change sequence from a previous call. If provided, returns
+               only candidates changed after it (use 0 for a first full read)
+        max_tokens: Approximate response budget in LLM tokens (0 = no limit)
+        offset: Index of the first candidate to return when paginating
 
     Returns:
-        str: JSON-encoded candidate data (single object or list)
+        str: JSON-encoded candidate data (single object or list), or with ``since``
+             an object with ``changed``, ``deleted`` and the new ``high_water_mark``
 
     Example:
         >>> get_info_candidate("1")
         '{"id": "1", "candidate_name": "John Doe", ...}'
+        >>> get_info_candidate(since=42)
+        '{"since": 42, "high_water_mark": 45, "changed": [...], "deleted": ["7"]}'
     """
-    with sqlite3.connect("recruitment.db") as conn:
-        cursor = conn.cursor()
-        if candidate_id:
-            cursor.execute("SELECT * FROM candidates WHERE id = ?", (candidate_id,))
-        else:
-            cursor.execute("SELECT * FROM candidates ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        cols = [col[0] for col in cursor.description]
-
-    def row_to_dict(row: Tuple) -> Dict[str, Any]:
-        rec = dict(zip(cols, row))
-        for key in (
-            "technical_skills",
-            "certifications",
-            "previous_companies",
-            "key_achievements",
-            "languages",
-            "industry_experience",
-        ):
-            if key in rec and isinstance(rec[key], str):
-                try:
-                    rec[key] = json.loads(rec[key])
-                except json.JSONDecodeError:
-                    pass
-        return rec
-
-    results = [row_to_dict(r) for r in rows]
-    if candidate_id:
-        return json.dumps(results[0] if results else {}, ensure_ascii=False, indent=2)
-    return json.dumps(results, ensure_ascii=False, indent=2)
+    return _core().get_info_candidate(candidate_id, since, max_tokens, offset)
 
 
 @tool
-def get_info_bando(bando_id: Optional[str] = None) -> str:
+@profiled
+def get_info_bando(
+    bando_id: Optional[str] = None,
+    since: Optional[int] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+) -> str:
     """
     Retrieve Bando di Gara project(s) from the database.
 
+    Large results are shaped to fit ``max_tokens`` the same way as
+    ``get_info_candidate`` (truncation, dropped fields, pagination).
+
     Args:
         bando_id: Optional tender ID. If provided, returns only that project;
                  otherwise returns all projects
+        since: Optional change sequence from a previous call. If provided, returns
+               only projects changed after it (use 0 for a first full read)
+        max_tokens: Approximate response budget in LLM tokens (0 = no limit)
+        offset: Index of the first project to return when paginating
 
     Returns:
-        str: JSON-encoded tender data (single object or list)
+        str: JSON-encoded tender data (single object or list), or with ``since``
+             an object with ``changed``, ``deleted`` and the new ``high_water_mark``
 
     Example:
         >>> get_info_bando("2")
         '{"id": "2", "client_name": "Acme Corp", ...}'
     """
-    with sqlite3.connect("recruitment.db") as conn:
-        cursor = conn.cursor()
-        if bando_id:
-            cursor.execute("SELECT * FROM bando_di_gara WHERE id = ?", (bando_id,))
-        else:
-            cursor.execute("SELECT * FROM bando_di_gara ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        cols = [col[0] for col in cursor.description]
-
-    def row_to_dict(row: Tuple) -> Dict[str, Any]:
-        rec = dict(zip(cols, row))
-        for key in (
-            "required_skills",
-            "certifications_required",
-            "key_deliverables",
-        ):
-            if key in rec and isinstance(rec[key], str):
-                try:
-                    rec[key] = json.loads(rec[key])
-                except json.JSONDecodeError:
-                    pass
-        return rec
-
-    results = [row_to_dict(r) for r in rows]
-    if bando_id:
-        return json.dumps(results[0] if results else {}, ensure_ascii=False, indent=2)
-    return json.dumps(results, ensure_ascii=False, indent=2)
+    return _core().get_info_bando(bando_id, since, max_tokens, offset)
@@ -0,0 +1,48 @@
+"""
+Document Ingest Fast Path for AI Recruitment Suite.
+
+watsonx Orchestrate ``@tool`` adapters; the implementation is in ``tools.core.document_ingest``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+from typing import Optional
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+from tools.core.profiling import profiled
+
+
+def _core():
+    from tools.core import document_ingest
+    from tools.core.schema import init_schema
+
+    init_schema()
+    return document_ingest
+
+
+@tool
+@profiled
+def classify_and_save_document(extracted_data: str, source_filename: Optional[str] = None) -> str:
+    """
+    Classify an extracted document, validate it and save it in one step.
+
+    Use this right after document_info_extractor returns its JSON: it decides
+    between CV and Bando di Gara without another reasoning step, checks the
+    fields against the expected schema and stores the record.
+
+    Args:
+        extracted_data: JSON string returned by the document extractor
+        source_filename: Optional name of the uploaded file (improves classification)
+
+    Returns:
+        str: Confirmation with the detected type and new ID, or the validation
+             errors to fix before retrying
+
+    Example:
+        >>> classify_and_save_document('{"document_type": "CV", "candidate_name": "Mario Rossi"}')
+        '✅ Classified as CV (confidence 1.0) and saved with ID: CAND_1A2B3C4D'
+    """
+    return _core().classify_and_save_document(extracted_data, source_filename)
@@ -0,0 +1,106 @@
+"""
+Evaluation Work Queue Tools for AI Recruitment Suite.
+
+watsonx Orchestrate ``@tool`` adapters; the implementation is in ``tools.core.evaluation_queue``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+from tools.core.profiling import profiled
+
+
+def _core():
+    from tools.core import evaluation_queue
+    from tools.core.schema import init_schema
+
+    init_schema()
+    return evaluation_queue
+
+
+@tool
+@profiled
+def enqueue_bando_evaluations(
+    bando_id: str, min_coverage: float = 0.0, reevaluate: bool = False
+) -> str:
+    """
+    Queue one evaluation job per candidate for an open Bando di Gara.
+
+    Jobs are ordered by the bando deadline (soonest first) and then by how many of
+    the bando's requirements the candidate meets, so evaluators working the queue
+    with claim_evaluation_jobs handle the most urgent, most promising pairs first.
+    Pairs that are already queued or already evaluated are skipped.
+
+    Args:
+        bando_id: The ID of the Bando di Gara
+        min_coverage: Skip candidates meeting less than this share (0-1) of the
+                      required skills and certifications
+        reevaluate: Also queue candidates that already have an evaluation for this bando
+
+    Returns:
+        str: Confirmation with the number of jobs queued and skipped
+
+    Example:
+        >>> enqueue_bando_evaluations("2", min_coverage=0.25)
+        '✅ Queued 14 evaluation job(s) for Bando 2 (deadline 2025-03-31); skipped 0
+         already queued, 3 already evaluated, 6 below 25% coverage. Open jobs: 14'
+    """
+    return _core().enqueue_bando_evaluations(bando_id, min_coverage, reevaluate)
+
+
+@tool
+@profiled
+def claim_evaluation_jobs(worker_id: str, limit: int = 1, lease_seconds: int = 600) -> str:
+    """
+    Claim the most urgent queued evaluation jobs.
+
+    Claimed jobs are hidden from other evaluators for ``lease_seconds``; a job not
+    completed in time is handed out again. Evaluate each claimed pair (e.g. with
+    get_comparison_data) and save it with complete_evaluation_job.
+
+    Args:
+        worker_id: A name for this evaluator session (e.g. "evaluator-1")
+        limit: Maximum number of jobs to claim
+        lease_seconds: Seconds available to complete the jobs
+
+    Returns:
+        str: JSON object with the claimed jobs (job_id, lease_token, candidate_id,
+             bando_id, deadline, prerank) and the number of open jobs
+
+    Example:
+        >>> claim_evaluation_jobs("evaluator-1", 2)
+        '{"worker_id": "evaluator-1", "jobs": [{"job_id": 12, "lease_token": "9f2c...",
+          "candidate_id": "7", "bando_id": "2", "deadline": "2025-03-31", ...}], ...}'
+    """
+    return _core().claim_evaluation_jobs(worker_id, limit, lease_seconds)
+
+
+@tool
+@profiled
+def complete_evaluation_job(
+    job_id: int, lease_token: str, match_score: int, evaluation_summary: str
+) -> str:
+    """
+    Save the evaluation of a claimed job and mark the job done.
+
+    Use this instead of save_evaluation_result for jobs from claim_evaluation_jobs.
+    The evaluation is only saved while the lease is still held, so a pair is never
+    evaluated twice.
+
+    Args:
+        job_id: ID of the claimed job
+        lease_token: The lease_token returned with the job by claim_evaluation_jobs
+        match_score: Numerical score (0-100) representing the candidate's fit
+        evaluation_summary: Brief text summary justifying the score
+
+    Returns:
+        str: Confirmation with the new evaluation ID, or why the job was not completed
+
+    Example:
+        >>> complete_evaluation_job(12, "9f2c...", 85, "Strong Python and cloud skills.")
+        '✅ Evaluation job 12 completed (candidate 7, bando 2). Assigned Evaluation ID: 31'
+    """
+    return _core().complete_evaluation_job(job_id, lease_token, match_score, evaluation_summary)
@@ -0,0 +1,57 @@
+"""
+Experience Normalization Tools for AI Recruitment Suite.
+
+watsonx Orchestrate ``@tool`` adapters; the implementation is in ``tools.core.experience``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+from typing import Optional
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+from tools.core.profiling import profiled
+from tools.core.response_budget import DEFAULT_MAX_TOKENS
+
+
+def _core():
+    from tools.core import experience
+    from tools.core.schema import init_schema
+
+    init_schema()
+    return experience
+
+
+@tool
+@profiled
+def filter_candidates_by_experience(
+    min_years: Optional[float] = None,
+    max_years: Optional[float] = None,
+    bando_id: Optional[str] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    offset: int = 0,
+) -> str:
+    """
+    Find candidates by years of experience without reading every profile.
+
+    Args:
+        min_years: Optional minimum years of experience (e.g. 7 for "at least 7 years")
+        max_years: Optional maximum years of experience
+        bando_id: Optional Bando di Gara ID; its required experience is used as
+                  the minimum when min_years is not given
+        max_tokens: Approximate response budget in LLM tokens; longer results are
+                    paginated (0 = no limit)
+        offset: Index of the first candidate to return when paginating
+
+    Returns:
+        str: JSON list of matching candidates with their parsed experience range
+
+    Example:
+        >>> filter_candidates_by_experience(min_years=7)
+        '[{"id": "3", "candidate_name": "Maria Rossi", "experience_years": "10 anni", ...}]'
+    """
+    return _core().filter_candidates_by_experience(
+        min_years, max_years, bando_id, max_tokens, offset
+    )
@@ -0,0 +1,58 @@
+"""
+Faceted Candidate Filtering Tools for AI Recruitment Suite.
+
+watsonx Orchestrate ``@tool`` adapters; the implementation is in ``tools.core.facet_index``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+from typing import Optional
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+from tools.core.profiling import profiled
+
+
+def _core():
+    from tools.core import facet_index
+    from tools.core.schema import init_schema
+
+    init_schema()
+    return facet_index
+
+
+@tool
+@profiled
+def filter_candidates(
+    locations: Optional[str] = None,
+    languages: Optional[str] = None,
+    certifications: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> str:
+    """
+    Filter candidates by location, spoken languages and certifications.
+
+    Comma-separated values within one filter are alternatives (OR); different
+    filters must all match (AND). Candidates are listed newest first; when
+    ``next_offset`` is not null, call again with ``offset=next_offset`` for the next
+    page. The response includes, for each facet, how many of the matching
+    candidates have each value, to help refine the search.
+
+    Args:
+        locations: Optional comma-separated locations (e.g. "Milano, Remote")
+        languages: Optional comma-separated languages (e.g. "English")
+        certifications: Optional comma-separated certifications (e.g. "AWS")
+        limit: Maximum number of candidates listed in the response (default 50)
+        offset: Index of the first matching candidate to list when paginating
+
+    Returns:
+        str: JSON object with the total, the matching candidates and facet counts
+
+    Example:
+        >>> filter_candidates(locations="Milan, Remote", languages="English", certifications="AWS")
+        '{"total": 4, "candidates": [{"id": "3", ...}], "facet_counts": {...}}'
+    """
+    return _core().filter_candidates(locations, languages, certifications, limit, offset)
@@ -0,0 +1,53 @@
+"""
+Skill-Gap Matrix Tools for AI Recruitment Suite.
+
+watsonx Orchestrate ``@tool`` adapters; the implementation is in ``tools.core.skill_gaps``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+from typing import Optional
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+from tools.core.profiling import profiled
+
+
+def _core():
+    from tools.core import skill_gaps
+    from tools.core.schema import init_schema
+
+    init_schema()
+    return skill_gaps
+
+
+@tool
+@profiled
+def get_skill_gaps(bando_id: str, candidate_ids: Optional[str] = None, top_k: int = 10) -> str:
+    """
+    Get the precomputed skill-gap breakdown of candidates for a Bando di Gara.
+
+    Use this instead of working out "required vs. available skills" from the raw
+    records: for each candidate it lists the matched skills, missing skills and
+    missing certifications (canonical names, e.g. "K8s" is "Kubernetes") and the
+    share of requirements met. Requirements the skill dictionary does not know are
+    listed under ``unrecognized_requirements`` and must be checked by hand.
+
+    Args:
+        bando_id: The ID of the Bando di Gara
+        candidate_ids: Optional candidate IDs (comma-separated or JSON array); by
+                       default the ``top_k`` candidates with the best coverage
+        top_k: Maximum number of candidates returned without ``candidate_ids``
+
+    Returns:
+        str: JSON object with the bando's requirements and one gap entry per candidate
+
+    Example:
+        >>> get_skill_gaps("2", "7,9")
+        '{"bando_id": "2", ..., "candidates": [{"candidate_id": "7", "coverage": 0.75,
+          "matched_skills": ["Python", "Kubernetes", "AWS"], "missing_skills": [],
+          "missing_certifications": ["Certified Kubernetes Administrator"]}, ...]}'
+    """
+    return _core().get_skill_gaps(bando_id, candidate_ids, top_k)
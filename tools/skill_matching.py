@@ -0,0 +1,49 @@
+"""
+Semantic Skill Matching Tools for AI Recruitment Suite.
+
+watsonx Orchestrate ``@tool`` adapters; the implementation is in ``tools.core.skill_matching``.
+
+Author: Ruslan Magana Vsevolodovna
+Website: ruslanmv.com
+License: Apache 2.0
+"""
+
+from typing import Optional
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+from tools.core.profiling import profiled
+
+
+def _core():
+    from tools.core import skill_matching
+    from tools.core.schema import init_schema
+
+    init_schema()
+    return skill_matching
+
+
+@tool
+@profiled
+def find_matching_candidates(
+    bando_id: str, top_k: int = 10, min_years: Optional[float] = None
+) -> str:
+    """
+    Find the candidates whose skills best match a Bando di Gara, without using the LLM.
+
+    Skills are compared semantically (e.g. "K8s" matches "Kubernetes") using local
+    embeddings, so this is a fast pre-selection before a detailed comparison.
+
+    Args:
+        bando_id: The ID of the Bando di Gara to match candidates against
+        top_k: Maximum number of candidates to return (default 10)
+        min_years: Optional minimum years of experience a candidate must have
+
+    Returns:
+        str: JSON object with the ranked candidates and their similarity scores
+
+    Example:
+        >>> find_matching_candidates("2", top_k=3)
+        '{"bando_id": "2", "matches": [{"candidate_id": "7", "similarity": 0.82, ...}]}'
+    """
+    return _core().find_matching_candidates(bando_id, top_k, min_years)